@@ -0,0 +1,371 @@
+"""
+Benchmarks dos caminhos críticos de CPU e memória do pysesuite.
+
+Nenhuma chamada de rede é feita: são medidos a renderização dos envelopes, a
+serialização dos atributos, a codificação dos anexos e a análise das
+respostas.
+
+Utilize::
+
+    python benchmarks/bench.py --output resultados.json
+    python benchmarks/bench.py --compare antes.json depois.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from pysesuite import parsing, render
+from pysesuite.attributes import (
+    Entity,
+    EntityList,
+    Relationship,
+    RelationshipTable,
+    TableField,
+)
+from pysesuite.components import Components
+from pysesuite.files import base_64
+from pysesuite.parsing import Response, backends, get_dict
+from pysesuite.parsing.xml_parser import Xml
+
+Benchmark = tuple[str, dict[str, Any], Callable[[], object]]
+
+ACTIONS: dict[str, dict[str, Any]] = {
+    "actions/cancel_workflow.xml": {
+        "workflow_id": "WF0001",
+        "explanation": "Cancelado pelo benchmark",
+        "user_id": "usuario",
+    },
+    "actions/execute_activity.xml": {
+        "workflow_id": "WF0001",
+        "activity_id": "ATV01",
+        "action_sequence": 1,
+    },
+    "actions/execute_system_activity.xml": {
+        "workflow_id": "WF0001",
+        "activity_id": "ATV01",
+        "activity_order": "1",
+    },
+    "actions/get_table_record.xml": {
+        "table_id": "tabela",
+        "pagination": 1,
+        "table_field_list": [TableField(f"campo{i}", str(i)) for i in range(5)],
+    },
+    "actions/new_attachment.xml": {
+        "workflow_id": "WF0001",
+        "activity_id": "ATV01",
+        "file_path": "arquivo.pdf",
+        "content": "'" + "A" * 1024 + "'",
+        "user_id": "usuario",
+    },
+    "actions/new_child_entity_record.xml": {
+        "workflow_id": "WF0001",
+        "entity_id": "entidade",
+        "entity_attribute": [Entity(f"campo{i}", str(i)) for i in range(10)],
+        "relationship_id": "grid",
+        "relationship_attribute": [
+            Relationship("grid", f"campo{i}", str(i)) for i in range(10)
+        ],
+    },
+    "actions/new_workflow_edit_data.xml": {
+        "process_id": "PROC",
+        "workflow_title": "Benchmark",
+        "user_id": "usuario",
+        "entity_id": "entidade",
+        "entity_list": [Entity(f"campo{i}", str(i)) for i in range(10)],
+        "relationship_list": [
+            Relationship("rel", f"campo{i}", str(i)) for i in range(10)
+        ],
+    },
+}
+
+ATTRIBUTE_COUNTS = (10, 100, 1_000, 10_000)
+FILE_SIZES = (1_000, 100_000, 10_000_000, 100_000_000, 500_000_000)
+RESPONSE_RECORDS = (1, 100, 1_000, 10_000)
+
+
+def render_benchmarks() -> Iterator[Benchmark]:
+    for template, kwargs in ACTIONS.items():
+        yield (
+            "render",
+            {"template": template},
+            lambda t=template, k=kwargs: render.render(t, **k),
+        )
+
+
+def attribute_benchmarks() -> Iterator[Benchmark]:
+    for count in ATTRIBUTE_COUNTS:
+        entities = [Entity(f"campo{i}", f"valor {i}") for i in range(count)]
+        relationships = [
+            Relationship("rel", f"campo{i}", f"valor {i}") for i in range(count)
+        ]
+        fields = [TableField(f"campo{i}", f"valor {i}") for i in range(count)]
+
+        for kind, attributes in (
+            ("Entity", entities),
+            ("Relationship", relationships),
+            ("TableField", fields),
+        ):
+            yield (
+                "attributes.str",
+                {"type": kind, "count": count},
+                lambda a=attributes: [str(attribute) for attribute in a],
+            )
+
+        yield (
+            "attributes.envelope",
+            {"count": count},
+            lambda e=entities, r=relationships: render.render(
+                "actions/new_workflow_edit_data.xml",
+                process_id="PROC",
+                workflow_title="Benchmark",
+                entity_list=e,
+                relationship_list=r,
+            ),
+        )
+
+        values = {f"campo{i}": f"valor {i}" for i in range(count)}
+        yield (
+            "attributes.bulk",
+            {"count": count},
+            lambda v=values: render.render(
+                "actions/new_workflow_edit_data.xml",
+                process_id="PROC",
+                workflow_title="Benchmark",
+                entity_list=EntityList.from_dict(v),
+                relationship_list=RelationshipTable.from_dict("rel", v),
+            ),
+        )
+
+
+def file_benchmarks(folder: Path, max_size: int) -> Iterator[Benchmark]:
+    for size in FILE_SIZES:
+        if size > max_size:
+            continue
+
+        path = folder / f"{size}.bin"
+        with path.open("wb") as f:
+            for start in range(0, size, 1 << 20):
+                f.write(os.urandom(min(1 << 20, size - start)))
+
+        yield ("files.base_64", {"bytes": size}, lambda p=path: base_64(p))
+
+
+def synthetic_response(records: int) -> str:
+    # Os campos de cada registro ficam no seu elemento Record, como nas
+    # respostas do getTableRecord, já que o Response agrupa os registros pelo
+    # mesmo.
+    rows = "".join(
+        "<f:Record><f:TableFieldList>"
+        + "".join(
+            "<f:TableField>"
+            f"<f:TableFieldID>campo{column}</f:TableFieldID>"
+            f"<f:TableFieldValues>valor {row}.{column}</f:TableFieldValues>"
+            "</f:TableField>"
+            for column in range(8)
+        )
+        + "</f:TableFieldList></f:Record>"
+        for row in range(records)
+    )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<e:Envelope xmlns:e="http://schemas.xmlsoap.org/soap/envelope/"'
+        ' xmlns:w="urn:workflow" xmlns:f="urn:form"><e:Body>'
+        "<w:getTableRecordResponse><w:Status>SUCCESS</w:Status>"
+        f"<w:Detail>ok</w:Detail><f:RecordList>{rows}</f:RecordList>"
+        "</w:getTableRecordResponse></e:Body></e:Envelope>"
+    )
+
+
+def parser_backends() -> Iterator[str]:
+    for name in backends.BACKENDS:
+        try:
+            parsing.configure(backend=name)
+        except ImportError:
+            print(f"{name} não instalado, ignorado", file=sys.stderr)
+            continue
+        yield name
+
+    parsing.configure()
+
+
+def parsing_benchmarks() -> Iterator[Benchmark]:
+    # Cada implementação fica configurada enquanto as suas medições são feitas,
+    # já que o gerador só continua depois das mesmas.
+    for backend in parser_backends():
+        for records in RESPONSE_RECORDS:
+            data = synthetic_response(records)
+            params = {
+                "backend": backend,
+                "records": records,
+                "bytes": len(data),
+            }
+
+            yield (
+                "xml.find_one",
+                params,
+                lambda d=data: Xml(d, "workflow").find_one("Status"),
+            )
+            yield (
+                "xml.find_many",
+                params,
+                lambda d=data: Xml(d, "form").find_many("TableFieldValues"),
+            )
+            yield (
+                "parsing.get_dict",
+                params,
+                lambda d=data: get_dict(
+                    d, Components.Form, "TableFieldID", "TableFieldValues"
+                ),
+            )
+            yield (
+                "parsing.Response",
+                params,
+                lambda d=data: Response(d).find_table(
+                    Components.Form, "TableFieldID", "TableFieldValues"
+                ),
+            )
+            encoded = data.encode("utf-8")
+            yield (
+                "parsing.stream",
+                params,
+                lambda d=encoded: Response.from_chunks(
+                    d[i : i + 65536] for i in range(0, len(d), 65536)
+                ).find_table(
+                    Components.Form, "TableFieldID", "TableFieldValues"
+                ),
+            )
+
+
+def measure(function: Callable[[], object], repeat: int) -> dict[str, Any]:
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "iterations": number,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "peak_bytes": peak,
+    }
+
+
+def commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(suites: list[str], repeat: int, max_file_size: int) -> dict[str, Any]:
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        available: dict[str, Callable[[], Iterator[Benchmark]]] = {
+            "render": render_benchmarks,
+            "attributes": attribute_benchmarks,
+            "files": lambda: file_benchmarks(Path(folder), max_file_size),
+            "parsing": parsing_benchmarks,
+        }
+        for suite in suites:
+            for name, params, function in available[suite]():
+                result = {"name": name, "params": params}
+                result.update(measure(function, repeat))
+                results.append(result)
+                print(
+                    f"{name:<22} {json.dumps(params):<60} "
+                    f"{result['median'] * 1e3:>10.3f} ms "
+                    f"{result['peak_bytes'] / 1e6:>10.2f} MB",
+                    file=sys.stderr,
+                )
+
+    return {
+        "meta": {
+            "commit": commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(before: Path, after: Path) -> None:
+    def index(path: Path) -> dict[str, dict[str, Any]]:
+        data = json.loads(path.read_text())
+        return {
+            f"{r['name']} {json.dumps(r['params'], sort_keys=True)}": r
+            for r in data["results"]
+        }
+
+    old, new = index(before), index(after)
+    print(f"{'benchmark':<80} {'tempo':>8} {'memória':>8}")
+    for key in old.keys() & new.keys():
+        time_ratio = new[key]["median"] / old[key]["median"]
+        memory_ratio = new[key]["peak_bytes"] / max(old[key]["peak_bytes"], 1)
+        print(f"{key:<80} {time_ratio:>7.2f}x {memory_ratio:>7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--suite",
+        action="append",
+        choices=["render", "attributes", "files", "parsing"],
+        help="suites a serem executadas, por padrão todas",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--max-file-size",
+        type=int,
+        default=max(FILE_SIZES),
+        help="maior arquivo utilizado pela suite files, em bytes",
+    )
+    parser.add_argument("--output", type=Path, help="arquivo JSON de saída")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        type=Path,
+        metavar=("ANTES", "DEPOIS"),
+        help="compara dois resultados salvos",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    suites = args.suite or ["render", "attributes", "files", "parsing"]
+    results = json.dumps(run(suites, args.repeat, args.max_file_size), indent=2)
+
+    if args.output:
+        args.output.write_text(results)
+    else:
+        print(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark do tempo de importação do pysesuite.
+
+Cada medição é feita em um novo processo, como em um job de curta duração. A
+saída é diferente de zero se o ``import pysesuite`` ultrapassar o orçamento ou
+importar dependências pesadas, que só devem ser carregadas no primeiro uso.
+
+Utilize::
+
+    python benchmarks/import_time.py --budget 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+STATEMENTS = {
+    "import": "import pysesuite",
+    "client": "from pysesuite import Sesuite, Entity",
+    "render": (
+        "from pysesuite import operations\n"
+        "operations.execute_activity(workflow_id='WF', activity_id='ATV', "
+        "action_sequence=1)"
+    ),
+}
+
+# Não devem ser importadas pelo ``import pysesuite``.
+HEAVY_MODULES = (
+    "aiohttp",
+    "jinja2",
+    "requests",
+    "typing_extensions",
+    "urllib3",
+)
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def measure(statement: str, repeat: int) -> dict[str, Any]:
+    source = Path(__file__).parents[1] / "src"
+    script = SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)
+
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(source)},
+        ).stdout.split(" ")
+        times.append(float(output[0]))
+        heavy = [m for m in output[1].strip().split(",") if m]
+
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "heavy_modules": heavy,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=50,
+        help="tempo máximo do import pysesuite, em milissegundos",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for name, statement in STATEMENTS.items():
+        results[name] = measure(statement, args.repeat)
+        print(
+            f"{name:<10} {results[name]['median'] * 1e3:>8.2f} ms "
+            f"{', '.join(results[name]['heavy_modules'])}",
+            file=sys.stderr,
+        )
+    print(json.dumps(results, indent=2))
+
+    imported = results["import"]
+    if imported["median"] * 1e3 > args.budget or imported["heavy_modules"]:
+        sys.exit(
+            f"import pysesuite levou {imported['median'] * 1e3:.2f} ms "
+            f"(orçamento de {args.budget} ms), dependências pesadas "
+            f"importadas: {imported['heavy_modules']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,75 @@
 """Utilize o Se Suite com o python!"""
 
-from .sesuite import Entity as Entity
-from .sesuite import Relationship as Relationship
-from .sesuite import Sesuite as Sesuite
-from .sesuite import TableField as TableField
+from __future__ import annotations
 
-__all__ = ["Entity", "Relationship", "Sesuite", "TableField"]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_sesuite import AsyncSesuite as AsyncSesuite
+    from .attributes import ChildRecord as ChildRecord
+    from .attributes import Entity as Entity
+    from .attributes import EntityList as EntityList
+    from .attributes import Relationship as Relationship
+    from .attributes import RelationshipTable as RelationshipTable
+    from .attributes import TableField as TableField
+    from .balancer import Balancer as Balancer
+    from .cache import ResponseCache as ResponseCache
+    from .limiter import ConcurrencyLimiter as ConcurrencyLimiter
+    from .offload import Offload as Offload
+    from .sesuite import Sesuite as Sesuite
+    from .spool import Spool as Spool
+    from .transport import Transport as Transport
+
+__all__ = [
+    "AsyncSesuite",
+    "Balancer",
+    "ChildRecord",
+    "ConcurrencyLimiter",
+    "Entity",
+    "EntityList",
+    "Offload",
+    "Relationship",
+    "RelationshipTable",
+    "ResponseCache",
+    "Sesuite",
+    "Spool",
+    "TableField",
+    "Transport",
+]
 __version__ = "4.0.3"
+
+# Os módulos só são importados no primeiro acesso, mantendo o
+# ``import pysesuite`` rápido. O ``AsyncSesuite`` depende do ``aiohttp``, que é
+# opcional.
+_EXPORTS = {
+    "AsyncSesuite": ".async_sesuite",
+    "Balancer": ".balancer",
+    "ChildRecord": ".attributes",
+    "ConcurrencyLimiter": ".limiter",
+    "Entity": ".attributes",
+    "EntityList": ".attributes",
+    "Offload": ".offload",
+    "Relationship": ".attributes",
+    "RelationshipTable": ".attributes",
+    "ResponseCache": ".cache",
+    "Sesuite": ".sesuite",
+    "Spool": ".spool",
+    "TableField": ".attributes",
+    "Transport": ".transport",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    error = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
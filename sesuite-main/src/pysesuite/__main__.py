@@ -0,0 +1,166 @@
+"""
+Linha de comando do pysesuite.
+
+Utilize::
+
+    python -m pysesuite ingest pedidos.csv --process-id PEDIDO \\
+        --title "Pedido {numero}" --key-column numero --journal pedidos.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from .ingest import ColumnMapping, Journal, ingest, read_rows
+from .sesuite import Sesuite
+from .transport import Transport
+
+
+def _entity(value: str) -> tuple[str, str]:
+    column, _, field_id = value.partition("=")
+    return column, field_id or column
+
+
+def _relationship(value: str) -> tuple[str, tuple[str, str]]:
+    column, _, target = value.partition("=")
+    relationship_id, _, field_id = target.partition(".")
+    if not column or not relationship_id or not field_id:
+        error = f"utilize COLUNA=REL.CAMPO, e não {value!r}"
+        raise argparse.ArgumentTypeError(error)
+    return column, (relationship_id, field_id)
+
+
+def _positive(value: str) -> int:
+    number = int(value) if value.lstrip("-").isdigit() else 0
+    if number < 1:
+        error = f"utilize um número inteiro maior que zero, e não {value!r}"
+        raise argparse.ArgumentTypeError(error)
+    return number
+
+
+def _ingest(args: argparse.Namespace) -> None:
+    mapping = ColumnMapping(
+        process_id=args.process_id,
+        workflow_title=args.title,
+        entity_id=args.entity_id,
+        entities=dict(args.entity) if args.entity else None,
+        relationships=dict(args.relationship),
+        user_id_column=args.user_id_column,
+        key_column=args.key_column,
+    )
+    journal_path = args.journal or args.input.with_suffix(".journal.jsonl")
+    transport = Transport(
+        pool_maxsize=max(args.workers, 10),
+        base_url=args.url,
+        compact=args.compact,
+    )
+
+    start = time.perf_counter()
+    processed = 0
+
+    def progress(key: str, result: object) -> None:
+        nonlocal processed
+        processed += 1
+        if isinstance(result, Exception):
+            print(f"{key}: {result}", file=sys.stderr)
+        if processed % args.progress == 0:
+            rate = processed / (time.perf_counter() - start)
+            print(f"{processed} linhas, {rate:.1f}/s", file=sys.stderr)
+
+    with (
+        Journal(journal_path) as journal,
+        Sesuite(args.auth, transport=transport) as sesuite,
+    ):
+        report = ingest(
+            sesuite,
+            read_rows(args.input, args.format),
+            mapping,
+            journal,
+            max_workers=args.workers,
+            on_result=progress,
+        )
+
+    print(json.dumps(report._asdict()))
+    if report.failed:
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m pysesuite")
+    commands = parser.add_subparsers(required=True)
+
+    command = commands.add_parser(
+        "ingest",
+        help="cria uma instância para cada linha de um arquivo CSV ou JSONL",
+    )
+    command.add_argument("input", type=Path)
+    command.add_argument("--format", choices=["csv", "jsonl"])
+    command.add_argument("--process-id", required=True)
+    command.add_argument(
+        "--title",
+        required=True,
+        help='título das instâncias, como "Pedido {numero}"',
+    )
+    command.add_argument("--entity-id", default="")
+    command.add_argument(
+        "--entity",
+        action="append",
+        type=_entity,
+        metavar="COLUNA[=CAMPO]",
+        help="coluna enviada como campo do formulário, por padrão todas",
+    )
+    command.add_argument(
+        "--relationship",
+        action="append",
+        default=[],
+        type=_relationship,
+        metavar="COLUNA=REL.CAMPO",
+        help="coluna enviada como campo de um relacionamento",
+    )
+    command.add_argument("--user-id-column")
+    command.add_argument(
+        "--key-column",
+        help="coluna que identifica a linha, por padrão a posição da mesma",
+    )
+    command.add_argument(
+        "--journal",
+        type=Path,
+        help="diário das linhas enviadas, por padrão INPUT.journal.jsonl",
+    )
+    command.add_argument("--workers", type=_positive, default=8)
+    command.add_argument(
+        "--progress",
+        type=_positive,
+        default=1000,
+        help="informa o andamento a cada N linhas",
+    )
+    command.add_argument(
+        "--auth",
+        default=os.environ.get("SESUITE_AUTH"),
+        help="token de autorização, por padrão a variável SESUITE_AUTH",
+    )
+    command.add_argument("--url", help="endereço base do Web Service")
+    command.add_argument(
+        "--compact",
+        action="store_true",
+        help="envia os envelopes no formato compacto",
+    )
+    command.set_defaults(handler=_ingest)
+
+    args = parser.parse_args()
+    if args.auth is None:
+        parser.error("informe o token com --auth ou SESUITE_AUTH")
+
+    try:
+        args.handler(args)
+    except KeyboardInterrupt:
+        sys.exit("Interrompido, execute novamente para continuar.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+Uma interface assíncrona que permite a integração com o Sesuite.
+
+Necessita da dependência opcional ``aiohttp``, instalada com
+``pip install pysesuite[async]``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from . import operations
+from .balancer import is_failure
+from .components import Components
+from .exceptions import SessionError, WorkflowError
+from .parsing import Response, ResponseParser
+from .transport import Transport
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+    from typing import ParamSpec
+
+    from typing_extensions import Self
+
+    from .attributes import Entity, Relationship, TableField
+    from .balancer import Balancer
+    from .limiter import ConcurrencyLimiter
+    from .operations import Operation, T
+    from .results import TableRecord, WorkflowRecord
+
+    P = ParamSpec("P")
+
+
+@dataclass(slots=True, repr=False)
+class AsyncSesuite:
+    """
+    Interface assíncrona para a integração com o sesuite.
+
+    Possui os mesmos métodos de :class:`Sesuite`, como corrotinas.
+
+    Attributes
+    ----------
+    max_concurrency : int, by default 100
+        Quantidade máxima de chamadas simultâneas ao Web Service.
+    connection_limit : int, by default 100
+        Quantidade máxima de conexões abertas com o Web Service.
+    transport : Transport
+        Configuração das conexões HTTP com o Web Service, as opções do pool de
+        conexões do ``requests`` são substituídas por ``connection_limit``.
+    balancer : Balancer, optional
+        Distribui as chamadas entre vários endereços e tokens, no lugar do
+        endereço do ``transport`` e do token do cliente.
+    limiter : ConcurrencyLimiter, optional
+        Limita as chamadas simultâneas a cada componente, ajustando o limite
+        pela latência e pelas falhas do gateway, abaixo de
+        ``max_concurrency``.
+
+    """
+
+    _auth: str
+    max_concurrency: int = 100
+    connection_limit: int = 100
+    transport: Transport = field(default_factory=Transport)
+    balancer: Balancer | None = field(default=None)
+    limiter: ConcurrencyLimiter | None = field(default=None)
+    _session: aiohttp.ClientSession | None = field(default=None)
+    _semaphore: asyncio.Semaphore | None = field(default=None)
+
+    async def __aenter__(self) -> Self:
+        verify = self.transport.verify
+        if isinstance(verify, str):
+            verify = ssl.create_default_context(cafile=verify)
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.connection_limit, ssl=verify
+            ),
+            timeout=aiohttp.ClientTimeout(
+                connect=self.transport.connect_timeout,
+                sock_read=self.transport.read_timeout,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        if self.transport.prewarm:
+            await self._warm()
+
+        return self
+
+    async def __aexit__(
+        self,
+        _type: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session:
+            await self._session.close()
+
+    async def _warm(self) -> None:
+        """Abre as conexões com todos os componentes."""
+        if not self._session:
+            return
+
+        urls = [self.transport.url(component) for component in Components]
+        if self.balancer is not None:
+            urls = self.balancer.urls(self.transport)
+
+        for url in urls:
+            try:
+                async with self._session.head(url):
+                    pass
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                continue
+
+    async def _call_api(self, operation: Operation[T]) -> Response:
+        """
+        Chama a Web Service do Sesuite com os parâmetros necessários.
+
+        Parameters
+        ----------
+        operation : Operation
+            Operação que será enviada ao Web Service.
+
+        Returns
+        -------
+        Response
+            Resposta da API, já analisada.
+
+        Raises
+        ------
+        WorkflowError
+            Se ocorre um erro com a requisição.
+        SessionError
+            Se não foi iniciado a sessão http.
+
+        """
+        if not self._session or not self._semaphore:
+            error = "Não foi iniciado a sessão HTTP"
+            raise SessionError(error)
+
+        body, headers = self.transport.encode(operation.body)
+
+        async with self._semaphore:
+            limiter = self.limiter
+            if limiter is not None:
+                await limiter.acquire_async(operation.component)
+
+            url, auth = self.transport.url(operation.component), self._auth
+            balancer = self.balancer
+            target = None if balancer is None else balancer.acquire()
+            if target is not None:
+                url = target.url(operation.component, self.transport)
+                auth = target.auth or auth
+
+            # Sem resposta, a chamada falhou por um erro de conexão.
+            failed = True
+            start = time.perf_counter()
+            try:
+                async with self._session.post(
+                    url,
+                    data=body,
+                    headers={**operation.headers(auth), **headers},
+                ) as response:
+                    failed = is_failure(response.status)
+                    if response.status == 200 and self.transport.stream:
+                        parser = ResponseParser()
+                        async for chunk in response.content.iter_chunked(
+                            self.transport.stream_chunk_size
+                        ):
+                            parser.feed(chunk)
+                        return parser.close()
+
+                    content = await response.read()
+            finally:
+                latency = time.perf_counter() - start
+                if balancer is not None and target is not None:
+                    balancer.release(target, latency, failed=failed)
+                if limiter is not None:
+                    limiter.release(operation.component, latency, failed=failed)
+
+        if response.status != 200:
+            data = content.decode("utf-8")
+            error = f"Ocorreu um erro com a requisição: {data}"
+            raise WorkflowError(error)
+
+        return Response(content)
+
+    async def _execute(
+        self,
+        build: Callable[P, Operation[T]],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """
+        Monta a operação, envia a mesma e interpreta a resposta da API.
+
+        Parameters
+        ----------
+        build : Callable
+            Função que monta a operação.
+        *args, **kwargs
+            Argumentos passados para ``build``.
+
+        Returns
+        -------
+        T
+            O resultado da operação.
+
+        """
+        operation = build(*args, compact=self.transport.compact, **kwargs)
+
+        return operation.parse(await self._call_api(operation))
+
+    async def execute_activity(
+        self, *, workflow_id: str, activity_id: str, action_sequence: int
+    ) -> str | None:
+        """Versão assíncrona de :meth:`Sesuite.execute_activity`."""
+        return await self._execute(
+            operations.execute_activity,
+            workflow_id=workflow_id,
+            activity_id=activity_id,
+            action_sequence=action_sequence,
+        )
+
+    async def execute_system_activity(
+        self, *, workflow_id: str, activity_id: str, activity_order: str
+    ) -> str | None:
+        """Versão assíncrona de :meth:`Sesuite.execute_system_activity`."""
+        return await self._execute(
+            operations.execute_system_activity,
+            workflow_id=workflow_id,
+            activity_id=activity_id,
+            activity_order=activity_order,
+        )
+
+    async def new_workflow_edit_data(
+        self,
+        user_id: str | None = None,
+        *,
+        process_id: str,
+        workflow_title: str,
+        entity_id: str = "",
+        entity_list: Iterable[Entity] | None = None,
+        relationship_list: Iterable[Relationship] | None = None,
+    ) -> WorkflowRecord:
+        """Versão assíncrona de :meth:`Sesuite.new_workflow_edit_data`."""
+        return await self._execute(
+            operations.new_workflow_edit_data,
+            user_id=user_id,
+            process_id=process_id,
+            workflow_title=workflow_title,
+            entity_id=entity_id,
+            entity_list=entity_list,
+            relationship_list=relationship_list,
+        )
+
+    async def new_attachment(
+        self,
+        user_id: str | None = None,
+        *,
+        workflow_id: str,
+        activity_id: str,
+        file_path: Path,
+    ) -> WorkflowRecord:
+        """Versão assíncrona de :meth:`Sesuite.new_attachment`."""
+        return await self._execute(
+            operations.new_attachment,
+            user_id=user_id,
+            workflow_id=workflow_id,
+            activity_id=activity_id,
+            file_path=file_path,
+        )
+
+    async def get_table_record(
+        self,
+        *,
+        table_id: str,
+        table_field_list: Iterable[TableField],
+        pagination: int = 1,
+    ) -> TableRecord:
+        """Versão assíncrona de :meth:`Sesuite.get_table_record`."""
+        return await self._execute(
+            operations.get_table_record,
+            table_id=table_id,
+            table_field_list=table_field_list,
+            pagination=pagination,
+        )
+
+    async def cancel_workflow(
+        self, user_id: str | None, *, workflow_id: int | str, explanation: str
+    ) -> str | None:
+        """Versão assíncrona de :meth:`Sesuite.cancel_workflow`."""
+        return await self._execute(
+            operations.cancel_workflow,
+            user_id=user_id,
+            workflow_id=workflow_id,
+            explanation=explanation,
+        )
+
+    async def new_child_entity_record(
+        self,
+        *,
+        workflow_id: str,
+        entity_id: str,
+        entity_attribute: Iterable[Entity],
+        relationship_id: str,
+        relationship_attribute: Iterable[Relationship],
+    ) -> str | None:
+        """Versão assíncrona de :meth:`Sesuite.new_child_entity_record`."""
+        return await self._execute(
+            operations.new_child_entity_record,
+            workflow_id=workflow_id,
+            entity_id=entity_id,
+            entity_attribute=entity_attribute,
+            relationship_id=relationship_id,
+            relationship_attribute=relationship_attribute,
+        )
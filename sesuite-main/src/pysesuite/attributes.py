@@ -1,9 +1,105 @@
 """Os diferentes atributos que podemos passar para o Web Service do Sesuite."""
 
+from __future__ import annotations
+
+import itertools
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
 
 from .render import render
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+    from typing_extensions import Self
+
+# Os mesmos elementos gerados pelas macros de ``attributes/macros.xml``.
+_ENTITY_XML = """<urn:EntityAttribute>
+    <urn:EntityAttributeID>{}</urn:EntityAttributeID>
+    <urn:EntityAttributeValue>{}</urn:EntityAttributeValue>
+</urn:EntityAttribute>"""
+
+_RELATIONSHIP_XML = """<urn:Relationship>
+    <urn:RelationshipID>{}</urn:RelationshipID>
+    <urn:RelationshipAttributeList>
+        <urn:RelationshipAttribute>
+            <urn:RelationshipAttributeID>{}</urn:RelationshipAttributeID>
+            <urn:RelationshipAttributeValue>{}</urn:RelationshipAttributeValue>
+        </urn:RelationshipAttribute>
+    </urn:RelationshipAttributeList>
+</urn:Relationship>"""
+
+# Formato compacto, com os campos de cada linha de um relacionamento agrupados.
+_COMPACT_ENTITY_XML = "".join(map(str.strip, _ENTITY_XML.splitlines()))
+
+_COMPACT_RELATIONSHIP_XML = (
+    "<urn:Relationship><urn:RelationshipID>{}</urn:RelationshipID>"
+    "<urn:RelationshipAttributeList>{}</urn:RelationshipAttributeList>"
+    "</urn:Relationship>"
+)
+
+_COMPACT_RELATIONSHIP_ATTRIBUTE_XML = (
+    "<urn:RelationshipAttribute>"
+    "<urn:RelationshipAttributeID>{}</urn:RelationshipAttributeID>"
+    "<urn:RelationshipAttributeValue>{}</urn:RelationshipAttributeValue>"
+    "</urn:RelationshipAttribute>"
+)
+
+# Os mesmos caracteres escapados pelo autoescape do Jinja.
+_ESCAPES = (
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&#34;"),
+    ("'", "&#39;"),
+)
+
+
+def _escape_text(text: str) -> str:
+    for char, reference in _ESCAPES:
+        text = text.replace(char, reference)
+    return text
+
+
+def _escape(values: Iterable[object]) -> list[str]:
+    """Escapa todos os valores de uma coluna de uma única vez."""
+    values = [str(value) for value in values]
+    escaped = _escape_text("\0".join(values)).split("\0")
+    if len(escaped) != len(values):
+        # Algum valor contém o separador, ou a coluna está vazia.
+        escaped = [_escape_text(value) for value in values]
+
+    return escaped
+
+
+def _serialize(
+    template: str, *columns: Iterable[object], separator: str = "\n"
+) -> str:
+    """
+    Gera o XML de todas as linhas.
+
+    Parameters
+    ----------
+    template : str
+        O XML de uma linha, com um ``{}`` no lugar do valor de cada coluna.
+    *columns : Iterable of object
+        Os valores das colunas, que serão escapados.
+    separator : str, by default "\\n"
+        O texto entre as linhas.
+
+    Returns
+    -------
+    str
+        O XML das linhas.
+
+    """
+    head, *pieces = template.split("{}")
+    parts = [itertools.repeat(separator + head)]
+    for column, piece in zip(columns, pieces):
+        parts.extend((_escape(column), itertools.repeat(piece)))
+
+    return "".join(itertools.chain.from_iterable(zip(*parts)))[len(separator) :]
+
 
 @dataclass(slots=True, frozen=True, repr=False)
 class Entity:
@@ -74,3 +170,352 @@ class TableField:
 
     def __str__(self) -> str:
         return render("attributes/tablefield.xml", id=self.id, value=self.value)
+
+
+class ChildRecord(NamedTuple):
+    """
+    Linha a ser adicionada na grid do formulário de uma instância.
+
+    Attributes
+    ----------
+    workflow_id : str
+        Identificador da instância.
+    entity_attribute : Iterable of Entity
+        Os campos da linha, também aceita um :class:`EntityList`.
+    relationship_attribute : Iterable of Relationship, by default ()
+        Os relacionamentos da linha, também aceita um
+        :class:`RelationshipTable`.
+
+    """
+
+    workflow_id: str
+    entity_attribute: Iterable[Entity]
+    relationship_attribute: Iterable[Relationship] = ()
+
+
+class EntityList:
+    """
+    Campos a serem passados para o Web Service do Sesuite, guardados em colunas.
+
+    Alternativa compacta a uma lista de :class:`Entity`, aceita nos mesmos
+    lugares. O XML de todos os campos é gerado de uma única vez, sem criar um
+    objeto e renderizar um template para cada campo.
+
+    Parameters
+    ----------
+    ids : Iterable of str
+        Identificadores dos campos.
+    values : Iterable of str
+        Valores dos campos, na mesma ordem dos identificadores.
+
+    Raises
+    ------
+    ValueError
+        Caso a quantidade de identificadores e valores seja diferente.
+
+    """
+
+    __slots__ = ("ids", "values")
+
+    def __init__(self, ids: Iterable[str] = (), values: Iterable[str] = ()):
+        self.ids = list(ids)
+        self.values = list(values)
+        if len(self.ids) != len(self.values):
+            error = "A quantidade de identificadores e valores é diferente."
+            raise ValueError(error)
+
+    @classmethod
+    def from_dict(cls, fields: Mapping[str, str]) -> Self:
+        """
+        Cria os campos a partir de um dicionário.
+
+        Parameters
+        ----------
+        fields : Mapping of str and str
+            O valor de cada campo, indexado pelo identificador.
+
+        Returns
+        -------
+        EntityList
+            Os campos.
+
+        """
+        return cls(fields.keys(), fields.values())
+
+    @classmethod
+    def from_attributes(cls, attributes: Iterable[Entity]) -> Self:
+        """
+        Cria os campos a partir de instâncias de :class:`Entity`.
+
+        Parameters
+        ----------
+        attributes : Iterable of Entity
+            Os campos.
+
+        Returns
+        -------
+        EntityList
+            Os campos.
+
+        """
+        if isinstance(attributes, cls):
+            return attributes
+
+        entities = list(attributes)
+        return cls(
+            [entity.id for entity in entities],
+            [entity.value for entity in entities],
+        )
+
+    def to_xml(self, *, compact: bool = False) -> str:
+        """
+        Gera o XML de todos os campos.
+
+        Parameters
+        ----------
+        compact : bool, by default False
+            Se o XML deve ser gerado sem quebras de linha e indentação.
+
+        Returns
+        -------
+        str
+            O XML dos campos, com os valores escapados.
+
+        """
+        if compact:
+            return _serialize(
+                _COMPACT_ENTITY_XML, self.ids, self.values, separator=""
+            )
+
+        return _serialize(_ENTITY_XML, self.ids, self.values)
+
+    def append(self, id: str, value: str) -> None:  # noqa: A002
+        """Adiciona um campo."""
+        self.ids.append(id)
+        self.values.append(value)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Entity]:
+        return map(Entity, self.ids, self.values)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} campos)"
+
+    def __html__(self) -> str:
+        return self.to_xml()
+
+    __str__ = __html__
+
+
+class RelationshipTable:
+    """
+    Relacionamentos a serem passados para o Web Service do Sesuite, guardados
+    em colunas.
+
+    Alternativa compacta a uma lista de :class:`Relationship`, aceita nos
+    mesmos lugares. O XML de todos os relacionamentos é gerado de uma única vez.
+
+    Parameters
+    ----------
+    relationship_ids : Iterable of str
+        Identificadores dos relacionamentos.
+    field_ids : Iterable of str
+        Identificadores dos campos dos relacionamentos.
+    field_values : Iterable of str
+        Valores dos campos dos relacionamentos.
+
+    Raises
+    ------
+    ValueError
+        Caso as colunas tenham tamanhos diferentes.
+
+    """
+
+    __slots__ = ("field_ids", "field_values", "relationship_ids")
+
+    def __init__(
+        self,
+        relationship_ids: Iterable[str] = (),
+        field_ids: Iterable[str] = (),
+        field_values: Iterable[str] = (),
+    ):
+        self.relationship_ids = list(relationship_ids)
+        self.field_ids = list(field_ids)
+        self.field_values = list(field_values)
+        if not (
+            len(self.relationship_ids)
+            == len(self.field_ids)
+            == len(self.field_values)
+        ):
+            error = "As colunas dos relacionamentos têm tamanhos diferentes."
+            raise ValueError(error)
+
+    @classmethod
+    def from_dict(cls, relationship_id: str, fields: Mapping[str, str]) -> Self:
+        """
+        Cria os campos de um relacionamento a partir de um dicionário.
+
+        Parameters
+        ----------
+        relationship_id : str
+            Identificador do relacionamento.
+        fields : Mapping of str and str
+            O valor de cada campo, indexado pelo identificador.
+
+        Returns
+        -------
+        RelationshipTable
+            Os relacionamentos.
+
+        """
+        return cls(
+            [relationship_id] * len(fields), fields.keys(), fields.values()
+        )
+
+    @classmethod
+    def from_rows(
+        cls,
+        relationship_id: str,
+        field_ids: Sequence[str],
+        rows: Iterable[Sequence[str]],
+    ) -> Self:
+        """
+        Cria os relacionamentos a partir das linhas de uma grade.
+
+        Parameters
+        ----------
+        relationship_id : str
+            Identificador do relacionamento.
+        field_ids : Sequence of str
+            Identificadores dos campos, na ordem das colunas.
+        rows : Iterable of Sequence of str
+            Os valores de cada linha, na ordem de ``field_ids``.
+
+        Returns
+        -------
+        RelationshipTable
+            Os relacionamentos.
+
+        Raises
+        ------
+        ValueError
+            Caso alguma linha não tenha um valor para cada campo.
+
+        """
+        table = cls()
+        for row in rows:
+            if len(row) != len(field_ids):
+                error = f"A linha {row!r} não tem {len(field_ids)} valores."
+                raise ValueError(error)
+            table.relationship_ids.extend([relationship_id] * len(row))
+            table.field_ids.extend(field_ids)
+            table.field_values.extend(row)
+
+        return table
+
+    @classmethod
+    def from_attributes(cls, attributes: Iterable[Relationship]) -> Self:
+        """
+        Cria os relacionamentos a partir de instâncias de :class:`Relationship`.
+
+        Parameters
+        ----------
+        attributes : Iterable of Relationship
+            Os campos dos relacionamentos.
+
+        Returns
+        -------
+        RelationshipTable
+            Os relacionamentos.
+
+        """
+        if isinstance(attributes, cls):
+            return attributes
+
+        relationships = list(attributes)
+        return cls(
+            [relationship.relationship_id for relationship in relationships],
+            [relationship.field_id for relationship in relationships],
+            [relationship.field_value for relationship in relationships],
+        )
+
+    def to_xml(self, *, compact: bool = False) -> str:
+        """
+        Gera o XML de todos os relacionamentos.
+
+        Parameters
+        ----------
+        compact : bool, by default False
+            Se o XML deve ser gerado sem quebras de linha e indentação, com
+            os campos seguidos de uma mesma linha do relacionamento agrupados
+            em um único ``<urn:Relationship>``. Uma nova linha começa quando o
+            relacionamento muda ou um campo se repete, então as linhas de
+            :meth:`from_rows` continuam separadas.
+
+        Returns
+        -------
+        str
+            O XML dos relacionamentos, com os valores escapados.
+
+        """
+        if not compact:
+            return _serialize(
+                _RELATIONSHIP_XML,
+                self.relationship_ids,
+                self.field_ids,
+                self.field_values,
+            )
+
+        groups: list[tuple[str, list[str]]] = []
+        fields: set[str] = set()
+        attributes = map(
+            _COMPACT_RELATIONSHIP_ATTRIBUTE_XML.format,
+            _escape(self.field_ids),
+            _escape(self.field_values),
+        )
+        for relationship_id, field_id, attribute in zip(
+            _escape(self.relationship_ids), self.field_ids, attributes
+        ):
+            if (
+                not groups
+                or groups[-1][0] != relationship_id
+                or field_id in fields
+            ):
+                groups.append((relationship_id, []))
+                fields = set()
+            groups[-1][1].append(attribute)
+            fields.add(field_id)
+
+        return "".join(
+            _COMPACT_RELATIONSHIP_XML.format(relationship_id, "".join(group))
+            for relationship_id, group in groups
+        )
+
+    def append(
+        self, relationship_id: str, field_id: str, field_value: str
+    ) -> None:
+        """Adiciona o campo de um relacionamento."""
+        self.relationship_ids.append(relationship_id)
+        self.field_ids.append(field_id)
+        self.field_values.append(field_value)
+
+    def __len__(self) -> int:
+        return len(self.relationship_ids)
+
+    def __iter__(self) -> Iterator[Relationship]:
+        return map(
+            Relationship,
+            self.relationship_ids,
+            self.field_ids,
+            self.field_values,
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} campos)"
+
+    def __html__(self) -> str:
+        return self.to_xml()
+
+    __str__ = __html__
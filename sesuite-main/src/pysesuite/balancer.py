@@ -0,0 +1,358 @@
+"""
+Distribuição das chamadas entre vários endereços e tokens do Web Service.
+
+Cada combinação de endereço base e token de autorização é um destino. As
+chamadas são distribuídas entre os destinos saudáveis, em rodízio ou para o
+destino com menos chamadas em andamento. Os destinos que acumulam falhas, ou
+ficam lentos, são afastados por um tempo, e voltam a receber chamadas depois
+do mesmo.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from .components import Components
+    from .transport import Transport
+
+
+def is_failure(status: int) -> bool:
+    """Se o status HTTP indica uma falha do gateway, ou excesso de chamadas."""
+    return status == 429 or status >= 500
+
+
+class Strategy(StrEnum):
+    """Forma de escolher o destino de cada chamada."""
+
+    round_robin = "round_robin"
+    least_outstanding = "least_outstanding"
+
+
+class TargetStats(NamedTuple):
+    """
+    Estado de um destino.
+
+    Attributes
+    ----------
+    base_url : str or None
+        O endereço base, ou ``None`` para o endereço do ``Transport``.
+    token : int or None
+        A posição do token na lista de tokens, ou ``None`` para o token do
+        cliente.
+    outstanding : int
+        Chamadas em andamento.
+    requests : int
+        Chamadas feitas.
+    failures : int
+        Chamadas que falharam.
+    latency : float or None
+        Média móvel da latência, em segundos.
+    ejected : bool
+        Se o destino está afastado.
+
+    """
+
+    base_url: str | None
+    token: int | None
+    outstanding: int
+    requests: int
+    failures: int
+    latency: float | None
+    ejected: bool
+
+
+class Target:
+    """Um endereço base e um token, para onde as chamadas são enviadas."""
+
+    __slots__ = (
+        "auth",
+        "base_url",
+        "ejected_until",
+        "failures",
+        "latency",
+        "outstanding",
+        "requests",
+        "streak",
+        "token",
+    )
+
+    def __init__(
+        self, base_url: str | None, auth: str | None, token: int | None
+    ) -> None:
+        self.base_url = base_url
+        self.auth = auth
+        self.token = token
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.streak = 0
+        self.latency: float | None = None
+        self.ejected_until = 0.0
+
+    def url(self, component: Components, transport: Transport) -> str:
+        """
+        Retorna a url do componente neste destino.
+
+        Parameters
+        ----------
+        component : Components
+            Componente do SeSuite que será utilizado.
+        transport : Transport
+            Configuração utilizada caso o destino não tenha endereço.
+
+        Returns
+        -------
+        str
+            A url do componente.
+
+        """
+        if self.base_url is None:
+            return transport.url(component)
+
+        return component.url_at(self.base_url)
+
+
+class Balancer:
+    """
+    Distribui as chamadas entre vários endereços e tokens do Web Service.
+
+    Pode ser compartilhado entre várias threads e tarefas assíncronas.
+
+    Parameters
+    ----------
+    base_urls : Sequence of str, optional
+        Os endereços base, como ``https://host/apigateway/se/ws``. Por
+        padrão, o endereço configurado no ``Transport``.
+    tokens : Sequence of str, optional
+        Os tokens de autorização. Por padrão, o token do cliente.
+    strategy : Strategy, by default "round_robin"
+        Como escolher o destino de cada chamada.
+    max_failures : int, by default 5
+        Quantidade de falhas seguidas que afasta o destino. São falhas os
+        erros de conexão e as respostas HTTP 429 e 5xx.
+    max_latency : float, optional
+        Latência média, em segundos, que afasta o destino.
+    ejection_time : float, by default 30.0
+        Tempo, em segundos, que o destino fica afastado.
+
+    Examples
+    --------
+    >>> balancer = Balancer(
+    ...     ["https://a/apigateway/se/ws", "https://b/apigateway/se/ws"],
+    ...     tokens=[token_a, token_b],
+    ...     strategy="least_outstanding",
+    ... )
+    >>> with Sesuite(token_a, balancer=balancer) as sesuite:
+    ...     with balancer.pin(token_b):
+    ...         sesuite.new_attachment(...)
+
+    """
+
+    __slots__ = (
+        "_counter",
+        "_lock",
+        "_pinned",
+        "_targets",
+        "ejection_time",
+        "max_failures",
+        "max_latency",
+        "strategy",
+    )
+
+    def __init__(
+        self,
+        base_urls: Sequence[str] = (),
+        tokens: Sequence[str] = (),
+        *,
+        strategy: Strategy | str = Strategy.round_robin,
+        max_failures: int = 5,
+        max_latency: float | None = None,
+        ejection_time: float = 30.0,
+    ) -> None:
+        self.strategy = Strategy(strategy)
+        self.max_failures = max_failures
+        self.max_latency = max_latency
+        self.ejection_time = ejection_time
+        self._targets = [
+            Target(base_url, auth, token)
+            for base_url in base_urls or [None]
+            for token, auth in list(enumerate(tokens)) or [(None, None)]
+        ]
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        # O token fixado pelo ``pin`` no contexto atual, de cada balanceador.
+        self._pinned: ContextVar[str | None] = ContextVar(
+            f"pysesuite_pinned_{id(self)}", default=None
+        )
+
+    @contextlib.contextmanager
+    def pin(self, token: str) -> Iterator[None]:
+        """
+        Envia as chamadas feitas dentro do bloco apenas com o token.
+
+        Utilizado quando a chamada precisa ser feita por um usuário
+        específico. Vale para o contexto atual e apenas para este balanceador.
+        As chamadas em lote do :class:`Sesuite`, como ``map``, levam o token
+        para as suas threads, mas as demais threads criadas dentro do bloco
+        não herdam o mesmo, e o ``Spool`` recusa chamadas feitas dentro do
+        bloco.
+
+        Parameters
+        ----------
+        token : str
+            Um dos tokens do balanceador.
+
+        Raises
+        ------
+        ValueError
+            Caso o token não seja um dos tokens do balanceador.
+
+        """
+        if not any(target.auth == token for target in self._targets):
+            error = "O token não pertence ao balanceador."
+            raise ValueError(error)
+
+        reset = self._pinned.set(token)
+        try:
+            yield
+        finally:
+            self._pinned.reset(reset)
+
+    @property
+    def pinned(self) -> str | None:
+        """O token fixado com :meth:`pin` no contexto atual."""
+        return self._pinned.get()
+
+    def acquire(self) -> Target:
+        """
+        Escolhe o destino da próxima chamada.
+
+        Os destinos afastados só são escolhidos quando todos estão afastados.
+
+        Returns
+        -------
+        Target
+            O destino, que deve ser devolvido com :meth:`release`.
+
+        Raises
+        ------
+        ValueError
+            Caso nenhum destino tenha o token fixado com :meth:`pin`.
+
+        """
+        pinned = self._pinned.get()
+        now = time.monotonic()
+        with self._lock:
+            targets = self._targets
+            if pinned is not None:
+                targets = [t for t in targets if t.auth == pinned]
+                # Nunca continua a chamada com o token de outro usuário.
+                if not targets:
+                    error = "O token fixado não pertence ao balanceador."
+                    raise ValueError(error)
+            healthy = [t for t in targets if t.ejected_until <= now]
+            candidates = healthy or targets
+
+            # O rodízio também desempata os destinos com a mesma quantidade
+            # de chamadas em andamento.
+            start = next(self._counter) % len(candidates)
+            if self.strategy is Strategy.round_robin:
+                target = candidates[start]
+            else:
+                target = min(
+                    candidates[start:] + candidates[:start],
+                    key=lambda t: t.outstanding,
+                )
+
+            target.outstanding += 1
+            target.requests += 1
+
+        return target
+
+    def release(self, target: Target, latency: float, *, failed: bool) -> None:
+        """
+        Devolve o destino depois da chamada.
+
+        Parameters
+        ----------
+        target : Target
+            O destino retornado por :meth:`acquire`.
+        latency : float
+            Duração da chamada, em segundos.
+        failed : bool
+            Se a chamada falhou por um erro de conexão ou do gateway.
+
+        """
+        with self._lock:
+            target.outstanding -= 1
+            if failed:
+                target.failures += 1
+                target.streak += 1
+            else:
+                target.streak = 0
+                target.latency = (
+                    latency
+                    if target.latency is None
+                    else 0.8 * target.latency + 0.2 * latency
+                )
+
+            slow = (
+                self.max_latency is not None
+                and target.latency is not None
+                and target.latency > self.max_latency
+            )
+            if target.streak >= self.max_failures or slow:
+                target.ejected_until = time.monotonic() + self.ejection_time
+                target.streak = 0
+                target.latency = None
+
+    def urls(self, transport: Transport) -> list[str]:
+        """
+        As urls de todos os componentes em todos os destinos, sem repetições.
+
+        Parameters
+        ----------
+        transport : Transport
+            Configuração utilizada pelos destinos sem endereço.
+
+        Returns
+        -------
+        list of str
+            As urls, na ordem dos destinos.
+
+        """
+        from .components import Components
+
+        return list(
+            dict.fromkeys(
+                target.url(component, transport)
+                for target in self._targets
+                for component in Components
+            )
+        )
+
+    def stats(self) -> list[TargetStats]:
+        """O estado de cada destino."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                TargetStats(
+                    target.base_url,
+                    target.token,
+                    target.outstanding,
+                    target.requests,
+                    target.failures,
+                    target.latency,
+                    target.ejected_until > now,
+                )
+                for target in self._targets
+            ]
@@ -0,0 +1,196 @@
+"""Execução de várias chamadas ao Web Service em paralelo."""
+
+from __future__ import annotations
+
+import contextvars
+import itertools
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .exceptions import FormError, WorkflowError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def submit(
+    executor: ThreadPoolExecutor,
+    function: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> Future[T]:
+    """
+    Envia a chamada ao pool, executada com uma cópia do contexto atual.
+
+    As threads do pool não herdam o contexto de quem envia a chamada, então
+    o token fixado com ``Balancer.pin`` seria ignorado sem a cópia.
+
+    Parameters
+    ----------
+    executor : ThreadPoolExecutor
+        O pool de threads.
+    function : Callable
+        A função que será executada.
+    *args, **kwargs
+        Os argumentos da chamada.
+
+    Returns
+    -------
+    Future
+        O resultado da chamada.
+
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, function, *args, **kwargs)
+
+
+def _outcome(future: Future[T]) -> T | WorkflowError | FormError:
+    try:
+        return future.result()
+    except (WorkflowError, FormError) as error:
+        return error
+
+
+def imap(
+    function: Callable[..., T],
+    kwargs_iterable: Iterable[Mapping[str, Any]],
+    *,
+    max_workers: int = 8,
+    ordered: bool = True,
+) -> Iterator[T | WorkflowError | FormError]:
+    """
+    Executa a função para cada conjunto de argumentos em um pool de threads.
+
+    Apenas uma quantidade limitada de chamadas fica pendente por vez, então o
+    iterável de argumentos é consumido aos poucos.
+
+    Parameters
+    ----------
+    function : Callable
+        A função que será executada.
+    kwargs_iterable : Iterable of Mapping
+        Os keyword arguments de cada chamada.
+    max_workers : int, by default 8
+        Quantidade de threads.
+    ordered : bool, by default True
+        Se os resultados devem ser retornados na ordem dos argumentos, ou na
+        ordem em que as chamadas terminarem.
+
+    Yields
+    ------
+    T or WorkflowError or FormError
+        O resultado de cada chamada, ou o erro retornado pelo Sesuite.
+
+    """
+    arguments = iter(kwargs_iterable)
+    window = max_workers * 2
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        if ordered:
+            queue = deque(
+                submit(executor, function, **kwargs)
+                for kwargs in itertools.islice(arguments, window)
+            )
+            while queue:
+                future = queue.popleft()
+                for kwargs in itertools.islice(arguments, 1):
+                    queue.append(submit(executor, function, **kwargs))
+                yield _outcome(future)
+        else:
+            pending = {
+                submit(executor, function, **kwargs)
+                for kwargs in itertools.islice(arguments, window)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for kwargs in itertools.islice(arguments, len(done)):
+                    pending.add(submit(executor, function, **kwargs))
+                for future in done:
+                    yield _outcome(future)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def chunked(items: Iterable[T], *, max_items: int) -> Iterator[list[T]]:
+    """
+    Divide os itens em blocos limitados pela quantidade.
+
+    Parameters
+    ----------
+    items : Iterable
+        Os itens, que mantêm a ordem nos blocos.
+    max_items : int
+        Quantidade máxima de itens em um bloco.
+
+    Yields
+    ------
+    list
+        Os itens de cada bloco.
+
+    """
+    chunk: list[T] = []
+    for item in items:
+        if len(chunk) >= max_items:
+            yield chunk
+            chunk = []
+
+        chunk.append(item)
+
+    if chunk:
+        yield chunk
+
+
+def run_lanes(
+    function: Callable[[T], R],
+    lanes: Mapping[Hashable, Iterable[T]],
+    *,
+    max_workers: int = 8,
+) -> Iterator[R]:
+    """
+    Executa a função para cada item das filas em um pool de threads.
+
+    Os itens de uma fila são executados um de cada vez, na ordem da fila,
+    enquanto filas diferentes são executadas em paralelo. O próximo item de
+    uma fila vai para o final da fila do pool, alternando entre as filas.
+
+    Parameters
+    ----------
+    function : Callable
+        A função que será executada.
+    lanes : Mapping of Hashable and Iterable
+        Os itens de cada fila.
+    max_workers : int, by default 8
+        Quantidade de threads.
+
+    Yields
+    ------
+    R
+        O resultado de cada chamada, na ordem em que terminarem.
+
+    """
+    queues = {key: iter(items) for key, items in lanes.items()}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending: dict[Future[R], Hashable] = {}
+
+        def advance(key: Hashable) -> None:
+            for item in itertools.islice(queues[key], 1):
+                pending[submit(executor, function, item)] = key
+
+        for key in queues:
+            advance(key)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                advance(pending.pop(future))
+                yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,271 @@
+"""Cache das respostas das consultas às tabelas do Sesuite."""
+
+from __future__ import annotations
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+    from pathlib import Path
+
+    from .operations import T
+
+
+class CacheStats(NamedTuple):
+    """
+    Estatísticas de uso do cache.
+
+    Attributes
+    ----------
+    hits : int
+        Consultas respondidas pelo cache.
+    misses : int
+        Consultas que precisaram chamar o Web Service.
+    coalesced : int
+        Consultas que aguardaram uma chamada idêntica já em andamento.
+    size : int
+        Quantidade de respostas guardadas.
+
+    """
+
+    hits: int
+    misses: int
+    coalesced: int
+    size: int
+
+
+class ResponseCache:
+    """
+    Cache LRU com tempo de expiração para as consultas às tabelas.
+
+    Consultas idênticas feitas ao mesmo tempo por várias threads resultam em
+    uma única chamada ao Web Service. As respostas guardadas são compartilhadas
+    entre as consultas e não devem ser modificadas.
+
+    Examples
+    --------
+    >>> cache = ResponseCache(ttl=600, table_ttl={"custos": 3600})
+    >>> with Sesuite(auth, cache=cache) as sesuite:
+    ...     sesuite.get_table_record(table_id="custos", table_field_list=[])
+
+    """
+
+    __slots__ = (
+        "_coalesced",
+        "_entries",
+        "_generation",
+        "_hits",
+        "_in_flight",
+        "_lock",
+        "_maxsize",
+        "_misses",
+        "_path",
+        "_table_generations",
+        "_table_ttl",
+        "_ttl",
+    )
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1024,
+        ttl: float = 300,
+        table_ttl: Mapping[str, float] | None = None,
+        path: Path | None = None,
+    ) -> None:
+        """
+        Cache LRU com tempo de expiração para as consultas às tabelas.
+
+        Parameters
+        ----------
+        maxsize : int, by default 1024
+            Quantidade máxima de respostas guardadas, as menos usadas
+            recentemente são descartadas primeiro.
+        ttl : float, by default 300
+            Tempo, em segundos, que uma resposta é válida.
+        table_ttl : Mapping of str and float, optional
+            Tempo de validade específico de cada tabela.
+        path : Path, optional
+            Arquivo onde o cache é guardado entre execuções, com ``pickle``,
+            então deve ser um arquivo confiável.
+
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._table_ttl = dict(table_ttl or {})
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[str, float, Any]] = (
+            OrderedDict()
+        )
+        self._in_flight: dict[Hashable, tuple[str, Future[Any]]] = {}
+        # Incrementadas pelo ``invalidate``, de todas as tabelas e de cada
+        # tabela, descartam as respostas das consultas iniciadas antes.
+        self._generation = 0
+        self._table_generations: dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+        if path is not None and path.exists():
+            self._load(path)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Estatísticas de uso do cache."""
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._coalesced, len(self._entries)
+            )
+
+    def get(self, key: Hashable, table_id: str, function: Callable[[], T]) -> T:
+        """
+        Retorna a resposta guardada, ou chama a função e guarda o resultado.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identificador da consulta.
+        table_id : str
+            Identificador da tabela consultada.
+        function : Callable
+            Função que faz a consulta ao Web Service.
+
+        Returns
+        -------
+        T
+            A resposta da consulta.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[2]
+
+            in_flight = self._in_flight.get(key)
+            owner = in_flight is None
+            if in_flight is None:
+                self._misses += 1
+                future: Future[Any] = Future()
+                self._in_flight[key] = (table_id, future)
+                generation = self._generation_of(table_id)
+            else:
+                future = in_flight[1]
+                self._coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as error:
+            with self._lock:
+                self._forget(key, future)
+            future.set_exception(error)
+            raise
+
+        self._store(key, table_id, result, future, generation)
+        future.set_result(result)
+
+        return result
+
+    def _generation_of(self, table_id: str) -> tuple[int, int]:
+        return self._generation, self._table_generations.get(table_id, 0)
+
+    def _forget(self, key: Hashable, future: Future[Any]) -> None:
+        # A consulta pode ter sido descartada, e substituída, pelo
+        # ``invalidate``.
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None and in_flight[1] is future:
+            del self._in_flight[key]
+
+    def _store(
+        self,
+        key: Hashable,
+        table_id: str,
+        value: Any,
+        future: Future[Any],
+        generation: tuple[int, int],
+    ) -> None:
+        expires = time.time() + self._table_ttl.get(table_id, self._ttl)
+        with self._lock:
+            self._forget(key, future)
+            if generation != self._generation_of(table_id):
+                return
+
+            self._entries[key] = (table_id, expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table_id: str | None = None) -> None:
+        """
+        Descarta as respostas guardadas.
+
+        As consultas em andamento também são descartadas: a resposta é
+        retornada a quem já aguardava a mesma, mas não é guardada, e as novas
+        consultas fazem uma nova chamada ao Web Service.
+
+        Parameters
+        ----------
+        table_id : str, optional
+            Descarta apenas as respostas da tabela, por padrão todas.
+
+        """
+        with self._lock:
+            if table_id is None:
+                self._generation += 1
+                self._entries.clear()
+                self._in_flight.clear()
+                return
+
+            self._table_generations[table_id] = (
+                self._table_generations.get(table_id, 0) + 1
+            )
+            for key in [
+                key
+                for key, (table, _, _) in self._entries.items()
+                if table == table_id
+            ]:
+                del self._entries[key]
+            for key in [
+                key
+                for key, (table, _) in self._in_flight.items()
+                if table == table_id
+            ]:
+                del self._in_flight[key]
+
+    def save(self) -> None:
+        """Guarda as respostas ainda válidas no arquivo do cache."""
+        if self._path is None:
+            return
+
+        now = time.time()
+        with self._lock:
+            entries = [
+                (key, entry)
+                for key, entry in self._entries.items()
+                if entry[1] > now
+            ]
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._path.with_name(f"{self._path.name}.tmp")
+        with temporary.open("wb") as f:
+            pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temporary.replace(self._path)
+
+    def _load(self, path: Path) -> None:
+        now = time.time()
+        with path.open("rb") as f:
+            entries = pickle.load(f)  # noqa: S301
+
+        for key, entry in entries[-self._maxsize :]:
+            if entry[1] > now:
+                self._entries[key] = entry
@@ -21,7 +21,24 @@ class Components(StrEnum):
     @property
     def url(self) -> str:
         """A url do componente especificado."""
-        return f"https://sesuite.sicredi.com.br/apigateway/se/ws/{self}_ws.php"
+        return self.url_at("https://sesuite.sicredi.com.br/apigateway/se/ws")
+
+    def url_at(self, base_url: str) -> str:
+        """
+        A url do componente em um endereço base.
+
+        Parameters
+        ----------
+        base_url : str
+            Endereço base do Web Service, como ``https://host/apigateway/se/ws``.
+
+        Returns
+        -------
+        str
+            A url do componente.
+
+        """
+        return f"{base_url.rstrip('/')}/{self}_ws.php"
 
     @property
     def name(self) -> str:
@@ -0,0 +1,111 @@
+"""
+Compressão dos corpos de requisição enviados ao Web Service do Sesuite.
+
+Os envelopes em memória são comprimidos de uma vez e enviados com
+``Content-Length``. Os anexos são comprimidos aos poucos, enquanto são lidos,
+e enviados com ``Transfer-Encoding: chunked``, já que o tamanho comprimido só
+é conhecido no final.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from .files import StreamingBody
+
+# O ``wbits`` do zlib de cada ``Content-Encoding``, o ``deflate`` do HTTP é o
+# formato zlib, com cabeçalho e checksum.
+ENCODINGS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def _compressor(encoding: str, level: int) -> zlib._Compress:
+    if encoding not in ENCODINGS:
+        error = f"Compressão não suportada: {encoding!r}."
+        raise ValueError(error)
+
+    return zlib.compressobj(level, zlib.DEFLATED, ENCODINGS[encoding])
+
+
+class CompressedBody:
+    """
+    Corpo de requisição comprimido aos poucos, durante o envio.
+
+    Attributes
+    ----------
+    raw : int
+        Quantidade de bytes lidos do corpo original.
+    size : int
+        Quantidade de bytes comprimidos produzidos.
+
+    """
+
+    __slots__ = ("_body", "_encoding", "_level", "raw", "size")
+
+    def __init__(
+        self, body: StreamingBody, encoding: str, level: int = 6
+    ) -> None:
+        _compressor(encoding, level)
+        self._body = body
+        self._encoding = encoding
+        self._level = level
+        self.raw = 0
+        self.size = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressor = _compressor(self._encoding, self._level)
+        self.raw = self.size = 0
+        for chunk in self._body:
+            self.raw += len(chunk)
+            if data := compressor.compress(chunk):
+                self.size += len(data)
+                yield data
+
+        data = compressor.flush()
+        self.size += len(data)
+        yield data
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        import asyncio
+
+        chunks = iter(self)
+        while (
+            chunk := await asyncio.to_thread(next, chunks, None)
+        ) is not None:
+            yield chunk
+
+
+def compress(
+    body: bytes | StreamingBody, encoding: str, level: int = 6
+) -> bytes | CompressedBody:
+    """
+    Comprime o corpo da requisição.
+
+    Parameters
+    ----------
+    body : bytes or StreamingBody
+        O corpo original.
+    encoding : {"gzip", "deflate"}
+        O ``Content-Encoding`` da requisição.
+    level : int, by default 6
+        Nível de compressão, de 1, mais rápido, a 9, menor.
+
+    Returns
+    -------
+    bytes or CompressedBody
+        O corpo comprimido, os anexos são comprimidos apenas no envio.
+
+    Raises
+    ------
+    ValueError
+        Caso a compressão não seja suportada.
+
+    """
+    if isinstance(body, bytes):
+        compressor = _compressor(encoding, level)
+        return compressor.compress(body) + compressor.flush()
+
+    return CompressedBody(body, encoding, level)
@@ -0,0 +1,326 @@
+"""
+Download dos arquivos anexados aos registros do Sesuite.
+
+Os arquivos são guardados em um cache local endereçado pelo hash do arquivo,
+então um arquivo já baixado nunca é baixado novamente.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .batch import imap
+from .exceptions import FormError
+from .sessions import SessionPool
+from .transport import Transport
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Iterable, Iterator
+
+    import requests
+    from typing_extensions import Self
+
+FILES_URL = "https://sesuite.sicredi.com.br/apigateway/v1/file/"
+CACHE_FOLDER = Path.home() / ".cache" / "pysesuite" / "files"
+
+_CHUNK_SIZE = 1024 * 1024
+# O algoritmo do hash, pela quantidade de dígitos hexadecimais.
+_ALGORITHMS = {32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def _files_url(base_url: str) -> str:
+    """
+    A url da api de arquivos do mesmo gateway do Web Service.
+
+    Parameters
+    ----------
+    base_url : str
+        Endereço base do Web Service, como ``https://host/apigateway/se/ws``.
+
+    Returns
+    -------
+    str
+        A url da api de arquivos, como ``https://host/apigateway/v1/file/``.
+
+    """
+    gateway = base_url.rstrip("/").removesuffix("/se/ws")
+    return f"{gateway}/v1/file/"
+
+
+def _hasher(file_hash: str) -> hashlib._Hash | None:
+    """
+    Cria o hash utilizado para conferir o arquivo baixado.
+
+    Os hashes que não são um digest hexadecimal de tamanho conhecido não são
+    conferidos.
+    """
+    algorithm = _ALGORITHMS.get(len(file_hash))
+    if algorithm is None or not _HEX_DIGITS.issuperset(file_hash.lower()):
+        return None
+
+    return hashlib.new(algorithm)
+
+
+class Downloader:
+    """
+    Gerenciador de downloads dos arquivos do Sesuite.
+
+    As conexões são reaproveitadas entre os downloads, o conteúdo é escrito no
+    disco aos poucos e downloads interrompidos são retomados de onde pararam,
+    caso o servidor aceite requisições com ``Range``. Quando o hash é um
+    digest hexadecimal MD5, SHA-1, SHA-256 ou SHA-512, o conteúdo baixado é
+    conferido antes de entrar no cache.
+
+    Examples
+    --------
+    >>> with Downloader(auth) as downloader:
+    ...     for path in downloader.download_many(
+    ...         {file_hash: file_name for file_hash, file_name in files}
+    ...     ):
+    ...         ...
+
+    """
+
+    __slots__ = (
+        "_auth",
+        "_cache_folder",
+        "_files_url",
+        "_locks",
+        "_locks_lock",
+        "_sessions",
+        "_transport",
+    )
+
+    def __init__(
+        self,
+        auth: str,
+        cache_folder: Path = CACHE_FOLDER,
+        transport: Transport | None = None,
+        files_url: str | None = None,
+    ) -> None:
+        """
+        Gerenciador de downloads dos arquivos do Sesuite.
+
+        Parameters
+        ----------
+        auth : str
+            Token de autorização do usuário.
+        cache_folder : Path, optional
+            Pasta onde os arquivos baixados são guardados, pelo hash.
+        transport : Transport, optional
+            Configuração das conexões HTTP. Por padrão, com o certificado TLS
+            verificado, já que o token de autorização é enviado em cada
+            download.
+        files_url : str, optional
+            A url da api de arquivos. Por padrão, a do mesmo gateway do
+            ``base_url`` do ``transport``, ou a de produção.
+
+        """
+        self._auth = auth
+        self._cache_folder = cache_folder
+        self._transport = transport or Transport(verify=True)
+        if files_url is None:
+            base_url = self._transport.base_url
+            files_url = FILES_URL if base_url is None else _files_url(base_url)
+        self._files_url = files_url
+        self._sessions = SessionPool(self._transport.session)
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        _type: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._sessions.close()
+
+    def _lock(self, file_hash: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(file_hash, threading.Lock())
+
+    def fetch(self, file_hash: str) -> Path:
+        """
+        Retorna o caminho do arquivo no cache, baixando o mesmo se necessário.
+
+        Parameters
+        ----------
+        file_hash : str
+            Hash do arquivo.
+
+        Returns
+        -------
+        Path
+            Caminho do arquivo no cache.
+
+        Raises
+        ------
+        FormError
+            Caso ocorra algum problema com a api.
+
+        """
+        if file_hash in ("", ".", "..") or Path(file_hash).name != file_hash:
+            error = f"hash de arquivo inválido: {file_hash!r}"
+            raise FormError(error)
+
+        cached = self._cache_folder / file_hash
+        if cached.exists():
+            return cached
+
+        with self._lock(file_hash):
+            if not cached.exists():
+                self._download(file_hash, cached)
+
+        return cached
+
+    def _download(self, file_hash: str, destination: Path) -> None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        partial = destination.with_name(f"{destination.name}.part")
+
+        headers = {"accept": "*/*", "Authorization": self._auth}
+        offset = partial.stat().st_size if partial.exists() else 0
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        with self._sessions.get().get(
+            f"{self._files_url}{file_hash}",
+            headers=headers,
+            stream=True,
+            timeout=self._transport.timeout,
+        ) as response:
+            if offset and response.status_code == 416:
+                # O arquivo parcial não corresponde ao arquivo do servidor.
+                partial.unlink()
+                self._download(file_hash, destination)
+                return
+
+            if response.status_code not in (200, 206):
+                error = "ocorreu um erro com o retorno do arquivo"
+                raise FormError(error)
+
+            hasher = _hasher(file_hash)
+            mode = "ab" if response.status_code == 206 else "wb"
+            if hasher is not None and mode == "ab":
+                with partial.open("rb") as f:
+                    while chunk := f.read(_CHUNK_SIZE):
+                        hasher.update(chunk)
+
+            with partial.open(mode) as f:
+                for chunk in response.iter_content(_CHUNK_SIZE):
+                    f.write(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+
+        if hasher is not None and hasher.hexdigest() != file_hash.lower():
+            # Não é retomado, já que o conteúdo parcial pode estar corrompido.
+            partial.unlink()
+            error = f"o conteúdo baixado não corresponde ao hash {file_hash}"
+            raise FormError(error)
+
+        os.replace(partial, destination)
+
+    def download(
+        self,
+        file_hash: str,
+        file_name: str,
+        folder: Path | None = None,
+    ) -> Path:
+        """
+        Baixe o arquivo com o hash retornado pelo método ``get_table_record()``.
+
+        Parameters
+        ----------
+        file_hash : str
+            Hash do arquivo.
+        file_name : str
+            Nome que o arquivo deve ser salvo.
+        folder : Path, optional
+            Pasta onde o arquivo deve ser salvo, por padrão ``./downloads``.
+
+        Returns
+        -------
+        Path
+            Caminho do arquivo salvo.
+
+        Raises
+        ------
+        FormError
+            Caso ocorra algum problema com a api.
+
+        """
+        cached = self.fetch(file_hash)
+
+        folder = folder or Path.cwd() / "downloads"
+        folder.mkdir(parents=True, exist_ok=True)
+        file_path = folder / file_name
+        temporary = folder / f".{file_name}.{threading.get_ident()}.tmp"
+
+        shutil.copyfile(cached, temporary)
+        os.replace(temporary, file_path)
+
+        return file_path
+
+    def _download_or_error(
+        self, file_hash: str, file_name: str, folder: Path | None
+    ) -> Path | requests.RequestException:
+        import requests
+
+        try:
+            return self.download(file_hash, file_name, folder)
+        except requests.RequestException as error:
+            return error
+
+    def download_many(
+        self,
+        files: dict[str, str] | Iterable[tuple[str, str]],
+        folder: Path | None = None,
+        *,
+        max_workers: int = 8,
+    ) -> Iterator[Path | FormError | requests.RequestException]:
+        """
+        Baixe vários arquivos em paralelo.
+
+        Parameters
+        ----------
+        files : dict of str and str or Iterable of tuple of str and str
+            Pares de hash e nome de cada arquivo.
+        folder : Path, optional
+            Pasta onde os arquivos devem ser salvos, por padrão ``./downloads``.
+        max_workers : int, by default 8
+            Quantidade de downloads simultâneos.
+
+        Yields
+        ------
+        Path or FormError or RequestException
+            O caminho de cada arquivo salvo, ou o erro do download, na ordem
+            dos arquivos. Um erro de conexão também é retornado no lugar do
+            arquivo, sem interromper os demais downloads.
+
+        """
+        pairs = files.items() if isinstance(files, dict) else files
+
+        return imap(
+            self._download_or_error,
+            (
+                {
+                    "file_hash": file_hash,
+                    "file_name": file_name,
+                    "folder": folder,
+                }
+                for file_hash, file_name in pairs
+            ),
+            max_workers=max_workers,
+        )
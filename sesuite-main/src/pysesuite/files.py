@@ -1,5 +1,15 @@
+from __future__ import annotations
+
 import base64
-from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+    from pathlib import Path
+
+# Múltiplo de 57 bytes, que é o tamanho de cada linha do ``encodebytes``, para
+# que os pedaços codificados separadamente formem as mesmas linhas.
+CHUNK_SIZE = 57 * 16 * 1024
 
 
 def base_64(filepath: Path) -> str:
@@ -22,3 +32,154 @@ def base_64(filepath: Path) -> str:
         content_encoded = base64.encodebytes(content).decode("ascii")
 
     return repr(content_encoded)
+
+
+def base_64_stream(
+    filepath: Path, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Converte arquivos para base64 aos poucos.
+
+    O resultado concatenado é igual ao retornado por ``base_64()``, mas apenas
+    um pedaço do arquivo fica em memória por vez.
+
+    Parameters
+    ----------
+    filepath : Path
+        Caminho do arquivo.
+    chunk_size : int, optional
+        Quantidade de bytes lidos do arquivo por vez, deve ser múltiplo de 57.
+
+    Yields
+    ------
+    bytes
+        Pedaços da string em base64 do conteúdo do arquivo.
+
+    """
+    yield b"'"
+    with filepath.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            yield base64.encodebytes(chunk).replace(b"\n", b"\\n")
+    yield b"'"
+
+
+def base_64_length(filepath: Path) -> int:
+    """
+    Calcula o tamanho da string retornada por ``base_64()`` sem ler o arquivo.
+
+    Parameters
+    ----------
+    filepath : Path
+        Caminho do arquivo.
+
+    Returns
+    -------
+    int
+        O tamanho da string em base64.
+
+    """
+    size = filepath.stat().st_size
+    lines = -(-size // 57)
+
+    # 4 caracteres a cada 3 bytes, o ``\n`` escapado no fim de cada linha e as
+    # aspas adicionadas pelo ``repr``.
+    return 4 * -(-size // 3) + 2 * lines + 2
+
+
+class StreamingBody:
+    """
+    Corpo de requisição com o conteúdo de um arquivo, enviado aos poucos.
+
+    O tamanho do corpo é conhecido antes do envio, então a requisição é feita
+    com ``Content-Length`` e sem manter o arquivo inteiro em memória.
+    """
+
+    __slots__ = ("_chunk_size", "_filepath", "_prefix", "_suffix")
+
+    def __init__(
+        self,
+        prefix: str,
+        filepath: Path,
+        suffix: str,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """
+        Corpo de requisição com o conteúdo de um arquivo.
+
+        Parameters
+        ----------
+        prefix : str
+            XML enviado antes do conteúdo do arquivo.
+        filepath : Path
+            Caminho do arquivo, que será enviado em base64.
+        suffix : str
+            XML enviado depois do conteúdo do arquivo.
+        chunk_size : int, optional
+            Quantidade de bytes lidos do arquivo por vez.
+
+        """
+        self._prefix = prefix.encode("utf-8")
+        self._filepath = filepath
+        self._suffix = suffix.encode("utf-8")
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        # As aspas do ``repr`` são escapadas no XML como ``&#39;``.
+        return (
+            len(self._prefix)
+            + base_64_length(self._filepath)
+            + 8
+            + len(self._suffix)
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._prefix
+        for chunk in base_64_stream(self._filepath, self._chunk_size):
+            yield chunk.replace(b"'", b"&#39;")
+        yield self._suffix
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        import asyncio
+
+        chunks = iter(self)
+        while (
+            chunk := await asyncio.to_thread(next, chunks, None)
+        ) is not None:
+            yield chunk
+
+
+class EncodedBody(StreamingBody):
+    """
+    Corpo de requisição já codificado, lido de um arquivo temporário.
+
+    Produzido quando o anexo é codificado em outro processo, que escreve o
+    corpo em um arquivo em vez de enviar o mesmo pelo pickle. O arquivo é
+    removido depois de enviado.
+    """
+
+    __slots__ = ("_path", "_size")
+
+    def __init__(self, path: Path, chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        Corpo de requisição já codificado.
+
+        Parameters
+        ----------
+        path : Path
+            Caminho do arquivo com o corpo inteiro.
+        chunk_size : int, optional
+            Quantidade de bytes lidos do arquivo por vez.
+
+        """
+        self._path = path
+        self._size = path.stat().st_size
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[bytes]:
+        with self._path.open("rb") as f:
+            while chunk := f.read(self._chunk_size):
+                yield chunk
+        self._path.unlink(missing_ok=True)
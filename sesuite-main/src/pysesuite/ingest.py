@@ -0,0 +1,315 @@
+"""
+Criação de instâncias em massa a partir de arquivos CSV ou JSONL.
+
+As linhas do arquivo passam por uma sequência de geradores, lidas, convertidas
+para os argumentos de ``new_workflow_edit_data`` e enviadas por um pool de
+threads com uma quantidade limitada de chamadas pendentes. Assim, o arquivo
+nunca é carregado inteiro na memória.
+
+Cada instância criada é registrada em um diário, permitindo que uma execução
+interrompida seja retomada sem criar as mesmas instâncias novamente.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .attributes import EntityList, RelationshipTable
+from .batch import imap
+from .exceptions import FormError, WorkflowError
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+    from pathlib import Path
+
+    from typing_extensions import Self
+
+    from .results import WorkflowRecord
+    from .sesuite import Sesuite
+
+
+def read_rows(path: Path, file_format: str | None = None) -> Iterator[dict]:
+    """
+    Lê as linhas do arquivo, uma de cada vez.
+
+    Parameters
+    ----------
+    path : Path
+        O arquivo CSV, com cabeçalho, ou JSONL, com um objeto por linha.
+    file_format : {"csv", "jsonl"}, optional
+        O formato do arquivo, por padrão definido pela extensão.
+
+    Yields
+    ------
+    dict
+        Os valores de cada coluna da linha.
+
+    """
+    file_format = file_format or path.suffix.lstrip(".").lower()
+
+    with path.open(encoding="utf-8", newline="") as file:
+        if file_format == "csv":
+            yield from csv.DictReader(file)
+        elif file_format in ("jsonl", "ndjson"):
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            error = f"Formato de arquivo não suportado: {file_format!r}."
+            raise ValueError(error)
+
+
+@dataclass(slots=True)
+class ColumnMapping:
+    """
+    Conversão das colunas do arquivo para os campos do formulário.
+
+    Attributes
+    ----------
+    process_id : str
+        Identificador do processo.
+    workflow_title : str
+        Título das instâncias, pode utilizar as colunas da linha, como
+        ``"Pedido {numero}"``.
+    entity_id : str, by default ""
+        Identificador da tabela do formulário.
+    entities : Mapping of str and str, optional
+        O campo do formulário de cada coluna. Por padrão, todas as colunas que
+        não são utilizadas em outro lugar, com o mesmo nome.
+    relationships : Mapping of str and tuple of str, optional
+        O relacionamento e o campo do mesmo de cada coluna.
+    user_id_column : str, optional
+        Coluna com o usuário que cria a instância.
+    key_column : str, optional
+        Coluna que identifica a linha no diário. Por padrão, a posição da
+        linha no arquivo.
+
+    """
+
+    process_id: str
+    workflow_title: str
+    entity_id: str = ""
+    entities: Mapping[str, str] | None = None
+    relationships: Mapping[str, tuple[str, str]] = field(default_factory=dict)
+    user_id_column: str | None = None
+    key_column: str | None = None
+
+    def key(self, position: int, row: Mapping[str, Any]) -> str:
+        """Identificador da linha no diário."""
+        if self.key_column is None:
+            return str(position)
+        return str(row[self.key_column])
+
+    def arguments(self, row: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Converte a linha nos argumentos de ``new_workflow_edit_data``.
+
+        Parameters
+        ----------
+        row : Mapping of str and Any
+            Os valores de cada coluna da linha.
+
+        Returns
+        -------
+        dict of str and Any
+            Os argumentos da chamada.
+
+        """
+        entities = self.entities
+        if entities is None:
+            used = {self.user_id_column, self.key_column, *self.relationships}
+            entities = {column: column for column in row if column not in used}
+
+        entity_list = EntityList()
+        for column, field_id in entities.items():
+            if row.get(column) is not None:
+                entity_list.append(field_id, row[column])
+
+        relationship_list = RelationshipTable()
+        for column, (relationship_id, field_id) in self.relationships.items():
+            if row.get(column) is not None:
+                relationship_list.append(relationship_id, field_id, row[column])
+
+        return {
+            "user_id": row[self.user_id_column]
+            if self.user_id_column
+            else None,
+            "process_id": self.process_id,
+            "workflow_title": self.workflow_title.format_map(row),
+            "entity_id": self.entity_id,
+            "entity_list": entity_list,
+            "relationship_list": relationship_list,
+        }
+
+
+class Journal:
+    """
+    Diário das linhas enviadas, em um arquivo JSONL.
+
+    Cada linha criada com sucesso é registrada com o ``RecordID`` retornado, e
+    é ignorada nas próximas execuções. As falhas também são registradas, mas
+    são enviadas novamente. Pode ser utilizado por várias threads.
+
+    Parameters
+    ----------
+    path : Path
+        O arquivo do diário, criado caso não exista.
+
+    """
+
+    __slots__ = ("_done", "_file", "_lock", "path")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._done: set[str] = set()
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Linha incompleta, escrita durante uma interrupção.
+                        continue
+                    if "record_id" in entry:
+                        self._done.add(entry["key"])
+
+        self._file = self.path.open("a", encoding="utf-8")
+        return self
+
+    def __exit__(
+        self,
+        _type: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def record(self, key: str, record: WorkflowRecord) -> None:
+        """Registra a linha criada."""
+        with self._lock:
+            self._done.add(key)
+            self._write({"key": key, "record_id": record.record_id})
+
+    def fail(self, key: str, error: Exception) -> None:
+        """Registra a linha que falhou."""
+        with self._lock:
+            self._write({"key": key, "error": str(error)})
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        # Escrito imediatamente, para sobreviver à interrupção do processo.
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+
+class IngestReport(NamedTuple):
+    """
+    Resumo da criação das instâncias.
+
+    Attributes
+    ----------
+    created : int
+        Quantidade de instâncias criadas.
+    skipped : int
+        Quantidade de linhas ignoradas, criadas em execuções anteriores.
+    failed : int
+        Quantidade de linhas que falharam.
+
+    """
+
+    created: int
+    skipped: int
+    failed: int
+
+
+def ingest(
+    sesuite: Sesuite,
+    rows: Iterable[Mapping[str, Any]],
+    mapping: ColumnMapping,
+    journal: Journal,
+    *,
+    max_workers: int = 8,
+    on_result: Callable[[str, WorkflowRecord | Exception], None] | None = None,
+) -> IngestReport:
+    """
+    Cria uma instância para cada linha ainda não registrada no diário.
+
+    Parameters
+    ----------
+    sesuite : Sesuite
+        O cliente, já iniciado.
+    rows : Iterable of Mapping
+        As linhas, consumidas aos poucos.
+    mapping : ColumnMapping
+        A conversão das colunas para os campos do formulário.
+    journal : Journal
+        O diário, já aberto.
+    max_workers : int, by default 8
+        Quantidade de threads.
+    on_result : Callable, optional
+        Recebe o identificador e o resultado de cada linha enviada, a
+        instância criada, o erro retornado pelo Sesuite ou o erro de conexão.
+
+    Returns
+    -------
+    IngestReport
+        O resumo da execução.
+
+    """
+    import requests
+
+    skipped = 0
+
+    def pending() -> Iterator[dict[str, Any]]:
+        nonlocal skipped
+        for position, row in enumerate(rows, start=1):
+            key = mapping.key(position, row)
+            if key in journal:
+                skipped += 1
+            else:
+                yield {"key": key, "arguments": mapping.arguments(row)}
+
+    # O diário é escrito pelas threads, assim as chamadas que terminarem
+    # durante uma interrupção também são registradas.
+    def create(
+        key: str, arguments: dict[str, Any]
+    ) -> tuple[str, WorkflowRecord | Exception]:
+        try:
+            record = sesuite.new_workflow_edit_data(**arguments)
+        # Os erros de conexão também são registrados, e a linha é enviada
+        # novamente ao executar outra vez com o mesmo diário.
+        except (WorkflowError, FormError, requests.RequestException) as error:
+            journal.fail(key, error)
+            return key, error
+
+        journal.record(key, record)
+        return key, record
+
+    created = failed = 0
+    for key, result in imap(
+        create, pending(), max_workers=max_workers, ordered=False
+    ):
+        if isinstance(result, Exception):
+            failed += 1
+        else:
+            created += 1
+        if on_result is not None:
+            on_result(key, result)
+
+    return IngestReport(created, skipped, failed)
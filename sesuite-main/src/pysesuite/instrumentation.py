@@ -0,0 +1,387 @@
+"""
+Medições das chamadas feitas ao Web Service do Sesuite.
+
+Cada chamada é dividida em fases, cujo tempo é informado à instrumentação
+configurada no cliente, junto com contadores de requisições, bytes e erros.
+No formato compacto, os bytes economizados são contados em ``bytes_saved``.
+Com um limite adaptativo, o limite atual é informado em ``concurrency_limit``.
+
+Classes
+-------
+Instrumentation
+    Recebe as medições, sobrescreva os métodos para utilizar as mesmas.
+Instruments
+    Repassa as medições para várias instrumentações.
+Metrics
+    Guarda as medições em memória, em histogramas.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import threading
+import time
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .compression import CompressedBody
+    from .files import StreamingBody
+
+
+class Phase(StrEnum):
+    """Fase de uma chamada ao Web Service do Sesuite."""
+
+    render = "render"
+    encode = "encode"
+    send = "send"
+    wait = "wait"
+    parse = "parse"
+
+
+class Instrumentation:
+    """
+    Recebe as medições das chamadas ao Web Service do Sesuite.
+
+    Os métodos não fazem nada, sobrescreva os mesmos para receber as medições.
+
+    Os contadores informados são ``requests``, ``request_bytes``,
+    ``response_bytes``, ``bytes_saved`` e ``errors.<Erro>``, como
+    ``errors.WorkflowError``. Os bytes são contados como enviados e recebidos
+    pela rede, comprimidos ou não, e ``request_raw_bytes`` e
+    ``response_raw_bytes`` contam os mesmos corpos sem a compressão.
+
+    O valor informado é ``concurrency_limit``, o limite de chamadas
+    simultâneas ao componente da ação, com um :class:`ConcurrencyLimiter`.
+    """
+
+    def timing(self, action: str, phase: Phase, seconds: float) -> None:
+        """
+        Recebe o tempo de uma fase da chamada.
+
+        Parameters
+        ----------
+        action : str
+            Ação SOAP da chamada.
+        phase : Phase
+            Fase da chamada.
+        seconds : float
+            Duração da fase, em segundos.
+
+        """
+
+    def count(self, action: str, name: str, value: int = 1) -> None:
+        """
+        Incrementa um contador.
+
+        Parameters
+        ----------
+        action : str
+            Ação SOAP da chamada.
+        name : str
+            Nome do contador.
+        value : int, by default 1
+            Valor a ser somado ao contador.
+
+        """
+
+    def gauge(self, action: str, name: str, value: float) -> None:
+        """
+        Informa o valor atual de uma medida.
+
+        Parameters
+        ----------
+        action : str
+            Ação SOAP da chamada.
+        name : str
+            Nome da medida.
+        value : float
+            O valor atual, que substitui o anterior.
+
+        """
+
+
+class Instruments(Instrumentation):
+    """Repassa as medições para várias instrumentações."""
+
+    def __init__(self, *instruments: Instrumentation) -> None:
+        self._instruments = instruments
+
+    def timing(self, action: str, phase: Phase, seconds: float) -> None:
+        for instrument in self._instruments:
+            instrument.timing(action, phase, seconds)
+
+    def count(self, action: str, name: str, value: int = 1) -> None:
+        for instrument in self._instruments:
+            instrument.count(action, name, value)
+
+    def gauge(self, action: str, name: str, value: float) -> None:
+        for instrument in self._instruments:
+            instrument.gauge(action, name, value)
+
+
+# Limites superiores, em segundos, de cada faixa dos histogramas.
+BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+)
+
+
+class Histogram:
+    """Distribuição das durações de uma fase."""
+
+    __slots__ = ("buckets", "count", "maximum", "minimum", "total")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Adiciona uma duração ao histograma."""
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estima o quantil pelas faixas do histograma.
+
+        Parameters
+        ----------
+        q : float
+            O quantil, entre 0 e 1.
+
+        Returns
+        -------
+        float
+            O limite superior da faixa que contém o quantil.
+
+        """
+        rank = q * self.count
+        seen = 0
+        for bound, amount in zip(BUCKETS, self.buckets, strict=False):
+            seen += amount
+            if seen >= rank:
+                return max(self.minimum, min(bound, self.maximum))
+
+        return self.maximum
+
+    def summary(self) -> dict[str, float]:
+        """Resumo do histograma."""
+        if not self.count:
+            return {"count": 0, "sum": 0.0}
+
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.total / self.count,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class Metrics(Instrumentation):
+    """
+    Guarda as medições em memória.
+
+    Examples
+    --------
+    >>> metrics = Metrics()
+    >>> with Sesuite(auth, instrumentation=metrics) as sesuite:
+    ...     sesuite.execute_activity(...)
+    >>> print(metrics.to_prometheus())
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._timings: dict[tuple[str, Phase], Histogram] = {}
+        self._counters: dict[tuple[str, str], int] = {}
+        self._gauges: dict[tuple[str, str], float] = {}
+
+    def timing(self, action: str, phase: Phase, seconds: float) -> None:
+        with self._lock:
+            histogram = self._timings.get((action, phase))
+            if histogram is None:
+                histogram = self._timings[action, phase] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, action: str, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[action, name] = (
+                self._counters.get((action, name), 0) + value
+            )
+
+    def gauge(self, action: str, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[action, name] = value
+
+    def reset(self) -> None:
+        """Descarta todas as medições."""
+        with self._lock:
+            self._timings.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Retorna as medições atuais.
+
+        Returns
+        -------
+        dict of str and Any
+            Os resumos das durações de cada ação e fase, em ``timings``, os
+            contadores de cada ação, em ``counters``, e as medidas de cada
+            ação, em ``gauges``.
+
+        """
+        timings: dict[str, dict[str, dict[str, float]]] = {}
+        counters: dict[str, dict[str, int]] = {}
+        gauges: dict[str, dict[str, float]] = {}
+        with self._lock:
+            for (action, phase), histogram in self._timings.items():
+                timings.setdefault(action, {})[phase] = histogram.summary()
+            for (action, name), value in self._counters.items():
+                counters.setdefault(action, {})[name] = value
+            for (action, name), value in self._gauges.items():
+                gauges.setdefault(action, {})[name] = value
+
+        return {"timings": timings, "counters": counters, "gauges": gauges}
+
+    def to_json(self) -> str:
+        """Retorna as medições atuais em JSON."""
+        return json.dumps(self.snapshot())
+
+    def to_prometheus(self, prefix: str = "pysesuite") -> str:
+        """
+        Retorna as medições atuais no formato de texto do Prometheus.
+
+        Parameters
+        ----------
+        prefix : str, by default "pysesuite"
+            Prefixo do nome das métricas.
+
+        Returns
+        -------
+        str
+            As métricas no formato de exposição do Prometheus.
+
+        """
+        return "".join(self._prometheus_lines(prefix))
+
+    def _prometheus_lines(self, prefix: str) -> Iterator[str]:
+        with self._lock:
+            timings = sorted(self._timings.items())
+            counters = sorted(self._counters.items())
+            gauges = sorted(self._gauges.items())
+
+        name = f"{prefix}_phase_seconds"
+        yield f"# TYPE {name} histogram\n"
+        for (action, phase), histogram in timings:
+            labels = f'action="{action}",phase="{phase}"'
+            seen = 0
+            for bound, amount in zip(BUCKETS, histogram.buckets, strict=False):
+                seen += amount
+                yield f'{name}_bucket{{{labels},le="{bound}"}} {seen}\n'
+            yield f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}\n'
+            yield f"{name}_sum{{{labels}}} {histogram.total}\n"
+            yield f"{name}_count{{{labels}}} {histogram.count}\n"
+
+        declared: set[str] = set()
+        for (action, counter), value in counters:
+            name = f"{prefix}_{counter.replace('.', '_')}_total"
+            if name not in declared:
+                declared.add(name)
+                yield f"# TYPE {name} counter\n"
+            yield f'{name}{{action="{action}"}} {value}\n'
+
+        for (action, gauge), value in gauges:
+            name = f"{prefix}_{gauge.replace('.', '_')}"
+            if name not in declared:
+                declared.add(name)
+                yield f"# TYPE {name} gauge\n"
+            yield f'{name}{{action="{action}"}} {value}\n'
+
+
+class Measurement:
+    """Tempos das fases de uma única chamada."""
+
+    __slots__ = ("_phases", "action")
+
+    def __init__(self, action: str) -> None:
+        self.action = action
+        self._phases: dict[Phase, float] = {}
+
+    def add(self, phase: Phase, seconds: float) -> None:
+        """Soma a duração à fase."""
+        self._phases[phase] = self._phases.get(phase, 0.0) + seconds
+
+    def report(self, instrumentation: Instrumentation) -> None:
+        """Informa os tempos de todas as fases à instrumentação."""
+        for phase, seconds in self._phases.items():
+            instrumentation.timing(self.action, phase, seconds)
+
+
+class TimedBody:
+    """
+    Corpo de requisição que mede o tempo de envio.
+
+    O tempo gasto produzindo cada pedaço do corpo, como a codificação em
+    base64 dos anexos, é separado do tempo gasto enviando os mesmos. A
+    quantidade de bytes enviados é somada em ``size``.
+    """
+
+    __slots__ = ("_body", "encode", "sent", "size")
+
+    def __init__(self, body: bytes | StreamingBody | CompressedBody) -> None:
+        self._body = body
+        self.encode = 0.0
+        self.sent: float | None = None
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._body)
+
+    def __iter__(self) -> Iterator[bytes]:
+        if isinstance(self._body, bytes):
+            self.size = len(self._body)
+            yield self._body
+        else:
+            chunks = iter(self._body)
+            while True:
+                start = time.perf_counter()
+                chunk = next(chunks, None)
+                self.encode += time.perf_counter() - start
+                if chunk is None:
+                    break
+                self.size += len(chunk)
+                yield chunk
+
+        self.sent = time.perf_counter()
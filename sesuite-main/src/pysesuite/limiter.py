@@ -0,0 +1,261 @@
+"""
+Limite adaptativo de chamadas simultâneas a cada componente do Web Service.
+
+O limite de cada componente cresce aos poucos enquanto as chamadas são
+respondidas sem falhas e sem aumento da latência, e diminui rapidamente quando
+o gateway falha ou fica lento, seguindo o AIMD: soma 1 a cada rodada de
+chamadas e multiplica por ``backoff`` a cada sinal de sobrecarga. Assim, a
+quantidade de chamadas em andamento acompanha a capacidade do gateway ao longo
+do dia, em vez de um número fixo de threads.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from .components import Components
+
+
+class _Endpoint:
+    """Estado do limite de um componente."""
+
+    __slots__ = (
+        "baseline",
+        "condition",
+        "decreased_at",
+        "in_flight",
+        "latency",
+        "limit",
+        "waiters",
+    )
+
+    def __init__(self, limit: float, lock: threading.Lock) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.baseline: float | None = None
+        self.latency: float | None = None
+        self.decreased_at = 0.0
+        self.condition = threading.Condition(lock)
+        self.waiters: deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = deque()
+
+
+class ConcurrencyLimiter:
+    """
+    Limita as chamadas simultâneas a cada componente, ajustando o limite.
+
+    São sinais de sobrecarga os erros de conexão, as respostas HTTP 429 e 5xx
+    e as chamadas com latência acima de ``tolerance`` vezes a latência de
+    referência do componente, a menor latência observada, que sobe aos poucos
+    para acompanhar as mudanças do gateway. O limite diminui no máximo uma vez
+    a cada latência média, já que as chamadas em andamento sofrem a mesma
+    sobrecarga.
+
+    Pode ser compartilhado entre várias threads e tarefas assíncronas.
+
+    Parameters
+    ----------
+    initial_limit : int, by default 10
+        O limite inicial de cada componente.
+    min_limit : int, by default 1
+        O menor limite.
+    max_limit : int, by default 200
+        O maior limite.
+    backoff : float, by default 0.9
+        Fator aplicado ao limite a cada sinal de sobrecarga.
+    tolerance : float, by default 2.0
+        Quantas vezes a latência de referência uma chamada pode levar sem ser
+        considerada lenta.
+
+    Examples
+    --------
+    >>> limiter = ConcurrencyLimiter(max_limit=64)
+    >>> with Sesuite(auth, limiter=limiter) as sesuite:
+    ...     for result in sesuite.map(
+    ...         "execute_activity", arguments, max_workers=64
+    ...     ):
+    ...         ...
+    >>> limiter.limits()
+
+    """
+
+    __slots__ = (
+        "_endpoints",
+        "_lock",
+        "backoff",
+        "initial_limit",
+        "max_limit",
+        "min_limit",
+        "tolerance",
+    )
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff: float = 0.9,
+        tolerance: float = 2.0,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            error = "Os limites devem respeitar 1 <= min <= inicial <= max."
+            raise ValueError(error)
+
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self._lock = threading.Lock()
+        self._endpoints: dict[Components, _Endpoint] = {}
+
+    def _endpoint(self, component: Components) -> _Endpoint:
+        endpoint = self._endpoints.get(component)
+        if endpoint is None:
+            endpoint = self._endpoints[component] = _Endpoint(
+                self.initial_limit, self._lock
+            )
+        return endpoint
+
+    def limit(self, component: Components) -> int:
+        """O limite atual do componente."""
+        with self._lock:
+            return int(self._endpoint(component).limit)
+
+    def limits(self) -> dict[Components, int]:
+        """O limite atual de cada componente já utilizado."""
+        with self._lock:
+            return {
+                component: int(endpoint.limit)
+                for component, endpoint in self._endpoints.items()
+            }
+
+    def acquire(self, component: Components) -> None:
+        """
+        Aguarda uma vaga para a chamada ao componente.
+
+        Parameters
+        ----------
+        component : Components
+            O componente da chamada, que deve ser devolvida com
+            :meth:`release`.
+
+        """
+        with self._lock:
+            endpoint = self._endpoint(component)
+            while endpoint.in_flight >= int(endpoint.limit):
+                endpoint.condition.wait()
+            endpoint.in_flight += 1
+
+    async def acquire_async(self, component: Components) -> None:
+        """
+        Aguarda uma vaga para a chamada ao componente, sem bloquear o loop.
+
+        Parameters
+        ----------
+        component : Components
+            O componente da chamada, que deve ser devolvida com
+            :meth:`release`.
+
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            endpoint = self._endpoint(component)
+            if endpoint.in_flight < int(endpoint.limit):
+                endpoint.in_flight += 1
+                return
+
+            waiter = (loop, loop.create_future())
+            endpoint.waiters.append(waiter)
+
+        # A vaga é reservada por ``release`` antes de acordar a tarefa.
+        future = waiter[1]
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in endpoint.waiters:
+                    endpoint.waiters.remove(waiter)
+                elif future.done() and not future.cancelled():
+                    self._return(endpoint)
+            raise
+
+    def release(
+        self, component: Components, latency: float, *, failed: bool
+    ) -> None:
+        """
+        Devolve a vaga e ajusta o limite do componente.
+
+        Parameters
+        ----------
+        component : Components
+            O componente da chamada.
+        latency : float
+            Duração da chamada, em segundos.
+        failed : bool
+            Se a chamada falhou por um erro de conexão ou do gateway.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            endpoint = self._endpoint(component)
+            if not failed:
+                endpoint.baseline = (
+                    latency
+                    if endpoint.baseline is None or latency < endpoint.baseline
+                    # Sobe aos poucos, caso a latência mínima aumente.
+                    else endpoint.baseline
+                    + 0.01 * (latency - endpoint.baseline)
+                )
+                endpoint.latency = (
+                    latency
+                    if endpoint.latency is None
+                    else 0.8 * endpoint.latency + 0.2 * latency
+                )
+
+            slow = (
+                endpoint.baseline is not None
+                and latency > self.tolerance * endpoint.baseline
+            )
+            if failed or slow:
+                if now >= endpoint.decreased_at + (endpoint.latency or 0.0):
+                    endpoint.decreased_at = now
+                    endpoint.limit = max(
+                        self.min_limit, endpoint.limit * self.backoff
+                    )
+            # Só cresce quando o limite está sendo utilizado.
+            elif endpoint.in_flight >= endpoint.limit / 2:
+                endpoint.limit = min(
+                    self.max_limit, endpoint.limit + 1 / endpoint.limit
+                )
+
+            self._return(endpoint)
+
+    def _return(self, endpoint: _Endpoint) -> None:
+        endpoint.in_flight -= 1
+        while endpoint.waiters and endpoint.in_flight < int(endpoint.limit):
+            loop, future = endpoint.waiters.popleft()
+            endpoint.in_flight += 1
+            loop.call_soon_threadsafe(self._wake, endpoint, future)
+
+        free = int(endpoint.limit) - endpoint.in_flight
+        if free > 0:
+            endpoint.condition.notify(free)
+
+    def _wake(self, endpoint: _Endpoint, future: asyncio.Future[None]) -> None:
+        # A tarefa foi cancelada depois de receber a vaga.
+        if future.cancelled():
+            with self._lock:
+                self._return(endpoint)
+        else:
+            future.set_result(None)
@@ -0,0 +1,264 @@
+"""
+Montagem dos envelopes e análise das respostas em um pool de processos.
+
+Nas chamadas em lote, a renderização dos templates, a codificação dos anexos
+em base64 e a análise do XML das respostas disputam o GIL com as threads que
+fazem as chamadas, e o processo utiliza apenas um núcleo. Com um
+:class:`Offload`, esse trabalho é feito em outros processos, enquanto as
+chamadas continuam nas threads do :class:`Sesuite`.
+
+Os anexos são codificados em arquivos temporários, lidos diretamente pela
+thread que envia os mesmos, em vez de voltarem ao processo principal pelo
+pickle.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .files import EncodedBody, StreamingBody
+from .parsing import Response, backends
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Callable, Iterable, Mapping
+
+    from typing_extensions import Self
+
+    from .operations import Operation, T
+
+
+def _materialize(value: Any) -> Any:
+    # Os geradores, como os de ``utils.entity``, não passam pelo pickle.
+    return list(value) if isinstance(value, Iterator) else value
+
+
+def _build(
+    build: Callable[..., Operation[T]],
+    args: tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+    compact: bool,
+    savings: bool,
+    folder: Path,
+) -> tuple[Operation[T], int | None]:
+    operation = build(*args, compact=compact, **kwargs)
+    saved = None
+    if savings and operation.savings is not None:
+        saved = operation.savings()
+
+    body = operation.body
+    if isinstance(body, StreamingBody):
+        with tempfile.NamedTemporaryFile(dir=folder, delete=False) as file:
+            for chunk in body:
+                file.write(chunk)
+        body = EncodedBody(Path(file.name))
+
+    # O ``savings`` é uma closure, que não pode voltar pelo pickle.
+    return dataclasses.replace(operation, body=body, savings=None), saved
+
+
+def _parse(parse: Callable[[Response], T], content: bytes) -> T:
+    return parse(Response(content))
+
+
+def _initialize(backend: str) -> None:
+    backends.configure(backend=backend)
+
+
+def _context() -> multiprocessing.context.BaseContext:
+    # O ``fork`` de um processo com threads pode travar os filhos.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+class Offload:
+    """
+    Pool de processos para a montagem dos envelopes e análise das respostas.
+
+    Como em todo pool de processos, o script deve estar protegido por
+    ``if __name__ == "__main__":``. Os argumentos das chamadas e os resultados
+    são enviados entre os processos pelo pickle.
+
+    As respostas são enviadas inteiras aos processos, então o
+    ``Transport.stream`` não tem efeito com um :class:`Offload`: o corpo de
+    cada resposta é lido até o fim, e guardado em memória, antes da análise.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Quantidade de processos, por padrão a quantidade de núcleos.
+
+    Examples
+    --------
+    >>> with Offload() as offload, Sesuite(auth, offload=offload) as sesuite:
+    ...     for result in sesuite.map(
+    ...         "new_attachment", attachments, max_workers=32
+    ...     ):
+    ...         ...
+
+    """
+
+    __slots__ = ("_executor", "_folder", "max_workers")
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Os processos utilizam a mesma implementação de XML do principal.
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=_context(),
+            initializer=_initialize,
+            initargs=(backends.backend().name,),
+        )
+        self._folder = tempfile.TemporaryDirectory(prefix="pysesuite-")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        _type: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Encerra os processos e remove os anexos que não foram enviados."""
+        self._executor.shutdown()
+        self._folder.cleanup()
+
+    def build(
+        self,
+        build: Callable[..., Operation[T]],
+        args: tuple[Any, ...],
+        kwargs: Mapping[str, Any],
+        *,
+        compact: bool = False,
+        savings: bool = False,
+    ) -> Operation[T]:
+        """
+        Monta a operação em um dos processos.
+
+        Parameters
+        ----------
+        build : Callable
+            A função do módulo ``operations`` que monta a operação.
+        args : tuple
+            Os argumentos posicionais de ``build``.
+        kwargs : Mapping of str and Any
+            Os keyword arguments de ``build``. Os geradores são consumidos
+            antes do envio ao processo.
+        compact : bool, by default False
+            Se o envelope deve ser montado no formato compacto.
+        savings : bool, by default False
+            Se os bytes economizados pelo formato compacto devem ser
+            calculados.
+
+        Returns
+        -------
+        Operation
+            A operação montada, com os anexos já codificados.
+
+        """
+        return self._restore(
+            *self._executor.submit(
+                _build,
+                build,
+                tuple(map(_materialize, args)),
+                {name: _materialize(value) for name, value in kwargs.items()},
+                compact,
+                savings,
+                Path(self._folder.name),
+            ).result()
+        )
+
+    def build_many(
+        self,
+        build: Callable[..., Operation[T]],
+        kwargs_iterable: Iterable[Mapping[str, Any]],
+        *,
+        compact: bool = False,
+        savings: bool = False,
+    ) -> list[Operation[T]]:
+        """
+        Monta várias operações, divididas entre os processos.
+
+        Parameters
+        ----------
+        build : Callable
+            A função do módulo ``operations`` que monta as operações.
+        kwargs_iterable : Iterable of Mapping
+            Os keyword arguments de cada operação.
+        compact : bool, by default False
+            Se os envelopes devem ser montados no formato compacto.
+        savings : bool, by default False
+            Se os bytes economizados pelo formato compacto devem ser
+            calculados.
+
+        Returns
+        -------
+        list of Operation
+            As operações, na ordem dos argumentos.
+
+        """
+        kwargs_list = [
+            {name: _materialize(value) for name, value in kwargs.items()}
+            for kwargs in kwargs_iterable
+        ]
+        folder = Path(self._folder.name)
+
+        results = self._executor.map(
+            _build,
+            repeat(build),
+            repeat(()),
+            kwargs_list,
+            repeat(compact),
+            repeat(savings),
+            repeat(folder),
+            # Envia as operações em lotes, dividindo o pickle entre poucas
+            # mensagens.
+            chunksize=max(1, len(kwargs_list) // (self.max_workers * 4)),
+        )
+
+        return [self._restore(*result) for result in results]
+
+    def parse(self, parse: Callable[[Response], T], content: bytes) -> T:
+        """
+        Analisa a resposta em um dos processos.
+
+        Parameters
+        ----------
+        parse : Callable
+            A função da operação que interpreta a resposta.
+        content : bytes
+            O corpo da resposta.
+
+        Returns
+        -------
+        T
+            O resultado da operação.
+
+        Raises
+        ------
+        WorkflowError or FormError
+            Caso o Sesuite tenha retornado uma falha.
+
+        """
+        return self._executor.submit(_parse, parse, content).result()
+
+    @staticmethod
+    def _restore(operation: Operation[T], saved: int | None) -> Operation[T]:
+        if saved is None:
+            return operation
+
+        return dataclasses.replace(operation, savings=lambda: saved)
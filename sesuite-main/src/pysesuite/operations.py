@@ -0,0 +1,358 @@
+"""
+As operações do Web Service do Sesuite, independentes do cliente HTTP.
+
+Cada função monta o envelope SOAP de uma ação e sabe interpretar a resposta
+da mesma, permitindo que os clientes síncrono e assíncrono compartilhem a
+mesma lógica.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from .actions import SOAPAction
+from .attributes import EntityList, RelationshipTable
+from .components import Components
+from .exceptions import FormError, WorkflowError
+from .files import StreamingBody
+from .render import render
+from .results import TableRecord, WorkflowRecord
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from .attributes import Entity, Relationship, TableField
+    from .parsing import Response
+
+T = TypeVar("T")
+
+# Marca o lugar do conteúdo do anexo no envelope, que é enviado aos poucos.
+_CONTENT_MARKER = "__pysesuite_file_content__"
+
+
+@dataclass(slots=True, frozen=True)
+class Operation(Generic[T]):
+    """
+    Uma chamada ao Web Service do Sesuite.
+
+    Attributes
+    ----------
+    component : Components
+        Componente do SeSuite que será utilizado.
+    soap_action : SOAPAction
+        Ação que o Web Service está chamando.
+    body : bytes or StreamingBody
+        Corpo XML da requisição, codificado em UTF-8.
+    parse : Callable
+        Função que interpreta a resposta da API.
+    savings : Callable, optional
+        No formato compacto, função que calcula quantos bytes foram
+        economizados em relação ao formato indentado.
+
+    """
+
+    component: Components
+    soap_action: SOAPAction
+    body: bytes | StreamingBody
+    parse: Callable[[Response], T]
+    savings: Callable[[], int] | None = None
+
+    def headers(self, auth: str) -> dict[str, str]:
+        """
+        Cabeçalhos HTTP da requisição.
+
+        Parameters
+        ----------
+        auth : str
+            Token de autorização do usuário.
+
+        Returns
+        -------
+        dict of str and str
+            Os cabeçalhos da requisição.
+
+        """
+        return {
+            "Authorization": auth,
+            "Content-Type": "text/xml; charset=utf-8",
+            "SOAPAction": f"urn:{self.component}#{self.soap_action}",
+        }
+
+
+def _render(
+    template_name: str, *, compact: bool, **kwargs: object
+) -> tuple[str, Callable[[], int] | None]:
+    """
+    Renderiza o envelope, no formato indentado ou compacto.
+
+    Parameters
+    ----------
+    template_name : str
+        O nome do template.
+    compact : bool
+        Se o envelope deve ser gerado sem quebras de linha e indentação, com
+        os campos de cada linha dos relacionamentos agrupados.
+    **kwargs
+        Argumentos passados ao template, os atributos devem estar em um
+        :class:`EntityList` ou :class:`RelationshipTable`.
+
+    Returns
+    -------
+    str
+        O envelope.
+    Callable or None
+        No formato compacto, a função que calcula os bytes economizados.
+
+    """
+    if not compact:
+        return render(template_name, **kwargs), None
+
+    from markupsafe import Markup
+
+    envelope = render(
+        template_name,
+        compact=True,
+        **{
+            name: Markup(value.to_xml(compact=True))
+            if isinstance(value, EntityList | RelationshipTable)
+            else value
+            for name, value in kwargs.items()
+        },
+    )
+
+    def savings() -> int:
+        indented = render(template_name, **kwargs)
+        return len(indented.encode("utf-8")) - len(envelope.encode("utf-8"))
+
+    return envelope, savings
+
+
+def _detail(response: Response) -> str | None:
+    response.raise_for_status(WorkflowError)
+
+    return response.detail
+
+
+def _workflow_record(response: Response) -> WorkflowRecord:
+    response.raise_for_status(WorkflowError)
+
+    return WorkflowRecord(response.detail, response.record_id)
+
+
+def _table_record(response: Response) -> TableRecord:
+    response.raise_for_status(FormError)
+
+    return TableRecord(
+        response.detail,
+        response.find_table(
+            Components.Form, "TableFieldID", "TableFieldValues"
+        ),
+    )
+
+
+def execute_activity(
+    *,
+    workflow_id: str,
+    activity_id: str,
+    action_sequence: int,
+    compact: bool = False,
+) -> Operation[str | None]:
+    """Operação de :meth:`Sesuite.execute_activity`."""
+    body, savings = _render(
+        "actions/execute_activity.xml",
+        compact=compact,
+        workflow_id=workflow_id,
+        activity_id=activity_id,
+        action_sequence=action_sequence,
+    )
+
+    return Operation(
+        Components.Workflow,
+        SOAPAction.execute_activity,
+        body.encode("utf-8"),
+        _detail,
+        savings,
+    )
+
+
+def execute_system_activity(
+    *,
+    workflow_id: str,
+    activity_id: str,
+    activity_order: str,
+    compact: bool = False,
+) -> Operation[str | None]:
+    """Operação de :meth:`Sesuite.execute_system_activity`."""
+    body, savings = _render(
+        "actions/execute_system_activity.xml",
+        compact=compact,
+        workflow_id=workflow_id,
+        activity_id=activity_id,
+        activity_order=activity_order,
+    )
+
+    return Operation(
+        Components.Workflow,
+        SOAPAction.execute_system_activity,
+        body.encode("utf-8"),
+        _detail,
+        savings,
+    )
+
+
+def new_workflow_edit_data(
+    user_id: str | None = None,
+    *,
+    process_id: str,
+    workflow_title: str,
+    entity_id: str = "",
+    entity_list: Iterable[Entity] | None = None,
+    relationship_list: Iterable[Relationship] | None = None,
+    compact: bool = False,
+) -> Operation[WorkflowRecord]:
+    """Operação de :meth:`Sesuite.new_workflow_edit_data`."""
+    if compact:
+        entity_list = EntityList.from_attributes(entity_list or ())
+        relationship_list = RelationshipTable.from_attributes(
+            relationship_list or ()
+        )
+
+    body, savings = _render(
+        "actions/new_workflow_edit_data.xml",
+        compact=compact,
+        process_id=process_id,
+        workflow_title=workflow_title,
+        user_id=user_id,
+        entity_id=entity_id,
+        entity_list=entity_list,
+        relationship_list=relationship_list,
+    )
+
+    return Operation(
+        Components.Workflow,
+        SOAPAction.new_workflow_edit_data,
+        body.encode("utf-8"),
+        _workflow_record,
+        savings,
+    )
+
+
+def new_attachment(
+    user_id: str | None = None,
+    *,
+    workflow_id: str,
+    activity_id: str,
+    file_path: Path,
+    compact: bool = False,
+) -> Operation[WorkflowRecord]:
+    """Operação de :meth:`Sesuite.new_attachment`."""
+    envelope, savings = _render(
+        "actions/new_attachment.xml",
+        compact=compact,
+        user_id=user_id,
+        workflow_id=workflow_id,
+        activity_id=activity_id,
+        file_path=file_path,
+        content=_CONTENT_MARKER,
+    )
+    prefix, suffix = envelope.split(_CONTENT_MARKER)
+    body = StreamingBody(prefix, file_path, suffix)
+
+    return Operation(
+        Components.Workflow,
+        SOAPAction.new_attachment,
+        body,
+        _workflow_record,
+        savings,
+    )
+
+
+def get_table_record(
+    *,
+    table_id: str,
+    table_field_list: Iterable[TableField],
+    pagination: int = 1,
+    compact: bool = False,
+) -> Operation[TableRecord]:
+    """Operação de :meth:`Sesuite.get_table_record`."""
+    if compact:
+        # Renderizado duas vezes ao medir a economia.
+        table_field_list = list(table_field_list)
+
+    body, savings = _render(
+        "actions/get_table_record.xml",
+        compact=compact,
+        table_id=table_id,
+        pagination=pagination,
+        table_field_list=table_field_list,
+    )
+
+    return Operation(
+        Components.Form,
+        SOAPAction.get_table_record,
+        body.encode("utf-8"),
+        _table_record,
+        savings,
+    )
+
+
+def cancel_workflow(
+    user_id: str | None,
+    *,
+    workflow_id: int | str,
+    explanation: str,
+    compact: bool = False,
+) -> Operation[str | None]:
+    """Operação de :meth:`Sesuite.cancel_workflow`."""
+    body, savings = _render(
+        "actions/cancel_workflow.xml",
+        compact=compact,
+        workflow_id=workflow_id,
+        explanation=explanation,
+        user_id=user_id,
+    )
+
+    return Operation(
+        Components.Workflow,
+        SOAPAction.cancel_workflow,
+        body.encode("utf-8"),
+        _detail,
+        savings,
+    )
+
+
+def new_child_entity_record(
+    *,
+    workflow_id: str,
+    entity_id: str,
+    entity_attribute: Iterable[Entity],
+    relationship_id: str,
+    relationship_attribute: Iterable[Relationship],
+    compact: bool = False,
+) -> Operation[str | None]:
+    """Operação de :meth:`Sesuite.new_child_entity_record`."""
+    if compact:
+        entity_attribute = EntityList.from_attributes(entity_attribute)
+        relationship_attribute = RelationshipTable.from_attributes(
+            relationship_attribute
+        )
+
+    body, savings = _render(
+        "actions/new_child_entity_record.xml",
+        compact=compact,
+        workflow_id=workflow_id,
+        entity_id=entity_id,
+        entity_attribute=entity_attribute,
+        relationship_id=relationship_id,
+        relationship_attribute=relationship_attribute,
+    )
+
+    return Operation(
+        Components.Workflow,
+        SOAPAction.new_child_entity_record,
+        body.encode("utf-8"),
+        _detail,
+        savings,
+    )
@@ -1,7 +1,19 @@
 """Funções de utilidade para analisar dados XML."""
 
+from .backends import configure as configure
+from .response import Response as Response
+from .response import ResponseParser as ResponseParser
+from .table import Table as Table
 from .utils import get_dict as get_dict
 from .utils import get_many as get_many
 from .utils import get_one as get_one
 
-__all__ = ["get_dict", "get_many", "get_one"]
+__all__ = [
+    "Response",
+    "ResponseParser",
+    "Table",
+    "configure",
+    "get_dict",
+    "get_many",
+    "get_one",
+]
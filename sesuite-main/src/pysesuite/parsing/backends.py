@@ -0,0 +1,248 @@
+"""
+Submódulo com as implementações da análise de XML.
+
+O ``xml.etree.ElementTree`` da biblioteca padrão é utilizado por padrão. O
+``lxml``, uma dependência opcional instalada com ``pip install
+pysesuite[lxml]``, utiliza expressões XPath compiladas uma única vez para cada
+componente e tag, que tornam mais rápidas as buscas do ``Xml`` e do
+``get_dict``. Na análise das respostas pelo ``Response``, que percorre todos
+os elementos em Python, o ``lxml`` não é mais rápido que a biblioteca padrão,
+e a análise incremental utiliza o analisador da biblioteca padrão com as duas
+implementações.
+
+Classes
+-------
+Backend
+    Análise de XML com o ``xml.etree.ElementTree``.
+LxmlBackend
+    Análise de XML com o ``lxml``.
+
+Functions
+---------
+configure
+    Escolhe a implementação utilizada.
+backend
+    Retorna a implementação utilizada.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+from xml.etree import ElementTree as ET
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@functools.cache
+def _path(component: str, tag: str) -> tuple[str, dict[str, str]]:
+    return f".//{component}:{tag}", {component: f"urn:{component}"}
+
+
+class Backend:
+    """Análise de XML com o ``xml.etree.ElementTree``."""
+
+    name = "stdlib"
+
+    def parse(self, data: str | bytes) -> Any:
+        """
+        Analisa o XML.
+
+        Parameters
+        ----------
+        data : str or bytes
+            Os dados XML.
+
+        Returns
+        -------
+        Element
+            O elemento raiz.
+
+        """
+        return ET.fromstring(data)
+
+    def iter_elements(self, data: str | bytes) -> Iterator[Any]:
+        """
+        Analisa o XML, percorrendo os elementos na ordem em que são fechados.
+
+        É a mesma ordem do :meth:`pull_parser`, em que cada elemento vem
+        depois dos seus filhos.
+
+        Parameters
+        ----------
+        data : str or bytes
+            Os dados XML.
+
+        Yields
+        ------
+        Element
+            Cada elemento, com a tag no formato ``{urn:componente}Tag``.
+
+        """
+        parser = self.pull_parser()
+        parser.feed(data)
+        parser.close()
+        return (element for _, element in parser.read_events())
+
+    def find_one(self, root: Any, component: str, tag: str) -> str | None:
+        """
+        Retorna o texto da primeira ocorrência da tag.
+
+        Parameters
+        ----------
+        root : Element
+            O elemento raiz.
+        component : str
+            O componente ao qual a tag pertence.
+        tag : str
+            Nome da tag.
+
+        Returns
+        -------
+        str or None
+            O texto encontrado, ou ``None`` caso a tag não exista.
+
+        """
+        path, namespaces = _path(component, tag)
+        result = root.find(path, namespaces)
+        if result is None:
+            return None
+
+        return result.text
+
+    def find_many(
+        self, root: Any, component: str, tag: str
+    ) -> list[str | None]:
+        """
+        Retorna os textos de todas as ocorrências da tag.
+
+        Parameters
+        ----------
+        root : Element
+            O elemento raiz.
+        component : str
+            O componente ao qual a tag pertence.
+        tag : str
+            Nome da tag.
+
+        Returns
+        -------
+        list of str or None
+            Os textos encontrados, na ordem do documento.
+
+        """
+        path, namespaces = _path(component, tag)
+        return [element.text for element in root.iterfind(path, namespaces)]
+
+    def pull_parser(self) -> Any:
+        """Retorna um analisador incremental, com os eventos ``end``."""
+        return ET.XMLPullParser(("end",))
+
+
+class LxmlBackend(Backend):
+    """
+    Análise de XML com o ``lxml``.
+
+    As entidades externas não são resolvidas e nada é buscado na rede. As
+    expressões XPath de cada componente e tag são compiladas uma única vez,
+    para as buscas do ``Xml``. O :meth:`iter_elements` produz os mesmos
+    elementos que a biblioteca padrão, mas não é mais rápido, já que cada
+    elemento do ``lxml`` é criado ao ser acessado pelo Python.
+
+    Raises
+    ------
+    ImportError
+        Caso o ``lxml`` não esteja instalado.
+
+    """
+
+    name = "lxml"
+
+    def __init__(self) -> None:
+        from lxml import etree
+
+        self._etree = etree
+        self._parser = etree.XMLParser(
+            resolve_entities=False, no_network=True, huge_tree=True
+        )
+        self._xpath = functools.cache(self._compile)
+
+    def _compile(self, component: str, tag: str, first: bool) -> Any:
+        path = f".//c:{tag}"
+        return self._etree.XPath(
+            f"({path})[1]" if first else path,
+            namespaces={"c": f"urn:{component}"},
+        )
+
+    def parse(self, data: str | bytes) -> Any:
+        # O lxml não aceita texto com a declaração de codificação.
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        return self._etree.fromstring(data, self._parser)
+
+    def iter_elements(self, data: str | bytes) -> Iterator[Any]:
+        # Apenas os elementos, sem os comentários e instruções.
+        return (
+            element
+            for _, element in self._etree.iterwalk(
+                self.parse(data), events=("end",), tag=self._etree.Element
+            )
+        )
+
+    def find_one(self, root: Any, component: str, tag: str) -> str | None:
+        result = self._xpath(component, tag, True)(root)
+        if not result:
+            return None
+
+        return result[0].text
+
+    def find_many(
+        self, root: Any, component: str, tag: str
+    ) -> list[str | None]:
+        return [
+            element.text for element in self._xpath(component, tag, False)(root)
+        ]
+
+    # O ``pull_parser`` continua sendo o da biblioteca padrão, que produz o
+    # mesmo índice e é mais rápido que o do lxml ao esvaziar os elementos.
+
+
+BACKENDS: dict[str, type[Backend]] = {
+    Backend.name: Backend,
+    LxmlBackend.name: LxmlBackend,
+}
+
+_backend = Backend()
+
+
+def configure(*, backend: str = "stdlib") -> None:
+    """
+    Escolhe a implementação utilizada na análise das respostas.
+
+    Parameters
+    ----------
+    backend : {"stdlib", "lxml"}, by default "stdlib"
+        O nome da implementação.
+
+    Raises
+    ------
+    ValueError
+        Caso a implementação não exista.
+    ImportError
+        Caso a dependência da implementação não esteja instalada.
+
+    """
+    global _backend  # noqa: PLW0603
+
+    if backend not in BACKENDS:
+        error = f"Implementação de XML desconhecida: {backend!r}."
+        raise ValueError(error)
+
+    _backend = BACKENDS[backend]()
+
+
+def backend() -> Backend:
+    """Retorna a implementação utilizada na análise das respostas."""
+    return _backend
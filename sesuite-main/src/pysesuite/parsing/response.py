@@ -0,0 +1,335 @@
+"""
+Submódulo para representar as respostas do Web Service do Sesuite.
+
+Classes
+-------
+Response
+    Resposta XML analisada uma única vez.
+ResponseParser
+    Analisa a resposta aos poucos, enquanto a mesma é recebida.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+
+from ..components import Components
+from .backends import backend
+from .table import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@functools.cache
+def qualified_tag(component: Components, tag: str) -> str:
+    """
+    Retorna o nome completo da tag, com o namespace do componente.
+
+    Parameters
+    ----------
+    component : Components
+        Componente ao qual a tag pertence.
+    tag : str
+        Nome da tag.
+
+    Returns
+    -------
+    str
+        A tag no formato ``{urn:componente}Tag`` utilizado pelo ElementTree.
+
+    """
+    return f"{{urn:{component.name}}}{tag}"
+
+
+class _Indexer:
+    """
+    Indexa os valores de cada tag, na ordem em que as tags são fechadas.
+
+    Ao fechar cada elemento ``Record``, guarda onde começam e terminam os
+    valores de cada tag contida no mesmo, em ``bounds``, para que as tabelas
+    sejam separadas pelos registros do XML. Só então o registro é esvaziado,
+    liberando os seus elementos.
+    """
+
+    __slots__ = ("bounds", "index", "records")
+
+    def __init__(self) -> None:
+        self.index: dict[str, list[str | None]] = {}
+        self.bounds: dict[str, dict[int, tuple[int, int]]] = {}
+        self.records = 0
+
+    def extend(self, elements: Iterable[Any]) -> None:
+        index = self.index
+        for element in elements:
+            tag = element.tag
+            values = index.get(tag)
+            if values is None:
+                index[tag] = [element.text]
+            else:
+                values.append(element.text)
+
+            if tag.endswith(_RECORD):
+                self._close_record(element)
+
+    def _close_record(self, record: Any) -> None:
+        counts: dict[str, int] = {}
+        for element in record.iter():
+            counts[element.tag] = counts.get(element.tag, 0) + 1
+        # O próprio registro também é percorrido pelo ``iter``.
+        counts[record.tag] -= 1
+
+        for tag, count in counts.items():
+            if count and tag in self.index:
+                end = len(self.index[tag])
+                self.bounds.setdefault(tag, {})[self.records] = (
+                    end - count,
+                    end,
+                )
+        self.records += 1
+        record.clear()
+
+    def response(self) -> Response:
+        response = Response.__new__(Response)
+        response._index = self.index
+        response._bounds = self.bounds
+        response._records = self.records
+        return response
+
+
+# O elemento de cada registro das tabelas, com o namespace.
+_RECORD = "}Record"
+
+
+class Response:
+    """Resposta do Web Service do Sesuite."""
+
+    __slots__ = ("_bounds", "_index", "_records")
+
+    def __init__(self, data: str | bytes) -> None:
+        """
+        Resposta do Web Service do Sesuite.
+
+        O XML é analisado uma única vez, com a implementação escolhida em
+        :func:`configure`, e os valores de todas as tags são indexados em uma
+        única passagem pelos elementos, na ordem em que são fechados.
+
+        Parameters
+        ----------
+        data : str or bytes
+            Os dados XML retornados pela API.
+
+        """
+        indexer = _Indexer()
+        indexer.extend(backend().iter_elements(data))
+        self._index = indexer.index
+        self._bounds = indexer.bounds
+        self._records = indexer.records
+
+    @staticmethod
+    def from_chunks(chunks: Iterable[bytes]) -> Response:
+        """
+        Analisa a resposta aos poucos, enquanto os dados são recebidos.
+
+        Parameters
+        ----------
+        chunks : Iterable of bytes
+            As partes do XML, na ordem em que são recebidas.
+
+        Returns
+        -------
+        Response
+            A resposta analisada.
+
+        See Also
+        --------
+        ResponseParser : Para receber as partes de forma assíncrona.
+
+        """
+        parser = ResponseParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+
+        return parser.close()
+
+    def find_one(self, component: Components, tag: str) -> str | None:
+        """
+        Retorna o valor da primeira ocorrência da tag especificada.
+
+        Parameters
+        ----------
+        component : Components
+            Componente ao qual a tag pertence.
+        tag : str
+            Nome da tag de onde o valor vai ser extraído.
+
+        Returns
+        -------
+        str
+            Valor extraído da tag.
+        None
+            caso não seja encontrado nada, um valor nulo é retornado.
+
+        """
+        values = self._index.get(qualified_tag(component, tag))
+        if not values:
+            return None
+
+        return values[0]
+
+    def find_many(self, component: Components, tag: str) -> list[str | None]:
+        """
+        Retorna os valores de todas as ocorrências da tag especificada.
+
+        Parameters
+        ----------
+        component : Components
+            Componente ao qual a tag pertence.
+        tag : str
+            Nome da tag de onde os valores vão ser extraído.
+
+        Returns
+        -------
+        list of str or None
+            Os valores encontrados, na ordem do documento.
+
+        """
+        return list(self._index.get(qualified_tag(component, tag), ()))
+
+    def find_table(
+        self, component: Components, key_tag: str, value_tag: str
+    ) -> Table:
+        """
+        Retorna os registros formados pelos valores de duas tags.
+
+        Cada elemento ``Record`` do XML é um registro, com os pares de campo e
+        valor contidos no mesmo. Os pares fora de um ``Record`` são ignorados,
+        como os que o ``[1:-3]`` do antigo ``parsing.utils.get_dict``
+        descartava pela posição.
+
+        Parameters
+        ----------
+        component : Components
+            Componente ao qual as tags pertencem.
+        key_tag : str
+            Qual a tag com os identificadores dos campos.
+        value_tag : str
+            Qual a tag com os valores dos campos.
+
+        Returns
+        -------
+        Table
+            Os registros encontrados.
+
+        """
+        key_tag = qualified_tag(component, key_tag)
+        value_tag = qualified_tag(component, value_tag)
+        return Table.from_records(
+            self._index.get(key_tag, []),
+            self._index.get(value_tag, []),
+            self._bounds.get(key_tag, {}),
+            self._bounds.get(value_tag, {}),
+            self._records,
+        )
+
+    @property
+    def status(self) -> str | None:
+        """Status da execução."""
+        return self.find_one(Components.Workflow, "Status")
+
+    @property
+    def detail(self) -> str | None:
+        """Detalhes da execução."""
+        return self.find_one(Components.Workflow, "Detail")
+
+    @property
+    def record_id(self) -> str | None:
+        """Identificador do registro criado."""
+        return self.find_one(Components.Workflow, "RecordID")
+
+    def raise_for_status(self, error: type[Exception]) -> None:
+        """
+        Lança um erro caso o Sesuite tenha retornado uma falha.
+
+        Parameters
+        ----------
+        error : type of Exception
+            O tipo de erro que deve ser lançado.
+
+        Raises
+        ------
+        Exception
+            Erro do tipo especificado, com os detalhes da execução.
+
+        """
+        if self.status == "FAILURE":
+            raise error(self.detail)
+
+
+class ResponseParser:
+    """
+    Analisa a resposta aos poucos, enquanto a mesma é recebida.
+
+    Cada registro das tabelas é esvaziado assim que termina, então a memória
+    utilizada é a do índice dos valores, e não a da árvore ou do corpo
+    inteiro. O índice é o mesmo de :class:`Response`. O analisador é sempre o
+    da biblioteca padrão, qualquer que seja a implementação configurada.
+
+    Examples
+    --------
+    >>> parser = ResponseParser()
+    >>> async for chunk in response.content.iter_chunked(65536):
+    ...     parser.feed(chunk)
+    >>> parser.close()
+
+    """
+
+    __slots__ = ("_indexer", "_parser")
+
+    def __init__(self) -> None:
+        self._parser = backend().pull_parser()
+        self._indexer = _Indexer()
+
+    def feed(self, data: bytes) -> None:
+        """
+        Analisa a próxima parte do XML.
+
+        Parameters
+        ----------
+        data : bytes
+            Os dados recebidos.
+
+        Raises
+        ------
+        xml.etree.ElementTree.ParseError
+            Caso o XML seja inválido.
+
+        """
+        self._parser.feed(data)
+        self._consume()
+
+    def close(self) -> Response:
+        """
+        Termina a análise, retornando a resposta.
+
+        Returns
+        -------
+        Response
+            A resposta analisada.
+
+        Raises
+        ------
+        xml.etree.ElementTree.ParseError
+            Caso o XML esteja incompleto.
+
+        """
+        self._parser.close()
+        self._consume()
+
+        return self._indexer.response()
+
+    def _consume(self) -> None:
+        self._indexer.extend(
+            element for _, element in self._parser.read_events()
+        )
@@ -0,0 +1,174 @@
+"""
+Submódulo para representar os registros retornados pelas tabelas.
+
+Classes
+-------
+Table
+    Registros de uma tabela, guardados em colunas.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+
+class Table:
+    """
+    Registros de uma tabela, guardados em colunas.
+
+    Cada coluna é uma lista com o valor do campo em cada registro, ou ``None``
+    caso o registro não possua o campo.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(
+        self, columns: dict[str | None, list[str | None]], length: int
+    ) -> None:
+        """
+        Registros de uma tabela, guardados em colunas.
+
+        Parameters
+        ----------
+        columns : dict of str or None and list of str or None
+            Os valores de cada coluna, todas com o tamanho ``length``.
+        length : int
+            Quantidade de registros.
+
+        """
+        self._columns = columns
+        self._length = length
+
+    @classmethod
+    def from_records(
+        cls,
+        keys: Sequence[str | None],
+        values: Sequence[str | None],
+        key_bounds: Mapping[int, tuple[int, int]],
+        value_bounds: Mapping[int, tuple[int, int]],
+        length: int,
+    ) -> Table:
+        """
+        Monta a tabela a partir dos pares de campo e valor de cada registro.
+
+        Os registros são separados pelos limites de cada lista, e não pela
+        repetição dos campos, então registros seguidos com campos diferentes
+        continuam separados, e os campos fora dos registros são ignorados. Um
+        campo repetido no mesmo registro mantém o último valor.
+
+        Parameters
+        ----------
+        keys : Sequence of str or None
+            Os identificadores dos campos, em ordem.
+        values : Sequence of str or None
+            Os valores dos campos, em ordem.
+        key_bounds : Mapping of int and tuple of int and int
+            O início e o fim, em ``keys``, dos campos de cada registro,
+            omitindo os registros sem campos.
+        value_bounds : Mapping of int and tuple of int and int
+            O mesmo que ``key_bounds``, para ``values``.
+        length : int
+            Quantidade de registros.
+
+        Returns
+        -------
+        Table
+            Os registros encontrados.
+
+        """
+        columns: dict[str | None, list[str | None]] = {}
+        for row in range(length):
+            key_start, key_end = key_bounds.get(row, (0, 0))
+            value_start, value_end = value_bounds.get(row, (0, 0))
+            for key, value in zip(
+                keys[key_start:key_end],
+                values[value_start:value_end],
+                strict=False,
+            ):
+                column = key.lower() if key else key
+                cells = columns.setdefault(column, [])
+                if len(cells) > row:
+                    cells[row] = value
+                else:
+                    cells.extend([None] * (row - len(cells)))
+                    cells.append(value)
+
+        for cells in columns.values():
+            cells.extend([None] * (length - len(cells)))
+
+        return cls(columns, length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __getitem__(self, column: str | None) -> list[str | None]:
+        return self._columns[column]
+
+    def __repr__(self) -> str:
+        return f"Table(columns={list(self._columns)!r}, length={self._length})"
+
+    @property
+    def columns(self) -> tuple[str | None, ...]:
+        """Os identificadores dos campos."""
+        return tuple(self._columns)
+
+    def rows(self) -> Iterator[dict[str | None, str | None]]:
+        """
+        Percorre os registros, um dicionario por registro.
+
+        Yields
+        ------
+        dict of str or None and str or None
+            Os campos e valores de cada registro.
+
+        """
+        columns = self.columns
+        for values in self.tuples():
+            yield dict(zip(columns, values, strict=True))
+
+    def tuples(self) -> Iterator[tuple[str | None, ...]]:
+        """
+        Percorre os registros, uma tupla por registro na ordem de ``columns``.
+
+        Yields
+        ------
+        tuple of str or None
+            Os valores de cada registro.
+
+        """
+        return zip(*self._columns.values(), strict=True)
+
+    def to_dict(self) -> dict[str | None, list[str | None]]:
+        """
+        Retorna as colunas em um dicionario, como aceito pelo ``pandas``.
+
+        Returns
+        -------
+        dict of str or None and list of str or None
+            Os valores de cada coluna.
+
+        """
+        return dict(self._columns)
+
+    def to_numpy(self) -> dict[str | None, Any]:
+        """
+        Retorna as colunas como arrays do ``numpy``.
+
+        Returns
+        -------
+        dict of str or None and numpy.ndarray
+            Os valores de cada coluna.
+
+        """
+        import numpy as np
+
+        return {
+            column: np.array(values, dtype=object)
+            for column, values in self._columns.items()
+        }
@@ -9,13 +9,13 @@ Xml
 
 from __future__ import annotations
 
-from xml.etree import ElementTree as ET
+from .backends import backend
 
 
 class Xml:
     """Manipulação de XML."""
 
-    __slots__ = ("_element", "_namespaces", "_root")
+    __slots__ = ("_backend", "_element", "_root")
 
     def __init__(self, data: str, component: str) -> None:
         """
@@ -29,9 +29,9 @@ class Xml:
             Qual o componente do sesuite será utilizado.
 
         """
-        self._root = ET.fromstring(data)
+        self._backend = backend()
+        self._root = self._backend.parse(data)
         self._element = component
-        self._namespaces = {component: f"urn:{component}"}
 
     def find_one(self, tag: str) -> str | None:
         """
@@ -50,13 +50,7 @@ class Xml:
             caso não seja encontrado nada, um valor nulo é retornado.
 
         """
-        result = self._root.find(
-            f".//{self._element}:{tag}", namespaces=self._namespaces
-        )
-        if result is None:
-            return None
-
-        return result.text
+        return self._backend.find_one(self._root, self._element, tag)
 
     def find_many(self, tag: str) -> list[str | None]:
         """
@@ -73,9 +67,4 @@ class Xml:
             Uma representação em lista dos valores encontrados.
 
         """
-        return [
-            v.text
-            for v in self._root.findall(
-                f".//{self._element}:{tag}", namespaces=self._namespaces
-            )
-        ]
+        return self._backend.find_many(self._root, self._element, tag)
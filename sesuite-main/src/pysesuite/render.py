@@ -1,11 +1,99 @@
+"""
+Renderização dos templates XML enviados ao Web Service do Sesuite.
+
+Todos os templates da pasta ``templates`` são carregados e compilados uma
+única vez, na primeira renderização, e reaproveitados pelas chamadas seguintes.
+O ``jinja2`` também só é importado nesse momento.
+
+Os templates também podem ser renderizados no formato compacto, sem as quebras
+de linha e a indentação, que são removidas do código dos templates antes da
+compilação, sem alterar os valores passados aos mesmos.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import jinja2
+if TYPE_CHECKING:
+    import jinja2
 
 TEMPLATES_FOLDER = Path(__file__).parent.resolve() / "templates"
 
+_WHITESPACE = re.compile(r"\n\s*")
+
+_bytecode_cache: Path | None = None
+
+
+def configure(*, bytecode_cache: Path | None = None) -> None:
+    """
+    Configura o motor de templates.
+
+    Parameters
+    ----------
+    bytecode_cache : Path, optional
+        Pasta onde o bytecode dos templates compilados será guardado, permitindo
+        que novos processos não precisem compilar os templates novamente.
+
+    """
+    global _bytecode_cache  # noqa: PLW0603
+
+    _bytecode_cache = bytecode_cache
+    _templates.cache_clear()
+
+
+@functools.cache
+def _templates(compact: bool = False) -> dict[str, jinja2.Template]:
+    """
+    Carrega e compila todos os templates disponíveis.
+
+    Parameters
+    ----------
+    compact : bool, by default False
+        Se as quebras de linha e a indentação devem ser removidas.
+
+    Returns
+    -------
+    dict of str and Template
+        Os templates compilados, indexados pelo nome.
+
+    """
+    import jinja2
+    import jinja2.ext
+
+    class Compact(jinja2.ext.Extension):
+        def preprocess(
+            self, source: str, name: str | None, filename: str | None = None
+        ) -> str:
+            return _WHITESPACE.sub("", source)
+
+    bytecode_cache = None
+    if _bytecode_cache is not None:
+        # O cache é indexado pelo código original, que é o mesmo nos dois
+        # formatos.
+        folder = _bytecode_cache / "compact" if compact else _bytecode_cache
+        folder.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(folder))
+
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_FOLDER),
+        autoescape=jinja2.select_autoescape(),
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+        extensions=[Compact] if compact else [],
+    )
+
+    return {
+        name: env.get_template(name)
+        for name in env.list_templates(extensions=["xml"])
+    }
 
-def render(template_name: str, **kwargs: object) -> str:
+
+def render(
+    template_name: str, *, compact: bool = False, **kwargs: object
+) -> str:
     """
     Renderiza o template especificado e passa dados para o mesmo.
 
@@ -13,6 +101,8 @@ def render(template_name: str, **kwargs: object) -> str:
     ----------
     template_name : str
         O nome do template.
+    compact : bool, by default False
+        Se o XML deve ser gerado sem quebras de linha e indentação.
     **kwargs
         Argumentos extras para serem passados ao template.
 
@@ -22,11 +112,4 @@ def render(template_name: str, **kwargs: object) -> str:
         A representação em XML renderizada.
 
     """
-    env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(TEMPLATES_FOLDER),
-        autoescape=jinja2.select_autoescape(),
-    )
-
-    template = env.get_template(template_name).render(**kwargs)
-
-    return str(template)
+    return _templates(compact)[template_name].render(**kwargs)
@@ -0,0 +1,75 @@
+"""Os resultados retornados pelas ações do Web Service do Sesuite."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from .parsing import Table
+
+if TYPE_CHECKING:
+    import requests
+
+    from .exceptions import FormError, WorkflowError
+
+
+class WorkflowRecord(NamedTuple):
+    """
+    Resultado das ações que criam registros no Sesuite.
+
+    Attributes
+    ----------
+    detail : str or None
+        Detalhes da execução.
+    record_id : str or None
+        Identificador do registro criado.
+
+    """
+
+    detail: str | None
+    record_id: str | None
+
+
+class TableRecord(NamedTuple):
+    """
+    Resultado da consulta de registros de uma tabela.
+
+    Attributes
+    ----------
+    detail : str or None
+        Detalhes da execução.
+    records : Table
+        Os registros da tabela, em colunas.
+
+    """
+
+    detail: str | None
+    records: Table
+
+
+class ChildRecordResult(NamedTuple):
+    """
+    Resultado da inclusão de uma linha na grid do formulário.
+
+    Attributes
+    ----------
+    index : int
+        Posição da linha nos registros enviados.
+    workflow_id : str
+        Identificador da instância.
+    detail : str or None
+        Detalhes da execução.
+    error : WorkflowError or FormError or RequestException or None
+        O erro retornado pelo Sesuite, ou o erro de conexão, caso a linha não
+        tenha sido incluída.
+
+    """
+
+    index: int
+    workflow_id: str
+    detail: str | None
+    error: WorkflowError | FormError | requests.RequestException | None
+
+    @property
+    def ok(self) -> bool:
+        """Se a linha foi incluída."""
+        return self.error is None
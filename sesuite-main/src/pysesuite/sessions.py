@@ -0,0 +1,67 @@
+"""Sessões HTTP compartilhadas entre threads."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import requests
+
+
+class SessionPool:
+    """
+    Conjunto de sessões HTTP, uma para cada thread.
+
+    A sessão do ``requests`` não é segura para ser utilizada por várias threads
+    ao mesmo tempo, então cada thread recebe a sua própria sessão, que é
+    reaproveitada em todas as chamadas feitas pela mesma.
+    """
+
+    __slots__ = ("_factory", "_local", "_lock", "_sessions")
+
+    def __init__(self, factory: Callable[[], requests.Session]) -> None:
+        """
+        Conjunto de sessões HTTP, uma para cada thread.
+
+        Parameters
+        ----------
+        factory : Callable
+            Função que cria uma nova sessão HTTP.
+
+        """
+        self._factory = factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: list[requests.Session] = []
+
+    def get(self) -> requests.Session:
+        """
+        Retorna a sessão da thread atual, criando a mesma se necessário.
+
+        Returns
+        -------
+        requests.Session
+            A sessão HTTP da thread atual.
+
+        """
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = self._factory()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+
+        return session
+
+    def close(self) -> None:
+        """Fecha todas as sessões criadas."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+
+        for session in sessions:
+            session.close()
+
+        self._local = threading.local()
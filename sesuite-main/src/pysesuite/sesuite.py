@@ -2,42 +2,106 @@
 
 from __future__ import annotations
 
+import hashlib
+import itertools
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
-
-import requests
-from typing_extensions import Self
-from urllib3 import disable_warnings
-from urllib3.exceptions import InsecureRequestWarning
+from typing import TYPE_CHECKING, NamedTuple
 
+from . import operations
 from .actions import SOAPAction
-from .components import Components
+from .attributes import Entity as Entity
+from .attributes import Relationship as Relationship
+from .attributes import TableField as TableField
+from .balancer import is_failure
+from .batch import chunked, imap, run_lanes, submit
+from .compression import CompressedBody
 from .exceptions import FormError, SessionError, WorkflowError
-from .files import base_64
-from .parsing import get_dict, get_one
-from .render import render
+from .instrumentation import Measurement, Phase, TimedBody
+from .parsing import Response, ResponseParser
+from .results import ChildRecordResult
+from .sessions import SessionPool
+from .transport import Transport
 
 if TYPE_CHECKING:
     import types
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator, Mapping
     from pathlib import Path
+    from typing import Any, ParamSpec
+
+    import requests
+    from typing_extensions import Self
+
+    from .attributes import ChildRecord
+    from .balancer import Balancer, Target
+    from .cache import ResponseCache
+    from .instrumentation import Instrumentation
+    from .limiter import ConcurrencyLimiter
+    from .offload import Offload
+    from .operations import Operation, T
+    from .results import TableRecord, WorkflowRecord
 
-    from .attributes import Entity as Entity
-    from .attributes import Relationship as Relationship
-    from .attributes import TableField as TableField
+    P = ParamSpec("P")
 
-disable_warnings(InsecureRequestWarning)
+
+class _PendingRow(NamedTuple):
+    index: int
+    workflow_id: str
+    operation: Operation[str | None]
+    render: float
 
 
 @dataclass(slots=True, repr=False)
 class Sesuite:
-    """A principal interface para a integração com o sesuite."""
+    """
+    A principal interface para a integração com o sesuite.
+
+    Pode ser compartilhada entre várias threads, cada thread utiliza a sua
+    própria sessão HTTP.
+
+    Attributes
+    ----------
+    transport : Transport
+        Configuração das conexões HTTP com o Web Service.
+    cache : ResponseCache, optional
+        Cache das consultas feitas com ``get_table_record``, separadas pelo
+        token do cliente, ou pelo token fixado com ``Balancer.pin``.
+    instrumentation : Instrumentation, optional
+        Recebe o tempo de cada fase das chamadas e os contadores de
+        requisições, bytes e erros.
+    offload : Offload, optional
+        Pool de processos onde os envelopes são montados e as respostas são
+        analisadas, liberando as threads para as chamadas. Indicado para as
+        chamadas em lote, como :meth:`map`. Desativa o ``Transport.stream``,
+        já que cada resposta é enviada inteira ao processo.
+    balancer : Balancer, optional
+        Distribui as chamadas entre vários endereços e tokens, no lugar do
+        endereço do ``transport`` e do token do cliente.
+    limiter : ConcurrencyLimiter, optional
+        Limita as chamadas simultâneas a cada componente, ajustando o limite
+        pela latência e pelas falhas do gateway. Nas chamadas em lote, utilize
+        ``max_workers`` maior ou igual ao ``max_limit``.
+
+    """
 
     _auth: str
-    _session: requests.Session | None = field(default=None)
+    transport: Transport = field(default_factory=Transport)
+    cache: ResponseCache | None = field(default=None)
+    instrumentation: Instrumentation | None = field(default=None)
+    offload: Offload | None = field(default=None)
+    balancer: Balancer | None = field(default=None)
+    limiter: ConcurrencyLimiter | None = field(default=None)
+    _sessions: SessionPool | None = field(default=None)
 
     def __enter__(self) -> Self:
-        self._session = requests.Session()
+        if self.transport.prewarm:
+            # As sessões das threads do ``map`` também são aquecidas.
+            self._sessions = SessionPool(self._warm_session)
+            self._sessions.get()
+        else:
+            self._sessions = SessionPool(self.transport.session)
         return self
 
     def __exit__(
@@ -48,29 +112,40 @@ class Sesuite:
     ) -> None:
         self.close()
 
+    def _warm_session(self) -> requests.Session:
+        """Cria uma sessão HTTP, já com as conexões abertas."""
+        session = self.transport.session()
+        urls = None
+        if self.balancer is not None:
+            urls = self.balancer.urls(self.transport)
+        self.transport.warm(session, urls)
+        return session
+
     def close(self) -> None:
-        if self._session:
-            self._session.close()
+        if self._sessions:
+            self._sessions.close()
+        if self.cache:
+            self.cache.save()
 
     def _call_api(
-        self, component: Components, soap_action: SOAPAction, body: str
-    ) -> str:
+        self,
+        operation: Operation[T],
+        measurement: Measurement | None = None,
+    ) -> T:
         """
         Chama a Web Service do Sesuite com os parâmetros necessários.
 
         Parameters
         ----------
-        component : Components
-            Componente do SeSuite que será utilizado.
-        soap_action : SOAPAction
-            Ação que o Web Service está chamando.
-        body : str
-            Corpo XML da requisição.
+        operation : Operation
+            Operação que será enviada ao Web Service.
+        measurement : Measurement, optional
+            Onde os tempos de envio, espera e análise são somados.
 
         Returns
         -------
-        str
-            Dados da requisição da API.
+        T
+            Resposta da API, já interpretada pela operação.
 
         Raises
         ------
@@ -80,27 +155,320 @@ class Sesuite:
             Se não foi iniciado a sessão http.
 
         """
-        headers = {
-            "Authorization": self._auth,
-            "Content-Type": "text/xml; charset=utf-8",
-            "SOAPAction": f"urn:{component}#{soap_action}",
-        }
-
-        if not self._session:
+        if not self._sessions:
             error = "Não foi iniciado a sessão HTTP"
             raise SessionError(error)
 
-        response = self._session.post(
-            component.url, data=body, headers=headers, verify=False
+        start = time.perf_counter()
+        body, headers = self.transport.encode(operation.body)
+        if measurement is not None and body is not operation.body:
+            measurement.add(Phase.encode, time.perf_counter() - start)
+
+        timed = None if measurement is None else TimedBody(body)
+        data = body if timed is None else timed
+        # Sem tamanho conhecido, o corpo comprimido é enviado em partes.
+        if timed is not None and isinstance(body, CompressedBody):
+            data = iter(timed)
+
+        if self.limiter is not None:
+            self.limiter.acquire(operation.component)
+
+        url, auth = self.transport.url(operation.component), self._auth
+        target = None if self.balancer is None else self.balancer.acquire()
+        if target is not None:
+            url = target.url(operation.component, self.transport)
+            auth = target.auth or auth
+
+        # Sem resposta, a chamada falhou por um erro de conexão.
+        failed = True
+        start = time.perf_counter()
+        try:
+            response = self._sessions.get().post(
+                url,
+                data=data,
+                headers={**operation.headers(auth), **headers},
+                timeout=self.transport.timeout,
+                verify=self.transport.verify,
+                # Com ``stream``, o corpo é lido apenas pelo ``_read_response``.
+                stream=self.transport.stream,
+            )
+            failed = is_failure(response.status_code)
+        finally:
+            self._release(
+                operation, target, time.perf_counter() - start, failed=failed
+            )
+
+        # Devolve a conexão ao pool mesmo que o corpo não seja lido até o fim.
+        with response:
+            if timed is not None and measurement is not None:
+                self._measure_call(operation, measurement, timed, start)
+
+            if response.status_code != 200:
+                if measurement is not None:
+                    self._measure_response(
+                        operation, response, len(response.content)
+                    )
+                data = response.content.decode("utf-8")
+                error = f"Ocorreu um erro com a requisição: {data}"
+                raise WorkflowError(error)
+
+            if measurement is None:
+                return self._read_response(response, operation.parse)[0]
+
+            start = time.perf_counter()
+            result, size = self._read_response(response, operation.parse)
+            measurement.add(Phase.parse, time.perf_counter() - start)
+            self._measure_response(operation, response, size)
+
+        return result
+
+    def _release(
+        self,
+        operation: Operation[T],
+        target: Target | None,
+        latency: float,
+        *,
+        failed: bool,
+    ) -> None:
+        """
+        Informa o resultado da chamada ao balanceador e ao limite adaptativo.
+
+        Parameters
+        ----------
+        operation : Operation
+            A operação enviada.
+        target : Target, optional
+            O destino escolhido pelo balanceador.
+        latency : float
+            Duração da chamada, em segundos.
+        failed : bool
+            Se a chamada falhou por um erro de conexão ou do gateway.
+
+        """
+        if self.balancer is not None and target is not None:
+            self.balancer.release(target, latency, failed=failed)
+
+        if self.limiter is not None:
+            component = operation.component
+            self.limiter.release(component, latency, failed=failed)
+            if self.instrumentation is not None:
+                self.instrumentation.gauge(
+                    operation.soap_action,
+                    "concurrency_limit",
+                    self.limiter.limit(component),
+                )
+
+    def _read_response(
+        self, response: requests.Response, parse: Callable[[Response], T]
+    ) -> tuple[T, int]:
+        """
+        Analisa e interpreta o corpo da resposta.
+
+        Com ``Transport.stream``, o corpo é analisado aos poucos, enquanto é
+        recebido, e não é guardado em memória. Com ``offload``, o corpo é
+        lido inteiro, mesmo com ``stream``, e analisado e interpretado em um
+        dos processos do pool.
+
+        Parameters
+        ----------
+        response : requests.Response
+            A resposta HTTP.
+        parse : Callable
+            A função da operação que interpreta a resposta.
+
+        Returns
+        -------
+        tuple of T and int
+            O resultado da operação e o tamanho do corpo, sem compressão.
+
+        """
+        if self.offload is not None:
+            content = response.content
+            return self.offload.parse(parse, content), len(content)
+
+        if not self.transport.stream:
+            return parse(Response(response.content)), len(response.content)
+
+        parser = ResponseParser()
+        size = 0
+        for chunk in response.iter_content(self.transport.stream_chunk_size):
+            size += len(chunk)
+            parser.feed(chunk)
+
+        return parse(parser.close()), size
+
+    def _measure_call(
+        self,
+        operation: Operation[T],
+        measurement: Measurement,
+        body: TimedBody,
+        start: float,
+    ) -> None:
+        received = time.perf_counter()
+        sent = body.sent or start
+        if body.encode:
+            measurement.add(Phase.encode, body.encode)
+        measurement.add(Phase.send, sent - start - body.encode)
+        measurement.add(Phase.wait, received - sent)
+
+        if self.instrumentation is not None:
+            action = operation.soap_action
+            self.instrumentation.count(action, "requests")
+            self.instrumentation.count(action, "request_bytes", body.size)
+            self.instrumentation.count(
+                action, "request_raw_bytes", len(operation.body)
+            )
+
+    def _measure_response(
+        self, operation: Operation[T], response: requests.Response, size: int
+    ) -> None:
+        if self.instrumentation is not None:
+            action = operation.soap_action
+            # O ``tell`` conta os bytes lidos da conexão, antes da
+            # descompressão.
+            self.instrumentation.count(
+                action, "response_bytes", response.raw.tell()
+            )
+            self.instrumentation.count(action, "response_raw_bytes", size)
+
+    def _execute(
+        self,
+        build: Callable[P, Operation[T]],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """
+        Monta a operação, envia a mesma e interpreta a resposta da API.
+
+        Parameters
+        ----------
+        build : Callable
+            Função que monta a operação.
+        *args, **kwargs
+            Argumentos passados para ``build``.
+
+        Returns
+        -------
+        T
+            O resultado da operação.
+
+        """
+        if self.instrumentation is None:
+            return self._send(self._build(build, args, kwargs))
+
+        start = time.perf_counter()
+        operation = self._build(build, args, kwargs)
+
+        return self._send(operation, time.perf_counter() - start)
+
+    def _build(
+        self,
+        build: Callable[..., Operation[T]],
+        args: tuple[Any, ...],
+        kwargs: Mapping[str, Any],
+    ) -> Operation[T]:
+        compact = self.transport.compact
+        if self.offload is None:
+            return build(*args, compact=compact, **kwargs)
+
+        return self.offload.build(
+            build,
+            args,
+            kwargs,
+            compact=compact,
+            savings=self.instrumentation is not None,
         )
 
-        data = response.content.decode("utf-8")
+    def _send(self, operation: Operation[T], render: float = 0.0) -> T:
+        """
+        Envia a operação já montada e interpreta a resposta da API.
 
-        if response.status_code != 200:
-            error = f"Ocorreu um erro com a requisição: {data}"
-            raise WorkflowError(error)
+        Parameters
+        ----------
+        operation : Operation
+            Operação que será enviada ao Web Service.
+        render : float, by default 0.0
+            Tempo, em segundos, gasto montando a operação.
 
-        return data
+        Returns
+        -------
+        T
+            O resultado da operação.
+
+        """
+        if self.instrumentation is None:
+            return self._call_api(operation)
+
+        measurement = Measurement(operation.soap_action)
+        measurement.add(Phase.render, render)
+
+        if operation.savings is not None:
+            self.instrumentation.count(
+                operation.soap_action, "bytes_saved", operation.savings()
+            )
+
+        try:
+            result = self._call_api(operation, measurement)
+        except (WorkflowError, FormError) as error:
+            self.instrumentation.count(
+                operation.soap_action, f"errors.{type(error).__name__}"
+            )
+            raise
+        finally:
+            measurement.report(self.instrumentation)
+
+        return result
+
+    def map(
+        self,
+        method: Callable[..., T] | str,
+        kwargs_iterable: Iterable[Mapping[str, Any]],
+        *,
+        max_workers: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[T | WorkflowError | FormError]:
+        """
+        Executa uma ação para vários conjuntos de argumentos em paralelo.
+
+        Parameters
+        ----------
+        method : Callable or str
+            A ação a ser executada, como ``sesuite.execute_activity`` ou
+            ``"execute_activity"``.
+        kwargs_iterable : Iterable of Mapping
+            Os keyword arguments de cada chamada.
+        max_workers : int, by default 8
+            Quantidade de threads.
+        ordered : bool, by default True
+            Se os resultados devem ser retornados na ordem dos argumentos, ou
+            na ordem em que as chamadas terminarem.
+
+        Yields
+        ------
+        T or WorkflowError or FormError
+            O resultado de cada chamada, ou o erro retornado pelo Sesuite.
+
+        Examples
+        --------
+        >>> with Sesuite(auth) as sesuite:
+        ...     for result in sesuite.map(
+        ...         "execute_activity",
+        ...         (
+        ...             {"workflow_id": workflow_id, "activity_id": "ATV01",
+        ...              "action_sequence": 1}
+        ...             for workflow_id in workflows
+        ...         ),
+        ...         max_workers=16,
+        ...     ):
+        ...         ...
+
+        """
+        function = getattr(self, method) if isinstance(method, str) else method
+
+        return imap(
+            function, kwargs_iterable, max_workers=max_workers, ordered=ordered
+        )
 
     def execute_activity(
         self, *, workflow_id: str, activity_id: str, action_sequence: int
@@ -128,25 +496,13 @@ class Sesuite:
             Erro caso tenha ocorrido algum problema com a execução do Sesuite.
 
         """
-        body = render(
-            "actions/execute_activity.xml",
+        return self._execute(
+            operations.execute_activity,
             workflow_id=workflow_id,
             activity_id=activity_id,
             action_sequence=action_sequence,
         )
 
-        response = self._call_api(
-            Components.Workflow, SOAPAction.execute_activity, body
-        )
-
-        status = get_one(response, Components.Workflow, "Status")
-        detail = get_one(response, Components.Workflow, "Detail")
-
-        if status == "FAILURE":
-            raise WorkflowError(detail)
-
-        return detail
-
     def execute_system_activity(
         self, *, workflow_id: str, activity_id: str, activity_order: str
     ) -> str | None:
@@ -173,25 +529,13 @@ class Sesuite:
             Erro caso tenha ocorrido algum problema com a execução do Sesuite.
 
         """
-        body = render(
-            "actions/execute_system_activity.xml",
+        return self._execute(
+            operations.execute_system_activity,
             workflow_id=workflow_id,
             activity_id=activity_id,
             activity_order=activity_order,
         )
 
-        response = self._call_api(
-            Components.Workflow, SOAPAction.execute_system_activity, body
-        )
-
-        status = get_one(response, Components.Workflow, "Status")
-        detail = get_one(response, Components.Workflow, "Detail")
-
-        if status == "FAILURE":
-            raise WorkflowError(detail)
-
-        return detail
-
     def new_workflow_edit_data(
         self,
         user_id: str | None = None,
@@ -201,7 +545,7 @@ class Sesuite:
         entity_id: str = "",
         entity_list: Iterable[Entity] | None = None,
         relationship_list: Iterable[Relationship] | None = None,
-    ) -> tuple[str | None, str | None]:
+    ) -> WorkflowRecord:
         """
         Cria novo processo e preenche os dados especificados.
 
@@ -216,14 +560,16 @@ class Sesuite:
         entity_id : str, optional
             Identificador da tabela.
         entity_list : Iterable of Entity, optional
-            Lista de informações dos campos da tabela.
+            Lista de informações dos campos da tabela. Utilize um
+            :class:`EntityList` para muitos campos.
         relationship_list : Iterable of Relationship, optional
-            Lista de informações dos relacionamentos.
+            Lista de informações dos relacionamentos. Utilize um
+            :class:`RelationshipTable` para muitos campos.
 
         Returns
         -------
-        tuple of str or None
-            status e detalhes da execução e o identificador na instancia.
+        WorkflowRecord
+            Detalhes da execução e o identificador da instancia.
 
         Raises
         ------
@@ -231,29 +577,16 @@ class Sesuite:
             Erro caso tenha ocorrido algum problema com a execução do Sesuite.
 
         """
-        body = render(
-            "actions/new_workflow_edit_data.xml",
+        return self._execute(
+            operations.new_workflow_edit_data,
+            user_id=user_id,
             process_id=process_id,
             workflow_title=workflow_title,
-            user_id=user_id,
             entity_id=entity_id,
             entity_list=entity_list,
             relationship_list=relationship_list,
         )
 
-        response = self._call_api(
-            Components.Workflow, SOAPAction.new_workflow_edit_data, body
-        )
-
-        status = get_one(response, Components.Workflow, "Status")
-        detail = get_one(response, Components.Workflow, "Detail")
-        record_id = get_one(response, Components.Workflow, "RecordID")
-
-        if status == "FAILURE":
-            raise WorkflowError(detail)
-
-        return detail, record_id
-
     def new_attachment(
         self,
         user_id: str | None = None,
@@ -261,7 +594,7 @@ class Sesuite:
         workflow_id: str,
         activity_id: str,
         file_path: Path,
-    ) -> tuple[str | None, str | None]:
+    ) -> WorkflowRecord:
         """
         Adiciona um novo anexo a uma atividade do processo.
 
@@ -278,8 +611,8 @@ class Sesuite:
 
         Returns
         -------
-        tuple of str or None
-            status da execução, detalhes da execução e identificador do anexos.
+        WorkflowRecord
+            Detalhes da execução e identificador do anexo.
 
         Raises
         ------
@@ -287,35 +620,21 @@ class Sesuite:
             Erro caso tenha ocorrido algum problema com a execução do Sesuite.
 
         """
-        body = render(
-            "actions/new_attachment.xml",
+        return self._execute(
+            operations.new_attachment,
             user_id=user_id,
             workflow_id=workflow_id,
             activity_id=activity_id,
             file_path=file_path,
-            content=base_64(file_path),
-        )
-
-        response = self._call_api(
-            Components.Workflow, SOAPAction.new_attachment, body
         )
 
-        status = get_one(response, Components.Workflow, "Status")
-        detail = get_one(response, Components.Workflow, "Detail")
-        record_id = get_one(response, Components.Workflow, "RecordID")
-
-        if status == "FAILURE":
-            raise WorkflowError(detail)
-
-        return detail, record_id
-
     def get_table_record(
         self,
         *,
         table_id: str,
         table_field_list: Iterable[TableField],
         pagination: int = 1,
-    ) -> tuple[str | None, dict[str | None, str | None]]:
+    ) -> TableRecord:
         """
         Retorna os valores da tabela filtrados.
 
@@ -330,8 +649,8 @@ class Sesuite:
 
         Returns
         -------
-        tuple of str or None and dict of str or None and str or None
-            status e detalhes da execução e dicionario das informações da tabela
+        TableRecord
+            Detalhes da execução e os registros da tabela.
 
         Raises
         ------
@@ -339,27 +658,101 @@ class Sesuite:
             Erro caso tenha ocorrido algum problema com a execução do Sesuite.
 
         """
-        body = render(
-            "actions/get_table_record.xml",
-            table_id=table_id,
-            pagination=pagination,
-            table_field_list=table_field_list,
+        if self.cache is None:
+            return self._execute(
+                operations.get_table_record,
+                table_id=table_id,
+                table_field_list=table_field_list,
+                pagination=pagination,
+            )
+
+        fields = tuple(table_field_list)
+        pinned = None if self.balancer is None else self.balancer.pinned
+        # Apenas o hash do token, já que o cache pode ser salvo em arquivo.
+        token = hashlib.sha256((pinned or self._auth).encode()).hexdigest()
+        key = (
+            SOAPAction.get_table_record,
+            token,
+            table_id,
+            tuple(
+                (table_field.id, table_field.value) for table_field in fields
+            ),
+            pagination,
         )
 
-        response = self._call_api(
-            Components.Form, SOAPAction.get_table_record, body
+        return self.cache.get(
+            key,
+            table_id,
+            lambda: self._execute(
+                operations.get_table_record,
+                table_id=table_id,
+                table_field_list=fields,
+                pagination=pagination,
+            ),
         )
 
-        status = get_one(response, Components.Workflow, "Status")
-        detail = get_one(response, Components.Workflow, "Detail")
-        records = get_dict(
-            response, Components.Form, "TableFieldID", "TableFieldValues"
-        )
+    def iter_table_records(
+        self,
+        table_id: str,
+        table_field_list: Iterable[TableField],
+        *,
+        prefetch: int = 2,
+        start: int = 1,
+    ) -> Iterator[dict[str | None, str | None]]:
+        """
+        Percorre os registros de todas as páginas da tabela filtrada.
+
+        Enquanto uma página é consumida, as próximas ``prefetch`` páginas já
+        são buscadas em segundo plano. A iteração termina na primeira página
+        vazia.
+
+        Parameters
+        ----------
+        table_id : str
+            Identificador da tabela.
+        table_field_list : Iterable of TableField
+            Lista de campos que serão usados para filtrar a tabela.
+        prefetch : int, by default 2
+            Quantidade de páginas buscadas antecipadamente.
+        start : int, by default 1
+            Página inicial.
 
-        if status == "FAILURE":
-            raise FormError(detail)
+        Yields
+        ------
+        dict of str or None and str or None
+            Os campos e valores de cada registro.
 
-        return detail, records
+        Raises
+        ------
+        FormError
+            Erro caso tenha ocorrido algum problema com a execução do Sesuite.
+
+        """
+        fields = tuple(table_field_list)
+        pages = itertools.count(start)
+
+        def fetch(pagination: int) -> TableRecord:
+            return self.get_table_record(
+                table_id=table_id,
+                table_field_list=fields,
+                pagination=pagination,
+            )
+
+        executor = ThreadPoolExecutor(max_workers=max(prefetch, 1))
+        try:
+            queue = deque(
+                submit(executor, fetch, page)
+                for page in itertools.islice(pages, max(prefetch, 1))
+            )
+            while queue:
+                records = queue.popleft().result().records
+                if not records:
+                    break
+
+                queue.append(submit(executor, fetch, next(pages)))
+                yield from records.rows()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def cancel_workflow(
         self, user_id: str | None, *, workflow_id: int | str, explanation: str
@@ -378,8 +771,8 @@ class Sesuite:
 
         Returns
         -------
-        tuple of str or None
-            Status da execução e os detalhes da execução.
+        str or None
+            Detalhes da execução.
 
         Raises
         ------
@@ -387,25 +780,13 @@ class Sesuite:
             Erro caso tenha ocorrido algum problema com a execução do Sesuite.
 
         """
-        body = render(
-            "actions/cancel_workflow.xml",
+        return self._execute(
+            operations.cancel_workflow,
+            user_id=user_id,
             workflow_id=workflow_id,
             explanation=explanation,
-            user_id=user_id,
         )
 
-        response = self._call_api(
-            Components.Workflow, SOAPAction.cancel_workflow, body
-        )
-
-        status = get_one(response, Components.Workflow, "Status")
-        detail = get_one(response, Components.Workflow, "Detail")
-
-        if status == "FAILURE":
-            raise WorkflowError(detail)
-
-        return detail
-
     def new_child_entity_record(
         self,
         *,
@@ -425,11 +806,13 @@ class Sesuite:
         entity_id : str
             Identificador da tabela principal.
         entity_attribute : Iterable[Entity]
-            Os atributos a serem adicionados na tabela principal.
+            Os atributos a serem adicionados na tabela principal, também
+            aceita um :class:`EntityList`.
         relationship_id : str
             Identificador do relacionamento da grid.
         relationship_attribute : Iterable[Relationship]
-            Os atributos a serem adicionados na grid.
+            Os atributos a serem adicionados na grid, também aceita um
+            :class:`RelationshipTable`.
 
         Returns
         -------
@@ -442,8 +825,8 @@ class Sesuite:
             Erro caso tenha ocorrido algum problema com a execução do Sesuite.
 
         """
-        body = render(
-            "actions/cancel_workflow.xml",
+        return self._execute(
+            operations.new_child_entity_record,
             workflow_id=workflow_id,
             entity_id=entity_id,
             entity_attribute=entity_attribute,
@@ -451,14 +834,145 @@ class Sesuite:
             relationship_attribute=relationship_attribute,
         )
 
-        response = self._call_api(
-            Components.Workflow, SOAPAction.new_child_entity_record, body
-        )
+    def new_child_entity_records(
+        self,
+        records: Iterable[ChildRecord],
+        *,
+        entity_id: str,
+        relationship_id: str,
+        max_workers: int = 8,
+        max_rows: int = 100,
+    ) -> list[ChildRecordResult]:
+        """
+        Adicione várias linhas nas grids de um ou mais formulários.
 
-        status = get_one(response, Components.Workflow, "Status")
-        detail = get_one(response, Components.Workflow, "Detail")
+        O Web Service recebe uma linha por chamada. As linhas de cada instância
+        são enviadas na ordem recebida, em blocos de até ``max_rows`` linhas,
+        enquanto instâncias diferentes são processadas em paralelo, alternando
+        entre os blocos das mesmas.
 
-        if status == "FAILURE":
-            raise WorkflowError(detail)
+        Os erros de uma linha, retornados pelo Sesuite ou de conexão, não
+        interrompem as demais, e são informados no resultado da mesma.
 
-        return detail
+        Parameters
+        ----------
+        records : Iterable of ChildRecord
+            As linhas a serem adicionadas e as instâncias das mesmas.
+        entity_id : str
+            Identificador da tabela principal.
+        relationship_id : str
+            Identificador do relacionamento da grid.
+        max_workers : int, by default 8
+            Quantidade de threads.
+        max_rows : int, by default 100
+            Quantidade máxima de linhas em um bloco, enviadas em sequência pela
+            mesma thread antes de alternar para outra instância.
+
+        Returns
+        -------
+        list of ChildRecordResult
+            O resultado de cada linha, na ordem de ``records``.
+
+        Examples
+        --------
+        >>> rows = [
+        ...     ChildRecord("WF01", EntityList.from_dict({"item": "A"})),
+        ...     ChildRecord("WF01", EntityList.from_dict({"item": "B"})),
+        ... ]
+        >>> results = sesuite.new_child_entity_records(
+        ...     rows, entity_id="pedido", relationship_id="itens"
+        ... )
+        >>> [result.index for result in results if result.error]
+        []
+
+        """
+        lanes: dict[str, list[_PendingRow]] = {}
+        for row in self._build_rows(records, entity_id, relationship_id):
+            lanes.setdefault(row.workflow_id, []).append(row)
+
+        chunks = {
+            workflow_id: chunked(rows, max_items=max_rows)
+            for workflow_id, rows in lanes.items()
+        }
+        results = [
+            result
+            for chunk in run_lanes(
+                self._send_rows, chunks, max_workers=max_workers
+            )
+            for result in chunk
+        ]
+
+        return sorted(results, key=lambda result: result.index)
+
+    def _build_rows(
+        self,
+        records: Iterable[ChildRecord],
+        entity_id: str,
+        relationship_id: str,
+    ) -> Iterator[_PendingRow]:
+        compact = self.transport.compact
+        if self.offload is None:
+            for index, record in enumerate(records):
+                start = time.perf_counter()
+                operation = operations.new_child_entity_record(
+                    workflow_id=record.workflow_id,
+                    entity_id=entity_id,
+                    entity_attribute=record.entity_attribute,
+                    relationship_id=relationship_id,
+                    relationship_attribute=record.relationship_attribute,
+                    compact=compact,
+                )
+                yield _PendingRow(
+                    index,
+                    record.workflow_id,
+                    operation,
+                    time.perf_counter() - start,
+                )
+            return
+
+        # Os envelopes são montados em paralelo, e o tempo total é dividido
+        # igualmente entre as linhas.
+        records = list(records)
+        start = time.perf_counter()
+        built = self.offload.build_many(
+            operations.new_child_entity_record,
+            (
+                {
+                    "workflow_id": record.workflow_id,
+                    "entity_id": entity_id,
+                    "entity_attribute": record.entity_attribute,
+                    "relationship_id": relationship_id,
+                    "relationship_attribute": record.relationship_attribute,
+                }
+                for record in records
+            ),
+            compact=compact,
+            savings=self.instrumentation is not None,
+        )
+        render = (time.perf_counter() - start) / max(len(records), 1)
+        for index, (record, operation) in enumerate(
+            zip(records, built, strict=True)
+        ):
+            yield _PendingRow(index, record.workflow_id, operation, render)
+
+    def _send_rows(self, rows: list[_PendingRow]) -> list[ChildRecordResult]:
+        import requests
+
+        results = []
+        for row in rows:
+            try:
+                detail = self._send(row.operation, row.render)
+            except (
+                WorkflowError,
+                FormError,
+                requests.RequestException,
+            ) as error:
+                results.append(
+                    ChildRecordResult(row.index, row.workflow_id, None, error)
+                )
+            else:
+                results.append(
+                    ChildRecordResult(row.index, row.workflow_id, detail, None)
+                )
+
+        return results
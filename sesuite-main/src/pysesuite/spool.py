@@ -0,0 +1,442 @@
+"""
+Fila durável de chamadas ao Web Service do Sesuite.
+
+As chamadas são gravadas em um banco SQLite local e retornam imediatamente,
+enquanto threads em segundo plano enviam as mesmas ao Web Service. Uma chamada
+só é removida da fila depois de concluída, então as chamadas pendentes
+sobrevivem à interrupção do processo e são enviadas na próxima execução.
+
+As chamadas de uma mesma instância são enviadas uma de cada vez, na ordem em
+que foram gravadas. As que falharem são repetidas com espera exponencial e,
+depois de ``max_attempts`` tentativas, ficam na fila de mensagens mortas.
+
+Cada chamada é enviada pelo menos uma vez, e não exatamente uma vez. As
+chamadas em execução quando o processo é interrompido voltam para a fila e são
+enviadas novamente na próxima execução, assim como as que falharem por tempo
+esgotado depois de chegar ao Web Service. Então uma ação que não pode ser
+repetida, como ``execute_activity``, pode ser executada duas vezes.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    import types
+
+    from typing_extensions import Self
+
+    from .sesuite import Sesuite
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    method TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    lane TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS operations_status ON operations (status, id);
+CREATE INDEX IF NOT EXISTS operations_lane ON operations (lane, id);
+"""
+
+# A próxima chamada de cada instância, se nenhuma outra estiver em execução.
+_CLAIM = """
+SELECT id, method, arguments, attempts FROM operations AS o
+WHERE status = 'pending' AND available_at <= ?
+AND NOT EXISTS (
+    SELECT 1 FROM operations AS p
+    WHERE p.lane = o.lane AND p.id < o.id AND p.status IN ('pending', 'running')
+)
+ORDER BY id LIMIT 1
+"""
+
+# Os métodos que podem ser gravados e os argumentos que são caminhos.
+METHODS = {
+    "execute_activity": (),
+    "execute_system_activity": (),
+    "cancel_workflow": (),
+    "new_attachment": ("file_path",),
+}
+
+
+def _path(value: object) -> str:
+    if isinstance(value, Path):
+        return str(value)
+
+    error = f"O argumento {value!r} não pode ser gravado na fila."
+    raise TypeError(error)
+
+
+class DeadLetter(NamedTuple):
+    """
+    Chamada que falhou em todas as tentativas.
+
+    Attributes
+    ----------
+    id : int
+        Identificador da chamada na fila.
+    method : str
+        O método de :class:`Sesuite` chamado.
+    arguments : dict of str and Any
+        Os argumentos da chamada.
+    attempts : int
+        Quantidade de tentativas.
+    error : str
+        O último erro.
+
+    """
+
+    id: int
+    method: str
+    arguments: dict[str, Any]
+    attempts: int
+    error: str
+
+
+class Spool:
+    """
+    Fila durável de chamadas, enviadas ao Web Service em segundo plano.
+
+    As chamadas podem ser gravadas antes de :meth:`start`, e são enviadas
+    quando as threads forem iniciadas. Cada chamada é enviada pelo menos uma
+    vez, e pode ser repetida depois de uma interrupção.
+
+    Parameters
+    ----------
+    sesuite : Sesuite
+        O cliente, já iniciado, que envia as chamadas.
+    path : Path
+        O arquivo SQLite da fila, criado caso não exista.
+    workers : int, by default 4
+        Quantidade de threads enviando as chamadas.
+    max_attempts : int, by default 5
+        Quantidade de tentativas antes de mover a chamada para as mensagens
+        mortas.
+    backoff : float, by default 1.0
+        Espera, em segundos, antes da segunda tentativa, dobrada a cada nova
+        tentativa.
+    max_backoff : float, by default 60.0
+        Espera máxima entre as tentativas, em segundos.
+
+    Examples
+    --------
+    >>> with Sesuite(token) as sesuite, Spool(sesuite, Path("a.db")) as spool:
+    ...     spool.submit("execute_activity", workflow_id="WF01",
+    ...                  activity_id="ATV01", action_sequence=1)
+    ...     spool.flush()
+
+    """
+
+    __slots__ = (
+        "_condition",
+        "_connection",
+        "_stopping",
+        "_threads",
+        "backoff",
+        "max_attempts",
+        "max_backoff",
+        "path",
+        "sesuite",
+        "workers",
+    )
+
+    def __init__(
+        self,
+        sesuite: Sesuite,
+        path: Path,
+        *,
+        workers: int = 4,
+        max_attempts: int = 5,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        self.sesuite = sesuite
+        self.path = path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._connection: sqlite3.Connection | None = None
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._threads: list[threading.Thread] = []
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        _type: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _database(self) -> sqlite3.Connection:
+        # Aberta no primeiro uso, para que as chamadas possam ser gravadas
+        # antes de ``start``.
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.path, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = FULL")
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    def start(self) -> None:
+        """Abre a fila e inicia as threads que enviam as chamadas."""
+        if self._threads:
+            return
+
+        with self._condition:
+            # Chamadas interrompidas pelo fim do processo anterior, que são
+            # enviadas novamente.
+            self._database().execute(
+                "UPDATE operations SET status = 'pending'"
+                " WHERE status = 'running'"
+            )
+
+        self._stopping = False
+        self._threads = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def close(self) -> None:
+        """
+        Para as threads e fecha a fila.
+
+        As chamadas em execução são concluídas, as pendentes continuam na fila
+        para a próxima execução. Utilize :meth:`flush` antes para aguardar as
+        mesmas.
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def submit(self, method: str, /, **kwargs: Any) -> int:
+        """
+        Grava uma chamada na fila, retornando assim que a mesma for gravada.
+
+        Parameters
+        ----------
+        method : str
+            O método de :class:`Sesuite`, como ``"execute_activity"``.
+        **kwargs
+            Os argumentos do método, que devem poder ser convertidos para JSON.
+            O arquivo de ``new_attachment`` é lido apenas no envio, e deve
+            existir até lá.
+
+        Returns
+        -------
+        int
+            O identificador da chamada na fila.
+
+        Raises
+        ------
+        ValueError
+            Caso o método não possa ser gravado na fila, ou caso um token
+            esteja fixado com ``Balancer.pin``, já que a chamada é enviada
+            depois, por outra thread, sem o token.
+
+        """
+        if method not in METHODS:
+            error = f"O método {method!r} não pode ser gravado na fila."
+            raise ValueError(error)
+
+        balancer = self.sesuite.balancer
+        if balancer is not None and balancer.pinned is not None:
+            error = "As chamadas com um token fixado não podem ser gravadas."
+            raise ValueError(error)
+
+        arguments = json.dumps(kwargs, default=_path)
+        lane = kwargs.get("workflow_id")
+        with self._condition:
+            cursor = self._database().execute(
+                "INSERT INTO operations (method, arguments, lane, available_at)"
+                " VALUES (?, ?, ?, ?)",
+                (method, arguments, None if lane is None else str(lane), 0),
+            )
+            self._condition.notify()
+
+        return cursor.lastrowid
+
+    def pending(self) -> int:
+        """Quantidade de chamadas ainda não concluídas."""
+        with self._condition:
+            return self._count()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Aguarda o envio de todas as chamadas da fila.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Tempo máximo de espera, em segundos.
+
+        Returns
+        -------
+        bool
+            Se todas as chamadas foram concluídas, ou movidas para as
+            mensagens mortas.
+
+        Raises
+        ------
+        RuntimeError
+            Caso a fila não tenha sido iniciada com :meth:`start`, já que as
+            chamadas nunca seriam enviadas.
+
+        """
+        if not self._threads:
+            error = "A fila não foi iniciada, utilize start() antes de flush()."
+            raise RuntimeError(error)
+
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._count() == 0, timeout=timeout
+            )
+
+    def dead_letters(self) -> list[DeadLetter]:
+        """As chamadas que falharam em todas as tentativas."""
+        with self._condition:
+            rows = (
+                self._database()
+                .execute(
+                    "SELECT id, method, arguments, attempts, error"
+                    " FROM operations WHERE status = 'dead' ORDER BY id"
+                )
+                .fetchall()
+            )
+
+        return [
+            DeadLetter(id, method, json.loads(arguments), attempts, error)
+            for id, method, arguments, attempts, error in rows
+        ]
+
+    def retry(self, ids: list[int] | None = None) -> int:
+        """
+        Devolve as mensagens mortas para a fila.
+
+        Parameters
+        ----------
+        ids : list of int, optional
+            As chamadas devolvidas, por padrão todas.
+
+        Returns
+        -------
+        int
+            Quantidade de chamadas devolvidas.
+
+        """
+        query = (
+            "UPDATE operations SET status = 'pending', attempts = 0,"
+            " available_at = 0 WHERE status = 'dead'"
+        )
+        parameters: list[int] = []
+        if ids is not None:
+            query += f" AND id IN ({', '.join('?' * len(ids))})"
+            parameters = ids
+
+        with self._condition:
+            count = self._database().execute(query, parameters).rowcount
+            self._condition.notify_all()
+
+        return count
+
+    def _count(self) -> int:
+        return (
+            self._database()
+            .execute(
+                "SELECT count(*) FROM operations"
+                " WHERE status IN ('pending', 'running')"
+            )
+            .fetchone()[0]
+        )
+
+    def _claim(self) -> tuple[int, str, str, int] | None:
+        row = self._connection.execute(_CLAIM, (time.time(),)).fetchone()
+        if row is not None:
+            self._connection.execute(
+                "UPDATE operations SET status = 'running' WHERE id = ?",
+                (row[0],),
+            )
+        return row
+
+    def _next_retry(self) -> float | None:
+        # Sem novas tentativas agendadas, aguarda ser notificada.
+        now = time.time()
+        (available_at,) = self._connection.execute(
+            "SELECT min(available_at) FROM operations"
+            " WHERE status = 'pending' AND available_at > ?",
+            (now,),
+        ).fetchone()
+        if available_at is None:
+            return None
+        return available_at - now
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                if self._stopping:
+                    return
+                job = self._claim()
+                if job is None:
+                    self._condition.wait(self._next_retry())
+                    continue
+
+            id, method, arguments, attempts = job
+            kwargs = json.loads(arguments)
+            for name in METHODS[method]:
+                kwargs[name] = Path(kwargs[name])
+
+            try:
+                getattr(self.sesuite, method)(**kwargs)
+            except Exception as error:  # noqa: BLE001
+                self._fail(id, attempts + 1, error)
+            else:
+                with self._condition:
+                    self._connection.execute(
+                        "DELETE FROM operations WHERE id = ?", (id,)
+                    )
+                    self._condition.notify_all()
+
+    def _fail(self, id: int, attempts: int, error: Exception) -> None:
+        message = f"{type(error).__name__}: {error}"
+        with self._condition:
+            if attempts >= self.max_attempts:
+                self._connection.execute(
+                    "UPDATE operations SET status = 'dead', attempts = ?,"
+                    " error = ? WHERE id = ?",
+                    (attempts, message, id),
+                )
+            else:
+                delay = min(
+                    self.backoff * 2 ** (attempts - 1), self.max_backoff
+                )
+                self._connection.execute(
+                    "UPDATE operations SET status = 'pending', attempts = ?,"
+                    " error = ?, available_at = ? WHERE id = ?",
+                    (attempts, message, time.time() + delay, id),
+                )
+            self._condition.notify_all()
@@ -0,0 +1,22 @@
+"""Ferramentas para testar automações sem utilizar o Sesuite de produção."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .server import StubServer as StubServer
+
+__all__ = ["StubServer"]
+
+
+def __getattr__(name: str) -> object:
+    # Importado no primeiro acesso, permitindo executar o módulo ``server``
+    # com ``python -m`` sem que o mesmo seja importado duas vezes.
+    if name == "StubServer":
+        from .server import StubServer
+
+        return StubServer
+
+    error = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error)
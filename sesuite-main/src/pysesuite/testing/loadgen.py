@@ -0,0 +1,350 @@
+"""
+Gerador de carga para o Web Service do Sesuite.
+
+Dispara chamadas com uma taxa alvo, pelo cliente síncrono, por threads ou pelo
+cliente assíncrono, e informa a vazão e as latências obtidas. Sem ``--url``,
+um servidor de testes local é iniciado.
+
+Utilize::
+
+    python -m pysesuite.testing.loadgen --mode threaded --rate 200 --workers 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ..actions import SOAPAction
+from ..attributes import Entity, Relationship
+from ..sesuite import Sesuite
+from ..transport import Transport
+from .server import StubServer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+MODES = ("sync", "threaded", "async")
+
+
+class Results:
+    """Latências e erros das chamadas feitas pelo gerador de carga."""
+
+    __slots__ = ("errors", "latencies", "services")
+
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.services: list[float] = []
+        self.errors: Counter[str] = Counter()
+
+    def record(
+        self,
+        scheduled: float,
+        started: float,
+        error: BaseException | None = None,
+    ) -> None:
+        """
+        Registra uma chamada.
+
+        Parameters
+        ----------
+        scheduled : float
+            Momento em que a chamada deveria iniciar.
+        started : float
+            Momento em que a chamada iniciou.
+        error : BaseException, optional
+            Erro da chamada.
+
+        """
+        finished = time.perf_counter()
+        self.latencies.append(finished - scheduled)
+        self.services.append(finished - started)
+        if error is not None:
+            self.errors[type(error).__name__] += 1
+
+    def report(self, elapsed: float) -> dict[str, Any]:
+        """
+        Resume as chamadas.
+
+        Parameters
+        ----------
+        elapsed : float
+            Duração total do teste, em segundos.
+
+        Returns
+        -------
+        dict of str and Any
+            A vazão, as latências e os erros.
+
+        """
+        return {
+            "requests": len(self.latencies),
+            "errors": dict(self.errors),
+            "elapsed": elapsed,
+            "throughput": len(self.latencies) / elapsed if elapsed else 0.0,
+            # Medida a partir do momento agendado, inclui o tempo de fila.
+            "latency": _percentiles(self.latencies),
+            # Medida a partir do início efetivo da chamada.
+            "service": _percentiles(self.services),
+        }
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+
+    ordered = sorted(values)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, math.ceil(p * len(ordered)) - 1)]
+
+    return {
+        "p50": percentile(0.5),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": ordered[-1],
+    }
+
+
+def arguments(
+    action: SOAPAction, attachment: Path, fields: int
+) -> Callable[[int], dict[str, Any]]:
+    """
+    Retorna a função que monta os argumentos da chamada de número ``i``.
+
+    Parameters
+    ----------
+    action : SOAPAction
+        Ação que será chamada.
+    attachment : Path
+        Arquivo enviado pelo ``newAttachment``.
+    fields : int
+        Quantidade de campos enviados pelas ações que preenchem formulários.
+
+    Returns
+    -------
+    Callable
+        Função que recebe o número da chamada e retorna os argumentos.
+
+    """
+    entities = [Entity(f"campo{n}", f"valor {n}") for n in range(fields)]
+    relationships = [
+        Relationship("grid", f"campo{n}", f"valor {n}") for n in range(fields)
+    ]
+
+    builders: dict[SOAPAction, Callable[[int], dict[str, Any]]] = {
+        SOAPAction.execute_activity: lambda i: {
+            "workflow_id": f"WF{i:06}",
+            "activity_id": "ATV01",
+            "action_sequence": 1,
+        },
+        SOAPAction.execute_system_activity: lambda i: {
+            "workflow_id": f"WF{i:06}",
+            "activity_id": "ATV01",
+            "activity_order": "1",
+        },
+        SOAPAction.new_workflow_edit_data: lambda i: {
+            "process_id": "PROCESSO",
+            "workflow_title": f"Teste de carga {i}",
+            "entity_id": "entidade",
+            "entity_list": entities,
+        },
+        SOAPAction.get_table_record: lambda i: {
+            "table_id": "tabela",
+            "table_field_list": [],
+            "pagination": i % 10 + 1,
+        },
+        SOAPAction.new_attachment: lambda i: {
+            "workflow_id": f"WF{i:06}",
+            "activity_id": "ATV01",
+            "file_path": attachment,
+        },
+        SOAPAction.cancel_workflow: lambda i: {
+            "user_id": "usuario",
+            "workflow_id": f"WF{i:06}",
+            "explanation": "Teste de carga",
+        },
+        SOAPAction.new_child_entity_record: lambda i: {
+            "workflow_id": f"WF{i:06}",
+            "entity_id": "entidade",
+            "entity_attribute": entities,
+            "relationship_id": "grid",
+            "relationship_attribute": relationships,
+        },
+    }
+
+    return builders[action]
+
+
+def run_sync(
+    sesuite: Sesuite,
+    method: str,
+    build: Callable[[int], dict[str, Any]],
+    schedule: list[float],
+) -> Results:
+    results = Results()
+    function = getattr(sesuite, method)
+    for i, scheduled in enumerate(schedule):
+        time.sleep(max(0.0, scheduled - time.perf_counter()))
+        started = time.perf_counter()
+        try:
+            function(**build(i))
+        except Exception as error:  # noqa: BLE001
+            results.record(scheduled, started, error)
+        else:
+            results.record(scheduled, started)
+
+    return results
+
+
+def run_threaded(
+    sesuite: Sesuite,
+    method: str,
+    build: Callable[[int], dict[str, Any]],
+    schedule: list[float],
+    workers: int,
+) -> Results:
+    results = Results()
+    function = getattr(sesuite, method)
+
+    def call(i: int, scheduled: float) -> None:
+        started = time.perf_counter()
+        try:
+            function(**build(i))
+        except Exception as error:  # noqa: BLE001
+            results.record(scheduled, started, error)
+        else:
+            results.record(scheduled, started)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for i, scheduled in enumerate(schedule):
+            time.sleep(max(0.0, scheduled - time.perf_counter()))
+            executor.submit(call, i, scheduled)
+
+    return results
+
+
+async def run_async(
+    auth: str,
+    transport: Transport,
+    method: str,
+    build: Callable[[int], dict[str, Any]],
+    schedule: list[float],
+    workers: int,
+) -> Results:
+    from ..async_sesuite import AsyncSesuite
+
+    results = Results()
+
+    async with AsyncSesuite(
+        auth,
+        max_concurrency=workers,
+        connection_limit=workers,
+        transport=transport,
+    ) as sesuite:
+        function = getattr(sesuite, method)
+
+        async def call(i: int, scheduled: float) -> None:
+            started = time.perf_counter()
+            try:
+                await function(**build(i))
+            except Exception as error:  # noqa: BLE001
+                results.record(scheduled, started, error)
+            else:
+                results.record(scheduled, started)
+
+        tasks = []
+        for i, scheduled in enumerate(schedule):
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            tasks.append(asyncio.create_task(call(i, scheduled)))
+        await asyncio.gather(*tasks)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--url",
+        help="endereço base do Web Service, por padrão um servidor local",
+    )
+    parser.add_argument("--auth", default="token")
+    parser.add_argument("--mode", choices=MODES, default="threaded")
+    parser.add_argument(
+        "--action",
+        choices=[action.name for action in SOAPAction],
+        default=SOAPAction.execute_activity.name,
+    )
+    parser.add_argument("--rate", type=float, default=50, help="chamadas/s")
+    parser.add_argument("--duration", type=float, default=10, help="segundos")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--attachment-size", type=int, default=100_000)
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="latência do servidor local"
+    )
+    parser.add_argument(
+        "--failure-rate", type=float, default=0, help="do servidor local"
+    )
+    args = parser.parse_args()
+
+    with ExitStack() as stack:
+        url = args.url
+        if url is None:
+            server = stack.enter_context(
+                StubServer(latency=args.latency, failure_rate=args.failure_rate)
+            )
+            url = server.url
+
+        folder = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        attachment = folder / "anexo.bin"
+        attachment.write_bytes(b"\0" * args.attachment_size)
+
+        action = SOAPAction[args.action]
+        build = arguments(action, attachment, args.fields)
+        transport = Transport(
+            base_url=url, pool_maxsize=max(args.workers, 10), prewarm=True
+        )
+
+        count = max(1, int(args.rate * args.duration))
+        start = time.perf_counter() + 0.1
+        schedule = [start + i / args.rate for i in range(count)]
+
+        if args.mode == "async":
+            results = asyncio.run(
+                run_async(
+                    args.auth,
+                    transport,
+                    action.name,
+                    build,
+                    schedule,
+                    args.workers,
+                )
+            )
+        else:
+            with Sesuite(args.auth, transport=transport) as sesuite:
+                if args.mode == "sync":
+                    results = run_sync(sesuite, action.name, build, schedule)
+                else:
+                    results = run_threaded(
+                        sesuite, action.name, build, schedule, args.workers
+                    )
+
+        elapsed = time.perf_counter() - start
+
+    report = {"mode": args.mode, "action": action.name, "rate": args.rate}
+    report.update(results.report(elapsed))
+    print(json.dumps(report, indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
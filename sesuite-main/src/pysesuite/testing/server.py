@@ -0,0 +1,361 @@
+"""
+Servidor local que simula o Web Service do Sesuite.
+
+Implementa as ações SOAP dos componentes de Workflow e Formulário com
+respostas de sucesso e falha, latência e taxa de erros configuráveis e dados
+sintéticos para o ``getTableRecord``.
+
+Utilize::
+
+    python -m pysesuite.testing.server --port 8080 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import itertools
+import random
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from xml.sax.saxutils import escape
+
+from ..actions import SOAPAction
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Iterator
+
+    from typing_extensions import Self
+
+# Quantidade de bytes do início do corpo utilizados para ler os parâmetros,
+# o restante, como o conteúdo dos anexos, é descartado.
+_HEADER_SIZE = 64 * 1024
+_READ_SIZE = 1024 * 1024
+
+_ENVELOPE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"'
+    ' xmlns:ns1="urn:workflow" xmlns:ns2="urn:form">'
+    "<SOAP-ENV:Body><ns1:{action}Response>"
+    "<ns1:Status>{status}</ns1:Status>"
+    "<ns1:Code>{code}</ns1:Code>"
+    "<ns1:Detail>{detail}</ns1:Detail>"
+    "{extra}"
+    "</ns1:{action}Response></SOAP-ENV:Body></SOAP-ENV:Envelope>"
+)
+
+_RECORD_ACTIONS = {SOAPAction.new_workflow_edit_data, SOAPAction.new_attachment}
+
+
+@dataclass(slots=True)
+class StubServer:
+    """
+    Servidor local que simula o Web Service do Sesuite.
+
+    Attributes
+    ----------
+    host : str, by default "127.0.0.1"
+        Endereço do servidor.
+    port : int, by default 0
+        Porta do servidor, ``0`` escolhe uma porta livre.
+    latency : float, by default 0
+        Tempo, em segundos, que cada resposta demora.
+    jitter : float, by default 0
+        Variação aleatória, em segundos, somada à latência.
+    failure_rate : float, by default 0
+        Probabilidade de uma resposta ``FAILURE``.
+    http_error_rate : float, by default 0
+        Probabilidade de uma resposta HTTP 500.
+    table_rows : int, by default 1000
+        Quantidade de registros de cada tabela.
+    table_columns : int, by default 8
+        Quantidade de campos de cada tabela.
+    page_size : int, by default 100
+        Quantidade de registros de cada página do ``getTableRecord``.
+    seed : int, optional
+        Semente dos números aleatórios.
+    compression : bool, by default False
+        Se as respostas devem ser comprimidas com gzip, quando o cliente aceita
+        no cabeçalho ``Accept-Encoding``. As requisições comprimidas, com
+        ``Content-Encoding`` gzip ou deflate, são sempre aceitas.
+
+    Examples
+    --------
+    >>> with StubServer(latency=0.05) as server:
+    ...     transport = Transport(base_url=server.url)
+    ...     with Sesuite("token", transport=transport) as sesuite:
+    ...         sesuite.execute_activity(...)
+
+    """
+
+    host: str = "127.0.0.1"
+    port: int = 0
+    latency: float = 0
+    jitter: float = 0
+    failure_rate: float = 0
+    http_error_rate: float = 0
+    table_rows: int = 1000
+    table_columns: int = 8
+    page_size: int = 100
+    seed: int | None = None
+    compression: bool = False
+    _random: random.Random = field(init=False)
+    _records: itertools.count[int] = field(init=False)
+    _server: ThreadingHTTPServer | None = field(default=None, init=False)
+    _thread: threading.Thread | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)  # noqa: S311
+        self._records = itertools.count(1)
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        _type: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Endereço base do servidor, para ``Transport(base_url=...)``."""
+        if self._server is None:
+            return f"http://{self.host}:{self.port}"
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Inicia o servidor em uma thread."""
+        self._server = ThreadingHTTPServer(
+            (self.host, self.port), _handler(self)
+        )
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Inicia o servidor na thread atual."""
+        self._server = ThreadingHTTPServer(
+            (self.host, self.port), _handler(self)
+        )
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Para o servidor."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def respond(self, soap_action: str, body: bytes) -> tuple[int, bytes]:
+        """
+        Monta a resposta de uma chamada.
+
+        Parameters
+        ----------
+        soap_action : str
+            O cabeçalho ``SOAPAction`` da requisição, como
+            ``urn:wf#executeActivity``.
+        body : bytes
+            O início do corpo da requisição.
+
+        Returns
+        -------
+        tuple of int and bytes
+            O status HTTP e o corpo da resposta.
+
+        """
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+
+        try:
+            action = SOAPAction(soap_action.rpartition("#")[2].strip('"'))
+        except ValueError:
+            return 500, b"SOAPAction desconhecida"
+
+        if self._random.random() < self.http_error_rate:
+            return 500, b"Erro interno simulado"
+
+        if self._random.random() < self.failure_rate:
+            return 200, self._envelope(
+                action, "FAILURE", "Falha simulada pelo servidor de testes"
+            )
+
+        if action is SOAPAction.get_table_record:
+            return 200, self._table_record(body)
+
+        extra = ""
+        if action in _RECORD_ACTIONS:
+            extra = f"<ns1:RecordID>{next(self._records)}</ns1:RecordID>"
+
+        return 200, self._envelope(
+            action, "SUCCESS", "Ação executada com sucesso", extra
+        )
+
+    def _envelope(
+        self, action: SOAPAction, status: str, detail: str, extra: str = ""
+    ) -> bytes:
+        return _ENVELOPE.format(
+            action=action,
+            status=status,
+            code=1 if status == "SUCCESS" else 0,
+            detail=escape(detail),
+            extra=extra,
+        ).encode("utf-8")
+
+    def _table_record(self, body: bytes) -> bytes:
+        match = re.search(rb"<urn:Pagination>\s*(\d+)", body)
+        page = int(match.group(1)) if match else 1
+        first = (page - 1) * self.page_size
+        last = min(first + self.page_size, self.table_rows)
+
+        records = "".join(
+            "<ns2:Record><ns2:TableFieldList>"
+            + "".join(
+                "<ns2:TableField>"
+                f"<ns2:TableFieldID>campo{column}</ns2:TableFieldID>"
+                f"<ns2:TableFieldValues>valor {row}.{column}"
+                "</ns2:TableFieldValues></ns2:TableField>"
+                for column in range(self.table_columns)
+            )
+            + "</ns2:TableFieldList></ns2:Record>"
+            for row in range(first, last)
+        )
+
+        return self._envelope(
+            SOAPAction.get_table_record,
+            "SUCCESS",
+            f"{max(last - first, 0)} registros encontrados",
+            f"<ns2:RecordList>{records}</ns2:RecordList>",
+        )
+
+
+def _handler(server: StubServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Evita o atraso do algoritmo de Nagle nas respostas pequenas.
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            return
+
+        def do_HEAD(self) -> None:  # noqa: N802
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_POST(self) -> None:  # noqa: N802
+            status, content = server.respond(
+                self.headers.get("SOAPAction", ""), self._read_body()
+            )
+
+            self.send_response(status)
+            self.send_header("Content-Type", "text/xml; charset=utf-8")
+            if server.compression and self._accepts("gzip"):
+                content = gzip.compress(content)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def _accepts(self, encoding: str) -> bool:
+            accepted = self.headers.get("Accept-Encoding", "")
+            return encoding in {
+                value.split(";")[0].strip().lower()
+                for value in accepted.split(",")
+            }
+
+        def _read_body(self) -> bytes:
+            head = bytearray()
+            for chunk in self._decoded(self._chunks()):
+                if len(head) < _HEADER_SIZE:
+                    head += chunk[: _HEADER_SIZE - len(head)]
+
+            return bytes(head)
+
+        def _decoded(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+            encoding = self.headers.get("Content-Encoding", "").lower()
+            if encoding not in ("gzip", "deflate"):
+                yield from chunks
+                return
+
+            # Aceita os formatos gzip e zlib, detectados pelo cabeçalho.
+            decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+            for chunk in chunks:
+                yield decompressor.decompress(chunk)
+            yield decompressor.flush()
+
+        def _chunks(self) -> Iterator[bytes]:
+            encoding = self.headers.get("Transfer-Encoding", "")
+            if encoding.lower() != "chunked":
+                length = int(self.headers.get("Content-Length") or 0)
+                yield from self._read(length)
+                return
+
+            while size := int(self.rfile.readline().split(b";")[0], 16):
+                yield from self._read(size)
+                self.rfile.readline()
+            self.rfile.readline()
+
+        def _read(self, remaining: int) -> Iterator[bytes]:
+            while remaining > 0:
+                chunk = self.rfile.read(min(_READ_SIZE, remaining))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+                yield chunk
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--failure-rate", type=float, default=0)
+    parser.add_argument("--http-error-rate", type=float, default=0)
+    parser.add_argument("--table-rows", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--compression",
+        action="store_true",
+        help="comprime as respostas com gzip",
+    )
+    args = parser.parse_args()
+
+    server = StubServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        http_error_rate=args.http_error_rate,
+        table_rows=args.table_rows,
+        page_size=args.page_size,
+        seed=args.seed,
+        compression=args.compression,
+    )
+    print(f"Servidor de testes em {server.url}")  # noqa: T201
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
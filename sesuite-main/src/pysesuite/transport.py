@@ -0,0 +1,201 @@
+"""Configuração das conexões HTTP com o Web Service do Sesuite."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    import requests
+
+    from .components import Components
+    from .compression import CompressedBody
+    from .files import StreamingBody
+
+
+@dataclass(slots=True, frozen=True)
+class Transport:
+    """
+    Configuração das conexões HTTP com o Web Service do Sesuite.
+
+    Attributes
+    ----------
+    pool_connections : int, by default 10
+        Quantidade de hosts com conexões guardadas no pool.
+    pool_maxsize : int, by default 10
+        Quantidade máxima de conexões guardadas para cada host.
+    connect_timeout : float or None, by default 10
+        Tempo máximo, em segundos, para estabelecer a conexão.
+    read_timeout : float or None, by default 300
+        Tempo máximo, em segundos, esperando os dados da resposta.
+    verify : bool or str, by default False
+        Se o certificado TLS deve ser verificado, ou o caminho do certificado
+        da autoridade certificadora.
+    base_url : str, optional
+        Endereço base do Web Service, como ``https://host/apigateway/se/ws``.
+    urls : Mapping of Components and str, optional
+        A url completa de cada componente, tem prioridade sobre ``base_url``.
+    prewarm : bool, by default False
+        Se as conexões devem ser abertas antes da primeira chamada. Cada sessão
+        HTTP, uma para cada thread, abre uma conexão com cada componente, em
+        todos os destinos do balanceador, ao ser criada. As demais conexões do
+        pool são abertas conforme a necessidade.
+    compact : bool, by default False
+        Se os envelopes devem ser enviados sem quebras de linha e indentação,
+        com os campos de cada linha dos relacionamentos agrupados. Com
+        instrumentação, os bytes economizados são informados no contador
+        ``bytes_saved``.
+    compression : {"gzip", "deflate"}, optional
+        Compressão dos corpos de requisição, enviada no cabeçalho
+        ``Content-Encoding``. Por padrão, os corpos não são comprimidos.
+    compression_threshold : int, by default 1024
+        Tamanho mínimo, em bytes, dos corpos comprimidos. Os menores são
+        enviados sem compressão, já que a economia não compensa.
+    compression_level : int, by default 6
+        Nível de compressão, de 1, mais rápido, a 9, menor.
+    accept_encoding : str, by default "gzip, deflate"
+        As compressões aceitas nas respostas, enviadas no cabeçalho
+        ``Accept-Encoding``. Utilize ``"identity"`` para respostas sem
+        compressão.
+    stream : bool, by default False
+        Se as respostas devem ser analisadas aos poucos, enquanto são
+        recebidas, sem guardar o corpo inteiro em memória. Reduz a latência e a
+        memória das respostas grandes, como as do ``getTableRecord``. Não tem
+        efeito com o ``Offload``, que recebe o corpo inteiro.
+    stream_chunk_size : int, by default 65536
+        Quantidade de bytes lidos da resposta por vez, com ``stream``.
+
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    connect_timeout: float | None = 10
+    read_timeout: float | None = 300
+    verify: bool | str = False
+    base_url: str | None = None
+    urls: Mapping[Components, str] = field(default_factory=dict)
+    prewarm: bool = False
+    compact: bool = False
+    compression: str | None = None
+    compression_threshold: int = 1024
+    compression_level: int = 6
+    accept_encoding: str = "gzip, deflate"
+    stream: bool = False
+    stream_chunk_size: int = 64 * 1024
+
+    @property
+    def timeout(self) -> tuple[float | None, float | None]:
+        """Os tempos máximos de conexão e leitura."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def encode(
+        self, body: bytes | StreamingBody
+    ) -> tuple[bytes | StreamingBody | CompressedBody, dict[str, str]]:
+        """
+        Comprime o corpo da requisição, conforme a configuração.
+
+        Parameters
+        ----------
+        body : bytes or StreamingBody
+            O corpo original.
+
+        Returns
+        -------
+        tuple of body and dict of str and str
+            O corpo enviado e os cabeçalhos de compressão da requisição.
+
+        """
+        headers = {"Accept-Encoding": self.accept_encoding}
+        if self.compression is None or len(body) < self.compression_threshold:
+            return body, headers
+
+        from .compression import compress
+
+        headers["Content-Encoding"] = self.compression
+        return compress(body, self.compression, self.compression_level), headers
+
+    def url(self, component: Components) -> str:
+        """
+        Retorna a url do componente.
+
+        Parameters
+        ----------
+        component : Components
+            Componente do SeSuite que será utilizado.
+
+        Returns
+        -------
+        str
+            A url do componente.
+
+        """
+        if component in self.urls:
+            return self.urls[component]
+
+        if self.base_url:
+            return component.url_at(self.base_url)
+
+        return component.url
+
+    def session(self) -> requests.Session:
+        """
+        Cria uma nova sessão HTTP com as configurações do pool de conexões.
+
+        Returns
+        -------
+        requests.Session
+            A sessão HTTP.
+
+        """
+        # Importados apenas aqui para que ``import pysesuite`` seja rápido.
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        if not self.verify:
+            from urllib3 import disable_warnings
+            from urllib3.exceptions import InsecureRequestWarning
+
+            disable_warnings(InsecureRequestWarning)
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.verify = self.verify
+
+        return session
+
+    def warm(
+        self, session: requests.Session, urls: Iterable[str] | None = None
+    ) -> None:
+        """
+        Abre as conexões com todos os componentes.
+
+        Resolve o DNS e faz o handshake TLS antecipadamente, deixando as
+        conexões no pool da sessão para as próximas chamadas.
+
+        Parameters
+        ----------
+        session : requests.Session
+            A sessão HTTP.
+        urls : Iterable of str, optional
+            As urls acessadas. Por padrão, a url de cada componente.
+
+        """
+        import requests
+
+        from .components import Components
+
+        if urls is None:
+            urls = [self.url(component) for component in Components]
+
+        for url in urls:
+            try:
+                session.head(url, timeout=self.timeout)
+            except requests.RequestException:
+                continue
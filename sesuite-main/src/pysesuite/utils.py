@@ -1,10 +1,9 @@
+import tempfile
 from collections.abc import Generator
 from pathlib import Path
 
-import requests
-
 from .attributes import Entity, Relationship, TableField
-from .exceptions import FormError
+from .downloads import Downloader
 
 
 def entity(**fields: str) -> Generator[Entity]:
@@ -90,22 +89,13 @@ def download(auth: str, file_hash: str, file_name: str) -> None:
     --------
     Sesuite().get_table_record:
         Utilize esse método para obter o hash do arquivo.
+    Downloader:
+        Utilize para baixar vários arquivos reaproveitando as conexões, com
+        os arquivos guardados em cache. Aqui, o arquivo não é guardado.
 
     """
-    with requests.Session() as session:
-        session.headers = {"accept": "*/*", "Authorization": auth}
-        response = session.get(
-            f"https://sesuite.sicredi.com.br/apigateway/v1/file/{file_hash}"
-        )
-
-    if response.status_code != 200:
-        error = "ocorreu um erro com o retorno do arquivo"
-        raise FormError(error)
-
-    download_dir = Path.cwd() / "downloads"
-    download_dir.mkdir(exist_ok=True)
-
-    file_path = download_dir / file_name
-    file_path.touch(exist_ok=True)
-
-    file_path.write_bytes(response.content)
+    with (
+        tempfile.TemporaryDirectory() as cache_folder,
+        Downloader(auth, cache_folder=Path(cache_folder)) as downloader,
+    ):
+        downloader.download(file_hash, file_name)
@@ -0,0 +1,42 @@
+"""Servidores de testes compartilhados pelos testes."""
+
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+
+import pytest
+
+from pysesuite import Sesuite, Transport
+from pysesuite.testing import StubServer
+
+
+@dataclass(slots=True)
+class CountingServer(StubServer):
+    """Servidor de testes que conta as chamadas e falha as primeiras."""
+
+    failures: int = 0
+    calls: Counter[str] = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def respond(self, soap_action: str, body: bytes) -> tuple[int, bytes]:
+        with self._lock:
+            self.calls[soap_action.rpartition("#")[2].strip('"')] += 1
+            failed = self.failures > 0
+            self.failures -= failed
+
+        if failed:
+            return 500, b"Erro interno simulado"
+
+        return StubServer.respond(self, soap_action, body)
+
+
+@pytest.fixture
+def server():
+    with CountingServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def sesuite(server):
+    with Sesuite("token", transport=Transport(base_url=server.url)) as sesuite:
+        yield sesuite
@@ -0,0 +1,51 @@
+"""Envio dos anexos aos poucos, com o mesmo corpo do envio inteiro."""
+
+import os
+
+import pytest
+
+from pysesuite import Transport, operations
+from pysesuite.files import base_64
+from pysesuite.render import render
+from pysesuite.sesuite import Sesuite
+
+
+@pytest.fixture(params=[0, 1, 56, 57, 58, 57 * 16 * 1024 + 1, 3_000_001])
+def attachment(request, tmp_path):
+    path = tmp_path / "anexo.bin"
+    path.write_bytes(os.urandom(request.param))
+    return path
+
+
+def test_streamed_body_matches_whole_body(attachment):
+    body = operations.new_attachment(
+        "usuario",
+        workflow_id="WF01",
+        activity_id="ATV01",
+        file_path=attachment,
+    ).body
+    # O envelope montado com o arquivo inteiro em memória, como antes do envio
+    # aos poucos.
+    whole = render(
+        "actions/new_attachment.xml",
+        user_id="usuario",
+        workflow_id="WF01",
+        activity_id="ATV01",
+        file_path=attachment,
+        content=base_64(attachment),
+    ).encode("utf-8")
+
+    assert b"".join(body) == whole
+    assert len(body) == len(whole)
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_attachment_is_sent(server, attachment, compression):
+    transport = Transport(base_url=server.url, compression=compression)
+    with Sesuite("token", transport=transport) as sesuite:
+        record = sesuite.new_attachment(
+            workflow_id="WF01", activity_id="ATV01", file_path=attachment
+        )
+
+    assert record.record_id == "1"
+    assert server.calls["newAttachment"] == 1
@@ -0,0 +1,139 @@
+"""Afastamento dos destinos com falhas e chamadas fixadas em um token."""
+
+import pytest
+
+from pysesuite import Balancer, ResponseCache, Sesuite, Spool
+from pysesuite.attributes import TableField
+from pysesuite.exceptions import WorkflowError
+from pysesuite.testing import StubServer
+
+
+def _execute(sesuite):
+    return sesuite.execute_activity(
+        workflow_id="WF01", activity_id="ATV01", action_sequence=1
+    )
+
+
+def test_failing_target_is_ejected(server):
+    with StubServer(http_error_rate=1.0) as failing:
+        balancer = Balancer(
+            [failing.url, server.url], max_failures=2, ejection_time=60
+        )
+        errors = 0
+        with Sesuite("token", balancer=balancer) as sesuite:
+            for _ in range(10):
+                try:
+                    _execute(sesuite)
+                except WorkflowError:
+                    errors += 1
+
+    assert errors == 2
+    assert server.calls["executeActivity"] == 8
+    failed, healthy = balancer.stats()
+    assert failed.ejected
+    assert failed.failures == 2
+    assert not healthy.ejected
+    assert healthy.failures == 0
+
+
+def test_slow_target_is_ejected(server):
+    with StubServer(latency=0.1) as slow:
+        balancer = Balancer(
+            [slow.url, server.url], max_latency=0.05, ejection_time=60
+        )
+        with Sesuite("token", balancer=balancer) as sesuite:
+            for _ in range(6):
+                _execute(sesuite)
+
+    slow_stats, _ = balancer.stats()
+    assert slow_stats.ejected
+    assert slow_stats.requests == 1
+
+
+def test_ejected_targets_come_back(server):
+    server.failures = 1
+    balancer = Balancer([server.url], max_failures=1, ejection_time=0)
+    with Sesuite("token", balancer=balancer) as sesuite:
+        with pytest.raises(WorkflowError):
+            _execute(sesuite)
+        _execute(sesuite)
+
+    assert server.calls["executeActivity"] == 2
+
+
+def test_pin_sends_only_with_the_token(server):
+    balancer = Balancer([server.url], tokens=["a", "b", "c"])
+    with Sesuite("a", balancer=balancer) as sesuite:
+        with balancer.pin("b"):
+            for _ in range(4):
+                _execute(sesuite)
+        assert [stats.requests for stats in balancer.stats()] == [0, 4, 0]
+
+        for _ in range(3):
+            _execute(sesuite)
+
+    assert [stats.requests for stats in balancer.stats()] == [1, 5, 1]
+
+
+def test_pin_is_scoped_to_the_balancer(server):
+    first = Balancer([server.url], tokens=["a", "b"])
+    second = Balancer([server.url], tokens=["a", "c"])
+    with pytest.raises(ValueError), first.pin("c"):
+        pass
+
+    with first.pin("b"):
+        target = second.acquire()
+        second.release(target, 0.0, failed=False)
+        assert first.acquire().auth == "b"
+
+
+def test_pin_reaches_the_batch_threads(server):
+    balancer = Balancer([server.url], tokens=["a", "b"])
+    arguments = {"workflow_id": "WF01", "activity_id": "ATV01"}
+    with Sesuite("a", balancer=balancer) as sesuite, balancer.pin("b"):
+        results = sesuite.map(
+            "execute_activity",
+            [{**arguments, "action_sequence": 1}] * 6,
+        )
+        assert not any(isinstance(result, Exception) for result in results)
+        assert list(sesuite.iter_table_records("tabela", [], prefetch=2))
+
+    first, second = balancer.stats()
+    assert first.requests == 0
+    assert second.requests > 6
+
+
+def test_spool_rejects_pinned_calls(server, tmp_path):
+    balancer = Balancer([server.url], tokens=["a", "b"])
+    with (
+        Sesuite("a", balancer=balancer) as sesuite,
+        Spool(sesuite, tmp_path / "fila.db") as spool,
+        balancer.pin("b"),
+        pytest.raises(ValueError),
+    ):
+        spool.submit(
+            "execute_activity",
+            workflow_id="WF01",
+            activity_id="ATV01",
+            action_sequence=1,
+        )
+
+
+def test_cache_is_separated_by_pin(server):
+    balancer = Balancer([server.url], tokens=["a", "b"])
+    cache = ResponseCache()
+    with Sesuite("a", balancer=balancer, cache=cache) as sesuite:
+
+        def query():
+            return sesuite.get_table_record(
+                table_id="tabela", table_field_list=[TableField("campo", "1")]
+            )
+
+        first = query()
+        assert query() is first
+        with balancer.pin("b"):
+            pinned = query()
+            assert query() is pinned
+
+    assert pinned is not first
+    assert server.calls["getTableRecord"] == 2
@@ -0,0 +1,128 @@
+"""Validade e agrupamento das consultas guardadas no cache."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pysesuite import ResponseCache
+from pysesuite.exceptions import FormError
+
+
+class Query:
+    """Consulta ao Web Service simulada, que conta as chamadas."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self) -> object:
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return object()
+
+
+def test_cached_until_ttl():
+    cache = ResponseCache(ttl=0.2)
+    query = Query()
+
+    first = cache.get("a", "tabela", query)
+    assert cache.get("a", "tabela", query) is first
+    assert cache.get("b", "tabela", query) is not first
+    assert query.calls == 2
+
+    time.sleep(0.3)
+    assert cache.get("a", "tabela", query) is not first
+    assert query.calls == 3
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 3
+
+
+def test_table_ttl_and_invalidate():
+    cache = ResponseCache(ttl=60, table_ttl={"volatil": 0})
+    query = Query()
+
+    cache.get("a", "volatil", query)
+    cache.get("a", "volatil", query)
+    assert query.calls == 2
+
+    cache.get("b", "tabela", query)
+    cache.get("c", "outra", query)
+    cache.invalidate("tabela")
+    cache.get("b", "tabela", query)
+    cache.get("c", "outra", query)
+    assert query.calls == 5
+
+    cache.invalidate()
+    assert cache.stats.size == 0
+
+
+def test_invalidate_discards_queries_in_flight():
+    cache = ResponseCache()
+    slow = Query(delay=0.3)
+    with ThreadPoolExecutor(2) as executor:
+        stale = executor.submit(cache.get, "a", "tabela", slow)
+        time.sleep(0.1)
+        cache.invalidate("tabela")
+        fresh = executor.submit(cache.get, "a", "tabela", Query())
+
+        assert fresh.result() is not stale.result()
+
+    assert cache.get("a", "tabela", Query()) is fresh.result()
+    assert slow.calls == 1
+    assert cache.stats.coalesced == 0
+
+
+def test_least_recently_used_are_dropped():
+    cache = ResponseCache(maxsize=2)
+    query = Query()
+
+    for key in ["a", "b", "a", "c"]:
+        cache.get(key, "tabela", query)
+    cache.get("a", "tabela", query)
+    assert query.calls == 3
+
+    cache.get("b", "tabela", query)
+    assert query.calls == 4
+
+
+def test_concurrent_queries_are_coalesced():
+    cache = ResponseCache()
+    query = Query(delay=0.2)
+    with ThreadPoolExecutor(8) as executor:
+        results = list(
+            executor.map(lambda _: cache.get("a", "tabela", query), range(8))
+        )
+
+    assert query.calls == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats.misses == 1
+    assert cache.stats.hits + cache.stats.coalesced == 7
+
+
+def test_failures_are_not_cached():
+    cache = ResponseCache()
+
+    def failing() -> object:
+        error = "consulta falhou"
+        raise FormError(error)
+
+    with pytest.raises(FormError, match="consulta falhou"):
+        cache.get("a", "tabela", failing)
+
+    query = Query()
+    cache.get("a", "tabela", query)
+    assert query.calls == 1
+    assert cache.stats.size == 1
+
+
+def test_saved_between_runs(tmp_path):
+    path = tmp_path / "cache.pickle"
+    cache = ResponseCache(path=path)
+    cache.get("a", "tabela", lambda: "resposta")
+    cache.save()
+
+    assert ResponseCache(path=path).get("a", "tabela", Query()) == "resposta"
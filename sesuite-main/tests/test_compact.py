@@ -0,0 +1,87 @@
+"""Equivalência entre os envelopes compactos e indentados."""
+
+from xml.etree import ElementTree as ET
+
+from pysesuite import operations
+from pysesuite.attributes import Entity, RelationshipTable
+
+URN = "{urn:workflow}"
+
+
+def _relationships(body: bytes) -> list[tuple[str, list[tuple[str, str]]]]:
+    root = ET.fromstring(body)
+    return [
+        (
+            relationship.findtext(f"{URN}RelationshipID"),
+            [
+                (
+                    attribute.findtext(f"{URN}RelationshipAttributeID"),
+                    attribute.findtext(f"{URN}RelationshipAttributeValue"),
+                )
+                for attribute in relationship.iter(
+                    f"{URN}RelationshipAttribute"
+                )
+            ],
+        )
+        for relationship in root.iter(f"{URN}Relationship")
+    ]
+
+
+def _texts(body: bytes) -> list[tuple[str, str]]:
+    root = ET.fromstring(body)
+    return [
+        (element.tag, (element.text or "").strip()) for element in root.iter()
+    ]
+
+
+def _build(compact: bool) -> bytes:
+    grid = RelationshipTable.from_rows(
+        "itens", ["produto", "quantidade"], [["A", "1"], ["B", "2"]]
+    )
+    grid.append("cliente", "nome", "<Fulano & Cia>")
+    grid.append("itens", "produto", "C")
+
+    return operations.new_workflow_edit_data(
+        process_id="PROC",
+        workflow_title="Pedido",
+        entity_id="pedido",
+        entity_list=[Entity("numero", "10"), Entity("obs", "a\nb")],
+        relationship_list=grid,
+        compact=compact,
+    ).body
+
+
+def test_compact_has_the_same_values():
+    compact, indented = _build(compact=True), _build(compact=False)
+
+    flatten = [
+        (relationship_id, attribute)
+        for relationship_id, attributes in _relationships(compact)
+        for attribute in attributes
+    ]
+    assert flatten == [
+        (relationship_id, attribute)
+        for relationship_id, attributes in _relationships(indented)
+        for attribute in attributes
+    ]
+
+    def without_relationships(body: bytes) -> list[tuple[str, str]]:
+        return [
+            (tag, text)
+            for tag, text in _texts(body)
+            if not tag.startswith(f"{URN}Relationship")
+        ]
+
+    assert without_relationships(compact) == without_relationships(indented)
+
+
+def test_compact_groups_each_row():
+    assert _relationships(_build(compact=True)) == [
+        ("itens", [("produto", "A"), ("quantidade", "1")]),
+        ("itens", [("produto", "B"), ("quantidade", "2")]),
+        ("cliente", [("nome", "<Fulano & Cia>")]),
+        ("itens", [("produto", "C")]),
+    ]
+    for _, attributes in _relationships(_build(compact=True)):
+        ids = [field_id for field_id, _ in attributes]
+        assert len(ids) == len(set(ids))
@@ -0,0 +1,34 @@
+"""Erros de cada arquivo nos downloads em paralelo."""
+
+import socket
+
+import requests
+
+from pysesuite.downloads import Downloader
+from pysesuite.exceptions import FormError
+
+
+def _closed_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    return f"http://127.0.0.1:{port}/v1/file/"
+
+
+def test_errors_are_returned_per_file(tmp_path):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    (cache / "guardado").write_bytes(b"conteudo")
+    files = {"guardado": "a.txt", "ausente": "b.txt", "..": "c.txt"}
+
+    with Downloader(
+        "token", cache_folder=cache, files_url=_closed_url()
+    ) as downloader:
+        saved, failed, invalid = downloader.download_many(
+            files, tmp_path / "downloads"
+        )
+
+    assert saved.read_bytes() == b"conteudo"
+    assert isinstance(failed, requests.ConnectionError)
+    assert isinstance(invalid, FormError)
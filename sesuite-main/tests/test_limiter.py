@@ -0,0 +1,105 @@
+"""Ajuste do limite de chamadas simultâneas, pelo AIMD."""
+
+import threading
+
+from pysesuite import ConcurrencyLimiter, Sesuite, Transport
+from pysesuite.components import Components
+from pysesuite.exceptions import WorkflowError
+
+WF = Components.Workflow
+
+
+def _round(limiter, latency=0.1, *, failed=False):
+    """Ocupa todas as vagas e devolve as mesmas."""
+    slots = limiter.limit(WF)
+    for _ in range(slots):
+        limiter.acquire(WF)
+    for _ in range(slots):
+        limiter.release(WF, latency, failed=failed)
+
+
+def test_additive_increase():
+    limiter = ConcurrencyLimiter(initial_limit=4, max_limit=6)
+    for _ in range(3):
+        _round(limiter)
+    assert limiter.limit(WF) == 5
+
+    for _ in range(10):
+        _round(limiter)
+    assert limiter.limit(WF) == 6
+
+
+def test_idle_limit_does_not_grow():
+    limiter = ConcurrencyLimiter(initial_limit=4)
+    for _ in range(20):
+        limiter.acquire(WF)
+        limiter.release(WF, 0.1, failed=False)
+
+    assert limiter.limit(WF) == 4
+
+
+def test_multiplicative_decrease():
+    limiter = ConcurrencyLimiter(initial_limit=10, min_limit=2, backoff=0.5)
+    limiter.acquire(WF)
+    limiter.release(WF, 0.1, failed=True)
+    assert limiter.limit(WF) == 5
+
+    for _ in range(5):
+        limiter.acquire(WF)
+        limiter.release(WF, 0.0, failed=True)
+    assert limiter.limit(WF) == 2
+
+
+def test_decreases_once_per_latency():
+    limiter = ConcurrencyLimiter(initial_limit=10, backoff=0.5)
+    limiter.acquire(WF)
+    limiter.release(WF, 0.0, failed=True)
+    limiter.acquire(WF)
+    limiter.release(WF, 60.0, failed=False)
+
+    for _ in range(3):
+        limiter.acquire(WF)
+        limiter.release(WF, 0.0, failed=True)
+
+    assert limiter.limit(WF) == 5
+
+
+def test_slow_calls_decrease():
+    limiter = ConcurrencyLimiter(initial_limit=10, backoff=0.5, tolerance=2)
+    limiter.acquire(WF)
+    limiter.release(WF, 0.001, failed=False)
+    limiter.acquire(WF)
+    limiter.release(WF, 0.01, failed=False)
+
+    assert limiter.limit(WF) == 5
+
+
+def test_acquire_waits_for_a_slot():
+    limiter = ConcurrencyLimiter(initial_limit=1)
+    limiter.acquire(WF)
+    acquired = threading.Event()
+    thread = threading.Thread(
+        target=lambda: (limiter.acquire(WF), acquired.set())
+    )
+    thread.start()
+
+    assert not acquired.wait(0.1)
+    limiter.release(WF, 0.1, failed=False)
+    assert acquired.wait(5)
+    thread.join()
+
+
+def test_server_errors_decrease_the_limit(server):
+    server.failures = 3
+    limiter = ConcurrencyLimiter(initial_limit=10, backoff=0.5)
+    transport = Transport(base_url=server.url)
+    with Sesuite("token", transport=transport, limiter=limiter) as sesuite:
+        for _ in range(3):
+            try:
+                sesuite.execute_activity(
+                    workflow_id="WF01", activity_id="ATV01", action_sequence=1
+                )
+            except WorkflowError:
+                pass
+
+    assert limiter.limits() == {WF: 1}
@@ -0,0 +1,128 @@
+"""Análise das respostas e agrupamento dos registros das tabelas."""
+
+import pytest
+
+from pysesuite import Sesuite, Transport, parsing
+from pysesuite.components import Components
+from pysesuite.exceptions import WorkflowError
+from pysesuite.parsing import Response
+
+ENVELOPE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    "<SOAP-ENV:Envelope"
+    ' xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"'
+    ' xmlns:ns1="urn:workflow">'
+    "<SOAP-ENV:Body><ns1:newAttachmentResponse>"
+    "<ns1:Status>{status}</ns1:Status>"
+    "<ns1:Detail>{detail}</ns1:Detail>"
+    "<ns1:RecordID>7</ns1:RecordID>"
+    "</ns1:newAttachmentResponse></SOAP-ENV:Body></SOAP-ENV:Envelope>"
+)
+
+
+TABLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:ns1="urn:workflow" xmlns:ns2="urn:form">
+<SOAP-ENV:Body><ns2:getTableRecordResponse>
+<ns2:Status>SUCCESS</ns2:Status>
+<ns2:TableFieldID>fora</ns2:TableFieldID>
+<ns2:TableFieldValues>ignorado</ns2:TableFieldValues>
+<ns2:RecordList>
+<ns2:Record><ns2:TableFieldList>
+<ns2:TableField><ns2:TableFieldID>Nome</ns2:TableFieldID>
+<ns2:TableFieldValues>A</ns2:TableFieldValues></ns2:TableField>
+<ns2:TableField><ns2:TableFieldID>idade</ns2:TableFieldID>
+<ns2:TableFieldValues>1</ns2:TableFieldValues></ns2:TableField>
+</ns2:TableFieldList></ns2:Record>
+<ns2:Record><ns2:TableFieldList>
+<ns2:TableField><ns2:TableFieldID>cidade</ns2:TableFieldID>
+<ns2:TableFieldValues>X</ns2:TableFieldValues></ns2:TableField>
+</ns2:TableFieldList></ns2:Record>
+<ns2:Record><ns2:TableFieldList/></ns2:Record>
+<ns2:Record><ns2:TableFieldList>
+<ns2:TableField><ns2:TableFieldID>nome</ns2:TableFieldID>
+<ns2:TableFieldValues>C</ns2:TableFieldValues></ns2:TableField>
+<ns2:TableField><ns2:TableFieldID>idade</ns2:TableFieldID>
+<ns2:TableFieldValues/></ns2:TableField>
+</ns2:TableFieldList></ns2:Record>
+</ns2:RecordList>
+<ns2:TableFieldID>depois</ns2:TableFieldID>
+<ns2:TableFieldValues>ignorado</ns2:TableFieldValues>
+</ns2:getTableRecordResponse></SOAP-ENV:Body></SOAP-ENV:Envelope>
+"""
+
+ROWS = [
+    {"nome": "A", "idade": "1", "cidade": None},
+    {"nome": None, "idade": None, "cidade": "X"},
+    {"nome": None, "idade": None, "cidade": None},
+    {"nome": "C", "idade": None, "cidade": None},
+]
+
+
+@pytest.fixture(params=["stdlib", "lxml"])
+def backend(request):
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    parsing.configure(backend=request.param)
+    yield request.param
+    parsing.configure(backend="stdlib")
+
+
+def _chunks(data: bytes, size: int) -> list[bytes]:
+    return [data[start : start + size] for start in range(0, len(data), size)]
+
+
+def _rows(response: Response) -> list[dict]:
+    table = response.find_table(
+        Components.Form, "TableFieldID", "TableFieldValues"
+    )
+    return list(table.rows())
+
+
+def test_status_detail_and_record_id(backend):
+    response = Response(
+        ENVELOPE.format(status="SUCCESS", detail="Concluído").encode()
+    )
+
+    assert response.status == "SUCCESS"
+    assert response.detail == "Concluído"
+    assert response.record_id == "7"
+    assert response.find_many(Components.Workflow, "RecordID") == ["7"]
+    response.raise_for_status(WorkflowError)
+
+
+def test_failure_raises(backend):
+    response = Response(
+        ENVELOPE.format(status="FAILURE", detail="Falhou").encode()
+    )
+
+    with pytest.raises(WorkflowError, match="Falhou"):
+        response.raise_for_status(WorkflowError)
+
+
+def test_table_rows_are_grouped_by_record(backend):
+    assert _rows(Response(TABLE)) == ROWS
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_streaming_matches_whole_body(backend, size):
+    streamed = Response.from_chunks(_chunks(TABLE, size))
+
+    assert _rows(streamed) == ROWS
+    assert streamed.find_one(Components.Form, "Status") == "SUCCESS"
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_table_record_from_server(server, stream):
+    server.table_rows = 250
+    transport = Transport(base_url=server.url, stream=stream)
+    with Sesuite("token", transport=transport) as sesuite:
+        record = sesuite.get_table_record(
+            table_id="tabela", table_field_list=[], pagination=3
+        )
+
+    assert len(record.records) == 50
+    assert record.records.columns == tuple(
+        f"campo{column}" for column in range(server.table_columns)
+    )
+    assert next(record.records.rows())["campo2"] == "valor 200.2"
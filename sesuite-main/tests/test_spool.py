@@ -0,0 +1,71 @@
+"""Repetição das chamadas da fila e mensagens mortas."""
+
+import pytest
+
+from pysesuite import Spool
+
+
+def _submit(spool, workflow_id="WF01"):
+    return spool.submit(
+        "execute_activity",
+        workflow_id=workflow_id,
+        activity_id="ATV01",
+        action_sequence=1,
+    )
+
+
+def test_failed_calls_are_retried(server, sesuite, tmp_path):
+    server.failures = 2
+    with Spool(sesuite, tmp_path / "fila.db", workers=1, backoff=0.01) as spool:
+        _submit(spool)
+        assert spool.flush(timeout=10)
+        assert spool.dead_letters() == []
+
+    assert server.calls["executeActivity"] == 3
+
+
+def test_dead_letters_and_retry(server, sesuite, tmp_path):
+    server.failures = 2
+    with Spool(
+        sesuite, tmp_path / "fila.db", max_attempts=2, backoff=0.01
+    ) as spool:
+        id = _submit(spool)
+        assert spool.flush(timeout=10)
+
+        (dead,) = spool.dead_letters()
+        assert dead.id == id
+        assert dead.method == "execute_activity"
+        assert dead.arguments["workflow_id"] == "WF01"
+        assert dead.attempts == 2
+        assert dead.error.startswith("WorkflowError")
+
+        assert spool.retry() == 1
+        assert spool.flush(timeout=10)
+        assert spool.dead_letters() == []
+
+    assert server.calls["executeActivity"] == 3
+
+
+def test_pending_calls_survive_restart(server, sesuite, tmp_path):
+    path = tmp_path / "fila.db"
+    spool = Spool(sesuite, path)
+    for index in range(3):
+        _submit(spool, f"WF{index}")
+    assert spool.pending() == 3
+    with pytest.raises(RuntimeError):
+        spool.flush()
+    spool.close()
+
+    assert server.calls["executeActivity"] == 0
+    with Spool(sesuite, path) as spool:
+        assert spool.flush(timeout=10)
+
+    assert server.calls["executeActivity"] == 3
+
+
+def test_rejects_unknown_methods(sesuite, tmp_path):
+    with (
+        Spool(sesuite, tmp_path / "fila.db") as spool,
+        pytest.raises(ValueError),
+    ):
+        spool.submit("new_workflow_edit_data", workflow_id="WF01")